@@ -0,0 +1,330 @@
+"""
+Runs the solvers of one or more days and prints their answers:
+
+    python aoc.py run 6                       # Both parts of day 6
+    python aoc.py run 16 --part 2             # Only day 16 part 2
+    python aoc.py run 1 2 3 --example         # On the example inputs
+    python aoc.py run 18 --input drops.txt    # On another input, - for stdin
+    python aoc.py run 16 --part 2 --repeat 5 --json
+    python aoc.py run 16 --part 2 --set engine=search --set num_agents=3
+
+Unlike the scripts of the days themselves, this works from any directory, and
+there's no need to edit a script to run it on another input.
+
+`--set` passes keyword arguments on to the `solve()` functions of the
+solvers, for the ones that have options, like the engine to use. Values are
+read as Python literals, like 3 or False, and passed as a string otherwise.
+With `--example` the options that the example needs, like the smaller area
+that day 15 looks at, are passed on as well (see examples.py).
+
+With `--repeat` every solver is run that many times, and the fastest and median
+time are printed to stderr, so that stdout only holds the answers. With
+`--json` the answers and timings are printed to stdout instead, as one JSON
+object per solver per line, for other scripts to pick up.
+
+For most days, starting up the interpreter and importing modules takes longer
+than solving the puzzle. This script therefore imports as little as it can: the
+solvers of the selected days, and only what those solvers need themselves.
+Everything else (the runner, the result cache, the generators, ...) is left
+alone, unless the solvers are measured.
+
+The solvers can also be bundled, together with this script and with their
+bytecode compiled ahead of time, into a single file (see build_zipapp.py):
+
+    python build_zipapp.py
+    ../aoc.pyz run 6
+
+tests/test_startup.py keeps an eye on how long the imports of a run take, as
+measured by `python -X importtime`.
+"""
+
+import argparse
+import os
+import sys
+
+
+# Not taken from puzzle_input.py, because importing pathlib takes longer than
+# solving some of the days
+PUZZLE_INPUT_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "puzzle-input"
+)
+
+DAYS = range(1, 26)
+PARTS = (1, 2)
+
+
+def module_name_for(day: int, part: int) -> str:
+    return f"day{day}" if part == 1 else f"day{day}-part2"
+
+
+def import_solver(day: int, part: int):
+    """Returns the module of a solver, or None if the day has no solution for
+    that part.
+    """
+    module_name = module_name_for(day, part)
+
+    try:
+        # Unlike importlib.import_module(), this shows up in the output of
+        # `python -X importtime`, and doesn't need importlib to be imported
+        return __import__(module_name)
+    except ModuleNotFoundError as error:
+        if error.name != module_name:
+            raise
+
+        return None
+
+
+def input_for(day: int, part: int, example: bool) -> tuple[str, dict]:
+    """Returns the path of the input for a solver, and the options it needs to
+    solve it. Only some of the examples need options, see examples.py.
+    """
+    if not example:
+        return os.path.join(PUZZLE_INPUT_DIR, f"day{day}-input.txt"), {}
+
+    # Only needed for the examples
+    from examples import example_for
+
+    example = example_for(module_name_for(day, part))
+    if example is None:
+        return os.path.join(PUZZLE_INPUT_DIR, f"day{day}-example-input.txt"), {}
+
+    return os.path.join(PUZZLE_INPUT_DIR, example.input_file), example.solve_kwargs
+
+
+def read_input(path: str) -> str:
+    if path == "-":
+        return sys.stdin.read()
+
+    with open(path) as input_file:
+        return input_file.read()
+
+
+def solve_mapped(solver, path: str, solve_kwargs: dict):
+    """Solves the input in a file without reading it into memory, for the
+    solvers that take their input line by line (see puzzle_input.py).
+    """
+    # Only needed for those solvers, and slow to import
+    from puzzle_input import PuzzleInput
+
+    with PuzzleInput(path) as puzzle_input:
+        return solver.solve_lines(puzzle_input, **solve_kwargs)
+
+
+def parse_solve_kwarg(argument: str) -> tuple[str, object]:
+    # Only needed when there are options to parse, and slow to import
+    import ast
+
+    name, separator, value = argument.partition("=")
+    if not separator:
+        raise argparse.ArgumentTypeError("expected NAME=VALUE, got %s" % argument)
+
+    try:
+        return name, ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return name, value
+
+
+def solve_options(solver) -> tuple[str, ...]:
+    """Returns the names of the keyword arguments that the solver's `solve()`
+    takes, besides the input.
+    """
+    code = solver.solve.__code__
+
+    return code.co_varnames[1 : code.co_argcount + code.co_kwonlyargcount]
+
+
+def print_answer(day: int, part: int, answer, labelled: bool):
+    if labelled:
+        # Answers that are drawn on a screen (day 10 part 2) start on a new line
+        separator = "\n" if "\n" in str(answer) else " "
+        print(f"Day {day} part {part}:", end=separator)
+
+    print(answer, flush=True)
+
+
+def run(parser: argparse.ArgumentParser, args: argparse.Namespace):
+    for day in args.days:
+        if day not in DAYS:
+            parser.error("there is no day %d" % day)
+
+    if args.input is not None and len(args.days) > 1:
+        parser.error("--input can only be used with a single day")
+
+    if args.repeat < 1:
+        parser.error("--repeat should be at least 1")
+
+    solvers = []
+    for day in args.days:
+        for part in PARTS if args.part is None else [args.part]:
+            solver = import_solver(day, part)
+
+            if solver is not None:
+                solvers.append((day, part, solver))
+            elif args.part is not None:
+                parser.error("day %d has no solution for part %d" % (day, part))
+
+    # Per day and part, as the parts can have different examples
+    input_paths = {}
+    solve_kwargs = {}
+    # Per path, so that an input that both parts use (or stdin) is read once
+    input_texts = {}
+    # The days and parts that get their input memory-mapped. Files given with
+    # --input can be much larger than the puzzle inputs, so the solvers that
+    # can take them line by line don't read them into memory.
+    mapped_inputs = set()
+    for day, part, solver in solvers:
+        input_path, example_kwargs = input_for(day, part, args.example)
+        if args.input is not None:
+            input_path = args.input
+
+        for name in dict(args.set):
+            if name not in solve_options(solver):
+                parser.error("day %d part %d has no option %s" % (day, part, name))
+
+        input_paths[day, part] = input_path
+        # The options on the command line go before the ones of the example
+        solve_kwargs[day, part] = {**example_kwargs, **dict(args.set)}
+
+        if args.input not in (None, "-") and hasattr(solver, "solve_lines"):
+            if not os.path.isfile(input_path):
+                parser.error("can't find the input of day %d, %s" % (day, input_path))
+
+            mapped_inputs.add((day, part))
+            continue
+
+        if input_path in input_texts:
+            continue
+
+        try:
+            input_texts[input_path] = read_input(input_path)
+        except FileNotFoundError:
+            parser.error("can't find the input of day %d, %s" % (day, input_path))
+
+    measured = args.repeat > 1 or args.memory or args.json
+    if measured:
+        # Only needed for measuring the solvers, and slow to import
+        import json
+        import statistics
+
+        from runner import Solver, run_solver
+
+    for day, part, solver in solvers:
+        mapped = (day, part) in mapped_inputs
+
+        if not measured:
+            if mapped:
+                answer = solve_mapped(
+                    solver, input_paths[day, part], solve_kwargs[day, part]
+                )
+            else:
+                answer = solver.solve(
+                    input_texts[input_paths[day, part]], **solve_kwargs[day, part]
+                )
+            print_answer(day, part, answer, labelled=len(solvers) > 1)
+            continue
+
+        result = run_solver(
+            Solver(day, part, solver.__name__),
+            input_texts.get(input_paths[day, part]),
+            args.repeat,
+            args.memory,
+            solve_kwargs=solve_kwargs[day, part],
+            input_path=input_paths[day, part] if mapped else None,
+        )
+        min_timing = min(result.timings)
+        median_timing = statistics.median(result.timings)
+
+        if args.json:
+            measurement = {
+                "day": day,
+                "part": part,
+                "input": input_paths[day, part],
+                "options": solve_kwargs[day, part],
+                "answer": result.answer,
+                "timings": result.timings,
+                "min": min_timing,
+                "median": median_timing,
+                "peak_memory": result.peak_memory,
+            }
+            print(json.dumps(measurement), flush=True)
+            continue
+
+        print_answer(day, part, result.answer, labelled=len(solvers) > 1)
+
+        # On stderr, so that stdout only holds the answers
+        summary = "min %.4f s, median %.4f s of %d runs" % (
+            min_timing,
+            median_timing,
+            len(result.timings),
+        )
+        if result.peak_memory is not None:
+            summary += ", peak memory %.1f KiB" % (result.peak_memory / 1024)
+        print(f"Day {day} part {part}: {summary}", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="aoc", description="Runs the solvers of Advent of Code 2022."
+    )
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND", required=True)
+
+    run_parser = commands.add_parser(
+        "run", help="solves one or more days and prints the answers"
+    )
+    run_parser.add_argument("days", metavar="DAY", type=int, nargs="+")
+    run_parser.add_argument(
+        "-p",
+        "--part",
+        type=int,
+        choices=PARTS,
+        help="part to solve, defaults to both of them",
+    )
+    input_group = run_parser.add_mutually_exclusive_group()
+    input_group.add_argument(
+        "-e",
+        "--example",
+        action="store_true",
+        help="use the example input from the puzzle description",
+    )
+    input_group.add_argument(
+        "-i",
+        "--input",
+        metavar="FILE",
+        help="file to read the input from, or - for stdin",
+    )
+    run_parser.add_argument(
+        "-s",
+        "--set",
+        metavar="NAME=VALUE",
+        type=parse_solve_kwarg,
+        action="append",
+        default=[],
+        help="pass a keyword argument to the solvers, e.g. engine=search",
+    )
+    run_parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=1,
+        help="how many times to run each solver, and report the timings",
+    )
+    run_parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="also measure the peak memory usage, in an extra run",
+    )
+    run_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="print the answers and timings as JSON, one object per line",
+    )
+
+    args = parser.parse_args()
+
+    match args.command:
+        case "run":
+            run(run_parser, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+"""
+Runs the solvers on synthetic inputs of increasing size, to see how their
+running time and memory usage grow along with the input.
+
+The inputs come from the generators in the generators/ package, which always
+produce the same input for the same seed, so runs can be compared with each
+other. Every day has its own ladder of sizes; what a size means (lines, grid
+width, number of valves, ...) is described in the generator of that day.
+
+Run it from the python/ directory:
+
+    python benchmark.py                         # All days, default sizes
+    python benchmark.py 9 24                    # Only days 9 and 24
+    python benchmark.py 1 --sizes 1000 1000000  # Day 1, custom sizes
+    python benchmark.py --output results.json   # Also save the measurements
+
+Once a solver needs more than `--budget` seconds for one size, it's not run on
+the larger sizes anymore.
+
+Besides the time and peak memory, the report shows the growth of the running
+time between two consecutive sizes as an exponent: 1 means the time grows
+linearly with the size, 2 quadratically, etc.
+"""
+
+import argparse
+import importlib
+import json
+import math
+import os
+import tempfile
+from collections import namedtuple
+
+from generators import DEFAULT_SEED, generate, size_ladder
+from runner import DAYS, PARTS, find_solvers, run_solver
+
+
+Measurement = namedtuple(
+    "Measurement", ["day", "part", "size", "input_size", "time", "peak_memory"]
+)
+
+
+def benchmark_day(
+    day: int,
+    sizes: list[int],
+    seed: int,
+    repeat: int,
+    measure_memory: bool,
+    budget: float,
+) -> list[Measurement]:
+    solvers = find_solvers([day])
+    measurements = []
+
+    # Solvers that take their input line by line get it memory-mapped from a
+    # file, the way large inputs are meant to be run (see puzzle_input.py)
+    mapped = any(
+        hasattr(importlib.import_module(solver.module_name), "solve_lines")
+        for solver in solvers
+    )
+
+    with tempfile.TemporaryDirectory() as input_dir:
+        for size in sizes:
+            if not solvers:
+                break
+
+            input_text = generate(day, size, seed)
+
+            input_path = None
+            if mapped:
+                input_path = os.path.join(input_dir, f"day{day}-{size}.txt")
+                with open(input_path, "w") as input_file:
+                    input_file.write(input_text)
+
+            for solver in list(solvers):
+                result = run_solver(
+                    solver, input_text, repeat, measure_memory, input_path=input_path
+                )
+                measurement = Measurement(
+                    day,
+                    solver.part,
+                    size,
+                    len(input_text),
+                    min(result.timings),
+                    result.peak_memory,
+                )
+                measurements.append(measurement)
+                print_measurement(measurement)
+
+                if measurement.time > budget:
+                    solvers.remove(solver)
+
+            # Only one size is kept on disk at a time
+            if input_path is not None:
+                os.remove(input_path)
+
+    return measurements
+
+
+def growth_exponent(smaller: Measurement, larger: Measurement) -> float | None:
+    """Estimates the exponent k for which the running time grows like size^k,
+    from the measurements of two sizes.
+    """
+    if smaller.time <= 0 or larger.time <= 0 or smaller.size == larger.size:
+        return None
+
+    return math.log(larger.time / smaller.time) / math.log(larger.size / smaller.size)
+
+
+def print_measurement(measurement: Measurement):
+    peak_memory = "-"
+    if measurement.peak_memory is not None:
+        peak_memory = "%.1f KiB" % (measurement.peak_memory / 1024)
+
+    print(
+        "Day %d part %d, size %d (%.1f KiB): %.4f s, %s"
+        % (
+            measurement.day,
+            measurement.part,
+            measurement.size,
+            measurement.input_size / 1024,
+            measurement.time,
+            peak_memory,
+        ),
+        flush=True,
+    )
+
+
+def print_report(measurements: list[Measurement]):
+    header = (
+        "Day",
+        "Part",
+        "Size",
+        "Input (KiB)",
+        "Min (s)",
+        "Peak memory (KiB)",
+        "Growth",
+    )
+    rows = []
+
+    for day in DAYS:
+        for part in PARTS:
+            previous = None
+
+            for measurement in measurements:
+                if measurement.day != day or measurement.part != part:
+                    continue
+
+                growth = "-"
+                if previous is not None:
+                    exponent = growth_exponent(previous, measurement)
+                    if exponent is not None:
+                        growth = "%.2f" % exponent
+
+                peak_memory = "-"
+                if measurement.peak_memory is not None:
+                    peak_memory = "%.1f" % (measurement.peak_memory / 1024)
+
+                rows.append(
+                    (
+                        str(day),
+                        str(part),
+                        str(measurement.size),
+                        "%.1f" % (measurement.input_size / 1024),
+                        "%.4f" % measurement.time,
+                        peak_memory,
+                        growth,
+                    )
+                )
+                previous = measurement
+
+    column_widths = [
+        max(len(row[column]) for row in [header] + rows)
+        for column in range(len(header))
+    ]
+    for row in [header] + rows:
+        line = "  ".join(value.ljust(width) for value, width in zip(row, column_widths))
+        print(line.rstrip())
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Runs the solvers on synthetic inputs of increasing size."
+    )
+    parser.add_argument(
+        "days",
+        metavar="DAY",
+        type=int,
+        nargs="*",
+        help="day(s) to benchmark, defaults to all of them",
+    )
+    parser.add_argument(
+        "--sizes",
+        metavar="SIZE",
+        type=int,
+        nargs="+",
+        help="input sizes to use instead of the default ones of each day",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=DEFAULT_SEED,
+        help="seed for generating the inputs (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=1,
+        help="how many times to run each solver per size (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=60,
+        help=(
+            "skip the larger sizes once a solver takes longer than this many"
+            " seconds (default: %(default)s)"
+        ),
+    )
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="skip the extra run that measures peak memory usage",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        metavar="FILE",
+        help="also write the measurements to this file, as JSON",
+    )
+    args = parser.parse_args()
+
+    if args.repeat < 1:
+        parser.error("--repeat should be at least 1")
+
+    for day in args.days:
+        if day not in DAYS:
+            parser.error("there is no day %d" % day)
+
+    measurements = []
+    for day in args.days or DAYS:
+        sizes = sorted(args.sizes or size_ladder(day))
+        measurements.extend(
+            benchmark_day(
+                day, sizes, args.seed, args.repeat, not args.no_memory, args.budget
+            )
+        )
+
+    print()
+    print_report(measurements)
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(
+                [measurement._asdict() for measurement in measurements],
+                output_file,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Bundles the solvers and aoc.py into a single file that Python can run, a
+zipapp, with their bytecode compiled ahead of time:
+
+    python build_zipapp.py            # Creates ../aoc.pyz
+    python ../aoc.pyz run 6
+
+Python can't write the bytecode of modules that it imports from a zip file, so
+without it every run would compile the solver all over again. The bytecode is
+stored without a timestamp or hash of the source (an "unchecked" .pyc), so
+that it's used as-is, whatever the timestamps in the archive are. The sources
+are included as well, for the tracebacks.
+
+The archive looks for the puzzle inputs in the puzzle-input/ directory next to
+it, so it should stay at the top of the repository (or be put next to another
+puzzle-input/ directory).
+"""
+
+import argparse
+import compileall
+import py_compile
+import shutil
+import tempfile
+import zipapp
+from pathlib import Path
+
+
+PYTHON_DIR = Path(__file__).resolve().parent
+
+# Everything that aoc.py might import, including what it uses to measure the
+# solvers
+MODULES = [
+    "aoc.py",
+    "examples.py",
+    "instrument.py",
+    "puzzle_input.py",
+    "result_cache.py",
+    "runner.py",
+]
+
+
+def bundled_files() -> list[Path]:
+    return sorted(PYTHON_DIR.glob("day*.py")) + [PYTHON_DIR / name for name in MODULES]
+
+
+def build(target: Path):
+    with tempfile.TemporaryDirectory() as build_dir:
+        for path in bundled_files():
+            shutil.copy(path, build_dir)
+
+        # zipimport only looks for bytecode next to the source, not in
+        # __pycache__/, hence the "legacy" layout
+        compiled = compileall.compile_dir(
+            build_dir,
+            quiet=1,
+            legacy=True,
+            invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+        )
+        if not compiled:
+            raise Exception("Couldn't compile all of the modules")
+
+        zipapp.create_archive(
+            build_dir,
+            target,
+            interpreter="/usr/bin/env python3",
+            main="aoc:main",
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Bundles the solvers into a zipapp, with precompiled bytecode."
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        metavar="FILE",
+        type=Path,
+        default=PYTHON_DIR.parent / "aoc.pyz",
+        help="where to write the archive (default: ../aoc.pyz)",
+    )
+    args = parser.parse_args()
+
+    build(args.output)
+    print(f"Created {args.output}")
+
+
+if __name__ == "__main__":
+    main()
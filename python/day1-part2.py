@@ -83,21 +83,37 @@ Find the top three Elves carrying the most Calories. How many Calories are
 those Elves carrying in total?
 """
 
-# lines = open('../puzzle-input/day1-example-input.txt').readlines()
-lines = open("../puzzle-input/day1-input.txt").readlines()
+from heapq import nlargest
+from collections.abc import Iterable, Iterator
 
-elves = []
-sum_calories = 0
-for line in lines:
-    if line.strip() == "":
-        elves.append(sum_calories)
-        sum_calories = 0
-        continue
 
-    sum_calories += int(line)
+def solve(input_text: str) -> int:
+    return solve_lines(input_text.encode().splitlines())
 
-if sum_calories:
-    elves.append(sum_calories)
 
-elves.sort(reverse=True)
-print(elves[0] + elves[1] + elves[2])
+def calories_per_elf(lines: Iterable[bytes]) -> Iterator[int]:
+    sum_calories = 0
+    for line in lines:
+        if line.strip() == b"":
+            yield sum_calories
+            sum_calories = 0
+            continue
+
+        sum_calories += int(line)
+
+    if sum_calories:
+        yield sum_calories
+
+
+def solve_lines(lines: Iterable[bytes]) -> int:
+    # Only keeps track of the top three, instead of sorting all of the elves
+    return sum(nlargest(3, calories_per_elf(lines)))
+
+
+if __name__ == "__main__":
+    from puzzle_input import PuzzleInput
+
+    # puzzle_input = PuzzleInput("../puzzle-input/day1-example-input.txt")
+    puzzle_input = PuzzleInput("../puzzle-input/day1-input.txt")
+
+    print(solve_lines(puzzle_input))
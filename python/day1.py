@@ -64,20 +64,35 @@ Find the Elf carrying the most Calories. How many total Calories is that Elf
 carrying?
 """
 
-# lines = open('../puzzle-input/day1-example-input.txt').readlines()
-lines = open("../puzzle-input/day1-input.txt").readlines()
+from collections.abc import Iterable, Iterator
 
-elves = []
-sum_calories = 0
-for line in lines:
-    if line.strip() == "":
-        elves.append(sum_calories)
-        sum_calories = 0
-        continue
 
-    sum_calories += int(line)
+def solve(input_text: str) -> int:
+    return solve_lines(input_text.encode().splitlines())
 
-if sum_calories:
-    elves.append(sum_calories)
 
-print(sorted(elves, reverse=True)[0])
+def calories_per_elf(lines: Iterable[bytes]) -> Iterator[int]:
+    sum_calories = 0
+    for line in lines:
+        if line.strip() == b"":
+            yield sum_calories
+            sum_calories = 0
+            continue
+
+        sum_calories += int(line)
+
+    if sum_calories:
+        yield sum_calories
+
+
+def solve_lines(lines: Iterable[bytes]) -> int:
+    return max(calories_per_elf(lines))
+
+
+if __name__ == "__main__":
+    from puzzle_input import PuzzleInput
+
+    # puzzle_input = PuzzleInput("../puzzle-input/day1-example-input.txt")
+    puzzle_input = PuzzleInput("../puzzle-input/day1-input.txt")
+
+    print(solve_lines(puzzle_input))
@@ -362,46 +362,66 @@ Render the image given by your program. What eight capital letters appear on
 your CRT?
 """
 
+from collections.abc import Iterable
+
 
 CRT_WIDTH_PX = 40
 
-# raw_instructions = open('../puzzle-input/day10-example-input.txt').readlines()
-raw_instructions = open("../puzzle-input/day10-input.txt").readlines()
 
-cycles = 0
-register_x = 1
+def solve(input_text: str) -> str:
+    return solve_lines(input_text.encode().splitlines())
+
+
+def solve_lines(raw_instructions: Iterable[bytes]) -> str:
+    """Returns the image drawn on the CRT, one line of text per row of
+    pixels.
+    """
+    cycles = 0
+    register_x = 1
+    screen = []
+
+    for raw_instruction in raw_instructions:
+        # List of instructions to execute. Each instruction in this list takes
+        # up 1 cycle.
+        instructions = []
+
+        match raw_instruction.split():
+            case [b"noop"]:
+                instructions.append(None)
+
+            case [b"addx", value]:
+                # The ADDX instruction takes two cycles to complete
+                instructions.append(None)
+                instructions.append(("x", int(value)))
+
+            case _:
+                raise Exception("Unknown instruction encountered")
+
+        for instruction in instructions:
+            # CRT pixel drawing
+            crt_column = cycles % CRT_WIDTH_PX
+            if register_x - 1 <= crt_column <= register_x + 1:
+                screen.append("#")
+            else:
+                screen.append(".")
 
-for raw_instruction in raw_instructions:
-    # List of instructions to execute. Each instruction in this list takes up 1
-    # cycle.
-    instructions = []
+            if crt_column == CRT_WIDTH_PX - 1:
+                # Newline
+                screen.append("\n")
 
-    match raw_instruction.split():
-        case ["noop"]:
-            instructions.append(None)
+            cycles += 1
 
-        case ["addx", value]:
-            # The ADDX instruction takes two cycles to complete
-            instructions.append(None)
-            instructions.append(("x", int(value)))
+            if instruction is not None:
+                assert instruction[0] == "x"
+                register_x += instruction[1]
 
-        case _:
-            raise Exception("Unknown instruction encountered")
+    return "".join(screen).rstrip("\n")
 
-    for instruction in instructions:
-        # CRT pixel drawing
-        crt_column = cycles % CRT_WIDTH_PX
-        if register_x - 1 <= crt_column <= register_x + 1:
-            print("#", end="")
-        else:
-            print(".", end="")
 
-        if crt_column == CRT_WIDTH_PX - 1:
-            # Print newline
-            print()
+if __name__ == "__main__":
+    from puzzle_input import PuzzleInput
 
-        cycles += 1
+    # puzzle_input = PuzzleInput("../puzzle-input/day10-example-input.txt")
+    puzzle_input = PuzzleInput("../puzzle-input/day10-input.txt")
 
-        if instruction is not None:
-            assert instruction[0] == "x"
-            register_x += instruction[1]
+    print(solve_lines(puzzle_input))
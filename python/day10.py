@@ -219,37 +219,51 @@ Find the signal strength during the 20th, 60th, 100th, 140th, 180th, and 220th
 cycles. What is the sum of these six signal strengths?
 """
 
-# raw_instructions = open("../puzzle-input/day10-example-input.txt").readlines()
-raw_instructions = open("../puzzle-input/day10-input.txt").readlines()
+from collections.abc import Iterable
 
-cycles = 0
-register_x = 1
-total_signal_strength = 0
 
-for raw_instruction in raw_instructions:
-    # List of instructions to execute. Each instruction in this list takes up 1
-    # cycle.
-    instructions = []
+def solve(input_text: str) -> int:
+    return solve_lines(input_text.encode().splitlines())
 
-    match raw_instruction.split():
-        case ["noop"]:
-            instructions.append(None)
 
-        case ["addx", value]:
-            # The ADDX instruction takes two cycles to complete
-            instructions.append(None)
-            instructions.append(("x", int(value)))
+def solve_lines(raw_instructions: Iterable[bytes]) -> int:
+    cycles = 0
+    register_x = 1
+    total_signal_strength = 0
 
-        case _:
-            raise Exception("Unknown instruction encountered")
+    for raw_instruction in raw_instructions:
+        # List of instructions to execute. Each instruction in this list takes
+        # up 1 cycle.
+        instructions = []
 
-    for instruction in instructions:
-        cycles += 1
-        if cycles in [20, 60, 100, 140, 180, 220]:
-            total_signal_strength += register_x * cycles
+        match raw_instruction.split():
+            case [b"noop"]:
+                instructions.append(None)
 
-        if instruction is not None:
-            assert instruction[0] == "x"
-            register_x += instruction[1]
+            case [b"addx", value]:
+                # The ADDX instruction takes two cycles to complete
+                instructions.append(None)
+                instructions.append(("x", int(value)))
 
-print(total_signal_strength)
+            case _:
+                raise Exception("Unknown instruction encountered")
+
+        for instruction in instructions:
+            cycles += 1
+            if cycles in [20, 60, 100, 140, 180, 220]:
+                total_signal_strength += register_x * cycles
+
+            if instruction is not None:
+                assert instruction[0] == "x"
+                register_x += instruction[1]
+
+    return total_signal_strength
+
+
+if __name__ == "__main__":
+    from puzzle_input import PuzzleInput
+
+    # puzzle_input = PuzzleInput("../puzzle-input/day10-example-input.txt")
+    puzzle_input = PuzzleInput("../puzzle-input/day10-input.txt")
+
+    print(solve_lines(puzzle_input))
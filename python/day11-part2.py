@@ -345,6 +345,8 @@ business after 10000 rounds?
 
 import math
 
+import instrument
+
 
 NUM_ROUNDS = 10_000
 
@@ -397,6 +399,7 @@ class Monkey:
         self.items = list(map(lambda wl: wl % scale, self.items))
 
 
+@instrument.phase("parse")
 def parse_puzzle_input(lines: list[str]) -> list[Monkey]:
     monkeys = []
 
@@ -426,25 +429,37 @@ def parse_puzzle_input(lines: list[str]) -> list[Monkey]:
     return monkeys
 
 
-# puzzle_input = open("../puzzle-input/day11-example-input.txt").readlines()
-puzzle_input = open("../puzzle-input/day11-input.txt").readlines()
-monkeys = parse_puzzle_input(puzzle_input)
+def solve(input_text: str) -> int:
+    monkeys = parse_puzzle_input(input_text.splitlines(keepends=True))
+
+    # To keep the worry levels from spiraling out of control we can adjust them
+    # by taking their modulo of the Least Common Multiple (LCM) value of all
+    # 'test values' to keep the number small, without affecting the
+    # divisibility of the worry levels by the test values.
+    #
+    # Because all the test values are primes, their Least Common Multiple (LCM)
+    # is their product
+    test_value_least_common_multiple = math.prod([m.test_value for m in monkeys])
+
+    with instrument.phase("simulate"):
+        for r in range(NUM_ROUNDS):
+            instrument.count("rounds")
+            for monkey in monkeys:
+                monkey.normalize_worry_levels(test_value_least_common_multiple)
+
+                for item_worry_level, to_monkey_id in monkey.distribute_items():
+                    monkeys[to_monkey_id].catch_item(item_worry_level)
+
+    instrument.count("items inspected", sum(m.inspection_counter for m in monkeys))
 
-# To keep the worry levels from spiraling out of control we can adjust them by
-# taking their modulo of the Least Common Multiple (LCM) value of all 'test
-# values' to keep the number small, without affecting the divisibility of the
-# worry levels by the test values.
-#
-# Because all the test values are primes, their Least Common Multiple (LCM) is
-# their product
-test_value_least_common_multiple = math.prod([m.test_value for m in monkeys])
+    top_inspection_counts = sorted(
+        [m.inspection_counter for m in monkeys], reverse=True
+    )
+    return top_inspection_counts[0] * top_inspection_counts[1]
 
-for r in range(NUM_ROUNDS):
-    for monkey in monkeys:
-        monkey.normalize_worry_levels(test_value_least_common_multiple)
 
-        for item_worry_level, to_monkey_id in monkey.distribute_items():
-            monkeys[to_monkey_id].catch_item(item_worry_level)
+if __name__ == "__main__":
+    # input_text = open("../puzzle-input/day11-example-input.txt").read()
+    input_text = open("../puzzle-input/day11-input.txt").read()
 
-top_inspection_counts = sorted([m.inspection_counter for m in monkeys], reverse=True)
-print(top_inspection_counts[0] * top_inspection_counts[1])
+    print(solve(input_text))
@@ -323,15 +323,22 @@ def parse_puzzle_input(lines: list[str]) -> list[Monkey]:
     return monkeys
 
 
-# puzzle_input = open("../puzzle-input/day11-example-input.txt").readlines()
-puzzle_input = open("../puzzle-input/day11-input.txt").readlines()
+def solve(input_text: str) -> int:
+    monkeys = parse_puzzle_input(input_text.splitlines(keepends=True))
 
-monkeys = parse_puzzle_input(puzzle_input)
+    for _ in range(NUM_ROUNDS):
+        for monkey in monkeys:
+            for item_worry_level, to_monkey_id in monkey.distribute_items():
+                monkeys[to_monkey_id].catch_item(item_worry_level)
 
-for _ in range(NUM_ROUNDS):
-    for monkey in monkeys:
-        for item_worry_level, to_monkey_id in monkey.distribute_items():
-            monkeys[to_monkey_id].catch_item(item_worry_level)
+    top_inspection_counts = sorted(
+        [m.inspection_counter for m in monkeys], reverse=True
+    )
+    return top_inspection_counts[0] * top_inspection_counts[1]
 
-top_inspection_counts = sorted([m.inspection_counter for m in monkeys], reverse=True)
-print(top_inspection_counts[0] * top_inspection_counts[1])
+
+if __name__ == "__main__":
+    # input_text = open("../puzzle-input/day11-example-input.txt").read()
+    input_text = open("../puzzle-input/day11-input.txt").read()
+
+    print(solve(input_text))
@@ -87,7 +87,9 @@ elevation a to the location that should get the best signal?
 
 from collections import namedtuple
 from heapq import heappush, heappop
-from typing import Iterable
+from collections.abc import Iterable
+
+import instrument
 
 
 Coordinate = namedtuple("Coordinate", ["x", "y"])
@@ -136,6 +138,7 @@ class Map:
         return True
 
 
+@instrument.phase("search")
 def search_path(map: Map) -> Iterable[Coordinate]:
     queue = []
     heappush(queue, (0, map.start_position))
@@ -148,6 +151,7 @@ def search_path(map: Map) -> Iterable[Coordinate]:
 
     while queue:
         _, current = heappop(queue)
+        instrument.count("squares expanded")
         current_height = map.height_at(current)
 
         if current == map.end_position:
@@ -166,6 +170,7 @@ def search_path(map: Map) -> Iterable[Coordinate]:
 
                 priority = new_cost + manhattan_distance(next_square, map.end_position)
                 heappush(queue, (priority, next_square))
+                instrument.maximum("queue size", len(queue))
                 came_from[next_square] = current
 
     if map.end_position not in came_from:
@@ -183,6 +188,7 @@ def manhattan_distance(from_: Coordinate, to_: Coordinate) -> int:
     return abs(from_[0] - to_[0]) + abs(from_[1] - to_[1])
 
 
+@instrument.phase("parse")
 def parse_map(lines: list[str]) -> Map:
     squares = []
     map_width = len(lines[0].strip())
@@ -210,27 +216,32 @@ def parse_map(lines: list[str]) -> Map:
     return Map(squares, map_width, map_height, start_position, end_position)
 
 
-# puzzle_input = open("../puzzle-input/day12-example-input.txt").readlines()
-puzzle_input = open("../puzzle-input/day12-input.txt").readlines()
+def solve(input_text: str) -> int:
+    map = parse_map(input_text.splitlines(keepends=True))
+    route_lengths = []
+
+    for x in range(map.width):
+        for y in range(map.height):
+            coordinate = Coordinate(x, y)
+            if map.height_at(coordinate) > 0:
+                continue
+
+            map.start_position = coordinate
+            try:
+                route = search_path(map)
+            except Exception:
+                # The end position cannot be reached from all starting
+                # positions. Just continue with the next starting point if
+                # that's the case with this one.
+                continue
+            else:
+                route_lengths.append(len(list(route)) - 1)
 
-map = parse_map(puzzle_input)
-route_lengths = []
+    return sorted(route_lengths)[0]
 
-for x in range(map.width):
-    for y in range(map.height):
-        coordinate = Coordinate(x, y)
-        if map.height_at(coordinate) > 0:
-            continue
 
-        map.start_position = coordinate
-        try:
-            route = search_path(map)
-        except Exception:
-            # The end position cannot be reached from all starting positions
-            # Just continue with the next starting point if that's the case
-            # with this one.
-            continue
-        else:
-            route_lengths.append(len(list(route)) - 1)
+if __name__ == "__main__":
+    # input_text = open("../puzzle-input/day12-example-input.txt").read()
+    input_text = open("../puzzle-input/day12-input.txt").read()
 
-print(sorted(route_lengths)[0])
+    print(solve(input_text))
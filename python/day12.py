@@ -54,6 +54,8 @@ location that should get the best signal?
 from collections import namedtuple
 from heapq import heappush, heappop
 
+import instrument
+
 
 Coordinate = namedtuple("Coordinate", ["x", "y"])
 
@@ -101,6 +103,7 @@ class Map:
         return True
 
 
+@instrument.phase("search")
 def search_path(map: Map) -> list[Coordinate]:
     queue = []
     heappush(queue, (0, map.start_position))
@@ -113,6 +116,7 @@ def search_path(map: Map) -> list[Coordinate]:
 
     while queue:
         _, current = heappop(queue)
+        instrument.count("squares expanded")
         current_height = map.height_at(current)
 
         if current == map.end_position:
@@ -131,6 +135,7 @@ def search_path(map: Map) -> list[Coordinate]:
 
                 priority = new_cost + manhattan_distance(next_square, map.end_position)
                 heappush(queue, (priority, next_square))
+                instrument.maximum("queue size", len(queue))
                 came_from[next_square] = current
 
     if map.end_position not in came_from:
@@ -149,6 +154,7 @@ def manhattan_distance(from_: Coordinate, to_: Coordinate) -> int:
     return abs(from_[0] - to_[0]) + abs(from_[1] - to_[1])
 
 
+@instrument.phase("parse")
 def parse_map(lines: list[str]) -> Map:
     squares = []
     map_width = len(lines[0].strip())
@@ -176,9 +182,14 @@ def parse_map(lines: list[str]) -> Map:
     return Map(squares, map_width, map_height, start_position, end_position)
 
 
-# puzzle_input = open("../puzzle-input/day12-example-input.txt").readlines()
-puzzle_input = open("../puzzle-input/day12-input.txt").readlines()
+def solve(input_text: str) -> int:
+    map = parse_map(input_text.splitlines(keepends=True))
+
+    return len(search_path(map)) - 1
+
 
-map = parse_map(puzzle_input)
+if __name__ == "__main__":
+    # input_text = open("../puzzle-input/day12-example-input.txt").read()
+    input_text = open("../puzzle-input/day12-input.txt").read()
 
-print(len(search_path(map)) - 1)
+    print(solve(input_text))
@@ -224,17 +224,27 @@ def packet_cmp(left, right) -> int:
     return 0
 
 
-# puzzle_input = open("../puzzle-input/day13-example-input.txt").readlines()
-puzzle_input = open("../puzzle-input/day13-input.txt").readlines()
+def solve(input_text: str) -> int:
+    puzzle_input = input_text.splitlines(keepends=True)
 
-packets = list(
-    map(lambda l: eval(l), filter(lambda l: l, map(lambda l: l.strip(), puzzle_input)))
-)
+    packets = list(
+        map(
+            lambda l: eval(l),
+            filter(lambda l: l, map(lambda l: l.strip(), puzzle_input)),
+        )
+    )
 
-# Add 'divider packets'
-packets.append([[2]])
-packets.append([[6]])
+    # Add 'divider packets'
+    packets.append([[2]])
+    packets.append([[6]])
 
-packets.sort(key=cmp_to_key(packet_cmp))
+    packets.sort(key=cmp_to_key(packet_cmp))
 
-print((packets.index([[2]]) + 1) * (packets.index([[6]]) + 1))
+    return (packets.index([[2]]) + 1) * (packets.index([[6]]) + 1)
+
+
+if __name__ == "__main__":
+    # input_text = open("../puzzle-input/day13-example-input.txt").read()
+    input_text = open("../puzzle-input/day13-input.txt").read()
+
+    print(solve(input_text))
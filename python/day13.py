@@ -194,21 +194,29 @@ assert (
 )
 assert is_in_right_order([[[]]], [[]]) == Conclusion.NotInOrder
 
-# puzzle_input = open("../puzzle-input/day13-example-input.txt").readlines()
-puzzle_input = open("../puzzle-input/day13-input.txt").readlines()
 
-score = 0
-packet_num = 0
-for line_num in range(0, len(puzzle_input), 3):
-    assert "import" not in puzzle_input[line_num]
-    assert "import" not in puzzle_input[line_num + 1]
+def solve(input_text: str) -> int:
+    puzzle_input = input_text.splitlines(keepends=True)
 
-    packet_num += 1
+    score = 0
+    packet_num = 0
+    for line_num in range(0, len(puzzle_input), 3):
+        assert "import" not in puzzle_input[line_num]
+        assert "import" not in puzzle_input[line_num + 1]
 
-    left = eval(puzzle_input[line_num].strip())
-    right = eval(puzzle_input[line_num + 1].strip())
+        packet_num += 1
 
-    if is_in_right_order(left, right) == Conclusion.InOrder:
-        score += packet_num
+        left = eval(puzzle_input[line_num].strip())
+        right = eval(puzzle_input[line_num + 1].strip())
 
-print(score)
+        if is_in_right_order(left, right) == Conclusion.InOrder:
+            score += packet_num
+
+    return score
+
+
+if __name__ == "__main__":
+    # input_text = open("../puzzle-input/day13-example-input.txt").read()
+    input_text = open("../puzzle-input/day13-input.txt").read()
+
+    print(solve(input_text))
@@ -205,6 +205,8 @@ blocked. How many units of sand come to rest?
 from collections import namedtuple
 from enum import Enum
 
+import instrument
+
 
 class Tile(Enum):
     Air = 0
@@ -240,6 +242,7 @@ class Cave:
         return self.tiles.get(coordinate, Tile.Air)
 
 
+@instrument.phase("parse")
 def parse_cave_structure(lines: list[str]) -> Cave:
     rock_coordinates = set()
     min_x, max_x = 2**31, 500
@@ -283,41 +286,49 @@ def parse_cave_structure(lines: list[str]) -> Cave:
     return cave
 
 
-# puzzle_input = open("../puzzle-input/day14-example-input.txt").readlines()
-puzzle_input = open("../puzzle-input/day14-input.txt").readlines()
+def solve(input_text: str) -> int:
+    cave = parse_cave_structure(input_text.splitlines(keepends=True))
 
-cave = parse_cave_structure(puzzle_input)
+    source_position = Coordinate(500, 0)
+    next_position = Coordinate(source_position.x, source_position.y - 1)
+    num_sand_at_rest = 0
 
-source_position = Coordinate(500, 0)
-next_position = Coordinate(source_position.x, source_position.y - 1)
-num_sand_at_rest = 0
+    with instrument.phase("simulate"):
+        while True:
+            sand = next_position
+            next_position = Coordinate(sand.x, sand.y + 1)
 
-while True:
-    sand = next_position
-    next_position = Coordinate(sand.x, sand.y + 1)
+            if cave.tile_at(next_position) is Tile.Air:
+                continue
 
-    if cave.tile_at(next_position) is Tile.Air:
-        continue
+            # Try falling diagonally to the left
+            next_position = Coordinate(sand.x - 1, sand.y + 1)
+            if cave.tile_at(next_position) is Tile.Air:
+                continue
 
-    # Try falling diagonally to the left
-    next_position = Coordinate(sand.x - 1, sand.y + 1)
-    if cave.tile_at(next_position) is Tile.Air:
-        continue
+            # Try falling diagonally to the right
+            next_position = Coordinate(sand.x + 1, sand.y + 1)
+            if cave.tile_at(next_position) is Tile.Air:
+                continue
 
-    # Try falling diagonally to the right
-    next_position = Coordinate(sand.x + 1, sand.y + 1)
-    if cave.tile_at(next_position) is Tile.Air:
-        continue
+            # Sand can't go anywhere so put it at rest here
+            cave.set_tile(sand, Tile.Sand)
+            num_sand_at_rest += 1
+            next_position = Coordinate(source_position.x, source_position.y - 1)
+
+            # Sand can't go anywhere but is still at the source position,
+            # meaning the source of the sand is blocked and won't be depositing
+            # any more sand
+            if sand == source_position:
+                break
+
+    instrument.count("units of sand", num_sand_at_rest)
+
+    return num_sand_at_rest
 
-    # Sand can't go anywhere so put it at rest here
-    cave.set_tile(sand, Tile.Sand)
-    num_sand_at_rest += 1
-    next_position = Coordinate(source_position.x, source_position.y - 1)
 
-    # Sand can't go anywhere but is still at the source position, meaning
-    # the source of the sand is blocked and won't be depositing any more
-    # sand
-    if sand == source_position:
-        break
+if __name__ == "__main__":
+    # input_text = open("../puzzle-input/day14-example-input.txt").read()
+    input_text = open("../puzzle-input/day14-input.txt").read()
 
-print(num_sand_at_rest)
+    print(solve(input_text))
@@ -228,43 +228,48 @@ def parse_cave_structure(lines: list[str]) -> Cave:
     return cave
 
 
-# puzzle_input = open("../puzzle-input/day14-example-input.txt").readlines()
-puzzle_input = open("../puzzle-input/day14-input.txt").readlines()
-
-cave = parse_cave_structure(puzzle_input)
-
-source_position = Coordinate(500, 0)
-next_position = source_position
-num_sand_at_rest = 0
-
-while True:
-    if (
-        next_position.x < cave.horizontal_size[0]
-        or next_position.x > cave.horizontal_size[1]
-        or next_position.y > cave.vertical_size[1]
-    ):
-        # Into the void!
-        break
-
-    sand = next_position
-    next_position = Coordinate(sand.x, sand.y + 1)
-
-    if cave.tile_at(next_position) is Tile.Air:
-        continue
-
-    # Try falling diagonally to the left
-    next_position = Coordinate(sand.x - 1, sand.y + 1)
-    if cave.tile_at(next_position) is Tile.Air:
-        continue
-
-    # Try falling diagonally to the right
-    next_position = Coordinate(sand.x + 1, sand.y + 1)
-    if cave.tile_at(next_position) is Tile.Air:
-        continue
-
-    # Sand can't go anywhere so put it at rest here
-    cave.set_tile(sand, Tile.Sand)
-    num_sand_at_rest += 1
+def solve(input_text: str) -> int:
+    cave = parse_cave_structure(input_text.splitlines(keepends=True))
+
+    source_position = Coordinate(500, 0)
     next_position = source_position
+    num_sand_at_rest = 0
+
+    while True:
+        if (
+            next_position.x < cave.horizontal_size[0]
+            or next_position.x > cave.horizontal_size[1]
+            or next_position.y > cave.vertical_size[1]
+        ):
+            # Into the void!
+            break
+
+        sand = next_position
+        next_position = Coordinate(sand.x, sand.y + 1)
+
+        if cave.tile_at(next_position) is Tile.Air:
+            continue
+
+        # Try falling diagonally to the left
+        next_position = Coordinate(sand.x - 1, sand.y + 1)
+        if cave.tile_at(next_position) is Tile.Air:
+            continue
+
+        # Try falling diagonally to the right
+        next_position = Coordinate(sand.x + 1, sand.y + 1)
+        if cave.tile_at(next_position) is Tile.Air:
+            continue
+
+        # Sand can't go anywhere so put it at rest here
+        cave.set_tile(sand, Tile.Sand)
+        num_sand_at_rest += 1
+        next_position = source_position
+
+    return num_sand_at_rest
+
+
+if __name__ == "__main__":
+    # input_text = open("../puzzle-input/day14-example-input.txt").read()
+    input_text = open("../puzzle-input/day14-input.txt").read()
 
-print(num_sand_at_rest)
+    print(solve(input_text))
@@ -131,14 +131,20 @@ y=2000000, how many positions cannot contain a beacon?
 
 from collections import namedtuple
 
+import instrument
+
 
 Coordinate = namedtuple("Coordinate", ["x", "y"])
+# The positions of the sensors and the distances they cover, as parallel lists
+# of plain ints
+Sensors = namedtuple("Sensors", ["xs", "ys", "distances"])
 
 
 def manhattan_distance(from_: Coordinate, to_: Coordinate) -> int:
     return abs(from_.x - to_.x) + abs(from_.y - to_.y)
 
 
+@instrument.phase("parse")
 def parse_sensor_list(
     lines: list[str],
 ) -> tuple[list[tuple[Coordinate, int]], list[Coordinate]]:
@@ -206,20 +212,167 @@ def find_gap(
         max_x = max(max_x, interval.stop)
 
 
-# sensor_list = open("../puzzle-input/day15-example-input.txt").readlines()
-# coverage_range_limit = 20
+@instrument.phase("search")
+def find_tuning_frequency_with_ranges(
+    sensors: list[tuple[Coordinate, int]], coverage_range_limit: int
+) -> int:
+    min_y = 0
+    max_y = coverage_range_limit
+    coverage_range_y = range(min_y, max_y + 1)
+
+    for rows_checked, row_to_monitor in enumerate(coverage_range_y, start=1):
+        gap_x = find_gap(sensors, row_to_monitor, coverage_range_limit)
+        if gap_x is not None:
+            instrument.count("rows checked", rows_checked)
+            tuning_frequency = 4_000_000 * gap_x + row_to_monitor
+            return tuning_frequency
+
+    instrument.count("rows checked", len(coverage_range_y))
+    raise Exception("Did not find the distress beacon")
+
+
+def sensors_as_lists(sensors: list[tuple[Coordinate, int]]) -> Sensors:
+    return Sensors(
+        [sensor.x for sensor, _ in sensors],
+        [sensor.y for sensor, _ in sensors],
+        [distance for _, distance in sensors],
+    )
+
+
+def find_gap_in_intervals(
+    sensors: Sensors, row_y: int, coverage_range_limit: int
+) -> tuple[None | int, int]:
+    """Returns the first X coordinate of the row that isn't covered by any
+    sensor, if there is one, and otherwise how many rows from this one on are
+    covered as a whole, at least.
+
+    The intervals that cover the row from left to right keep doing so for as
+    long as the first one reaches the left edge of the search area, the last
+    one reaches the right edge, and every next one overlaps with or touches the
+    previous one. Each of those can be worked out from the sensors, so the rows
+    in between don't have to be looked at.
+    """
+    sensor_xs, sensor_ys, distances = sensors
+
+    intervals = []
+    for sensor, (sensor_x, sensor_y, distance) in enumerate(zip(*sensors)):
+        # What's left of the distance once the row has been reached
+        reach = distance - abs(sensor_y - row_y)
+        if reach >= 0:
+            intervals.append((sensor_x - reach, sensor_x + reach, sensor))
+
+    # We sort the intervals so we can then compare them in order from left to right
+    intervals.sort()
+
+    # The last row that is covered as a whole as well, as far as the intervals
+    # so far go
+    last_covered_y = coverage_range_limit
+    max_x = -1
+    max_x_sensor = None
+    for from_x, to_x, sensor in intervals:
+        if from_x > max_x + 1:
+            # A gap was detected
+            return max_x + 1, 0
+
+        # Only the intervals that extend the coverage to the right count
+        if to_x <= max_x:
+            continue
+
+        if max_x_sensor is None:
+            # The interval reaches x = 0 for as long as its row is at most
+            # `distance - sensor_x` away from the sensor
+            last_covered_y = min(
+                last_covered_y,
+                sensor_ys[sensor] + distances[sensor] - sensor_xs[sensor],
+            )
+        else:
+            # The intervals overlap or touch for as long as the distances of
+            # their rows to both sensors add up to at most the overlap they
+            # would have on the rows of the sensors themselves
+            overlap = (
+                sensor_xs[max_x_sensor]
+                + distances[max_x_sensor]
+                + 1
+                - sensor_xs[sensor]
+                + distances[sensor]
+            )
+            last_covered_y = min(
+                last_covered_y,
+                (overlap + sensor_ys[max_x_sensor] + sensor_ys[sensor]) // 2,
+            )
+
+        max_x = to_x
+        max_x_sensor = sensor
+        if max_x >= coverage_range_limit:
+            # Like the left edge
+            last_covered_y = min(
+                last_covered_y,
+                sensor_ys[sensor]
+                + distances[sensor]
+                + sensor_xs[sensor]
+                - coverage_range_limit,
+            )
+
+            return None, last_covered_y - row_y + 1
+
+    return max_x + 1, 0
+
+
+@instrument.phase("search")
+def find_tuning_frequency(
+    sensors: Sensors, coverage_range_limit: int, skip_rows: bool
+) -> int:
+    row_to_monitor = 0
+    rows_checked = 0
+    while row_to_monitor <= coverage_range_limit:
+        rows_checked += 1
+        gap_x, rows_covered = find_gap_in_intervals(
+            sensors, row_to_monitor, coverage_range_limit
+        )
+        if gap_x is not None:
+            instrument.count("rows checked", rows_checked)
+            tuning_frequency = 4_000_000 * gap_x + row_to_monitor
+            return tuning_frequency
+
+        row_to_monitor += rows_covered if skip_rows else 1
+
+    instrument.count("rows checked", rows_checked)
+    raise Exception("Did not find the distress beacon")
+
+
+def solve(
+    input_text: str,
+    coverage_range_limit: int = 4_000_000,
+    engine: str = "intervals",
+    skip_rows: bool = True,
+) -> int:
+    """The example input limits the search area to 20 instead of the default
+    4,000,000.
+
+    The engine is either "intervals", which merges the intervals that the
+    sensors cover as pairs of ints, or "ranges", which does so with a range
+    per sensor. With `skip_rows` the intervals engine skips over the rows that
+    are known to be covered as a whole.
+    """
+    sensors, beacons = parse_sensor_list(input_text.splitlines(keepends=True))
+
+    match engine:
+        case "intervals":
+            return find_tuning_frequency(
+                sensors_as_lists(sensors), coverage_range_limit, skip_rows
+            )
+
+        case "ranges":
+            return find_tuning_frequency_with_ranges(sensors, coverage_range_limit)
+
+        case _:
+            raise Exception("Unknown engine %s" % engine)
 
-sensor_list = open("../puzzle-input/day15-input.txt").readlines()
-coverage_range_limit = 4_000_000
 
-sensors, beacons = parse_sensor_list(sensor_list)
+if __name__ == "__main__":
+    # input_text = open("../puzzle-input/day15-example-input.txt").read()
+    # print(solve(input_text, coverage_range_limit=20))
 
-min_y = 0
-max_y = coverage_range_limit
-coverage_range_y = range(min_y, max_y + 1)
+    input_text = open("../puzzle-input/day15-input.txt").read()
 
-for row_to_monitor in coverage_range_y:
-    if (gap_x := find_gap(sensors, row_to_monitor, coverage_range_limit)) is not None:
-        tuning_frequency = 4_000_000 * gap_x + row_to_monitor
-        print(tuning_frequency)
-        break
+    print(solve(input_text))
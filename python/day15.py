@@ -131,6 +131,8 @@ y=2000000, how many positions cannot contain a beacon?
 
 from collections import namedtuple
 
+import instrument
+
 
 Coordinate = namedtuple("Coordinate", ["x", "y"])
 
@@ -139,6 +141,7 @@ def manhattan_distance(from_: Coordinate, to_: Coordinate) -> int:
     return abs(from_.x - to_.x) + abs(from_.y - to_.y)
 
 
+@instrument.phase("parse")
 def parse_sensor_list(
     lines: list[str],
 ) -> tuple[list[tuple[Coordinate, int]], list[Coordinate]]:
@@ -173,33 +176,43 @@ def parse_sensor_list(
     return sensors, beacons
 
 
-# sensor_list = open("../puzzle-input/day15-example-input.txt").readlines()
-# row_to_monitor = 10
+def solve(input_text: str, row_to_monitor: int = 2_000_000) -> int:
+    """The example input monitors row 10 instead of the default row
+    2,000,000.
+    """
+    sensors, beacons = parse_sensor_list(input_text.splitlines(keepends=True))
+    columns_without_beacon = set()
+    beacons_on_row = set()
+
+    # Keep track of the beacons that are present on the monitored row
+    for beacon in filter(lambda beacon: beacon.y == row_to_monitor, beacons):
+        beacons_on_row.add(beacon.x)
+
+    with instrument.phase("search"):
+        for sensor, distance in sensors:
+            # Can the coverage of this sensor reach the row we're interested
+            # in at all?
+            if not sensor.y - distance <= row_to_monitor <= sensor.y + distance:
+                continue
 
-sensor_list = open("../puzzle-input/day15-input.txt").readlines()
-row_to_monitor = 2_000_000
+            instrument.count("sensors in range")
+            # Taking the steps from the sensor's Y position needed to get to
+            # the monitored row into account, what X coordinates of that row
+            # are being covered by the sensor?
+            distance_needed = abs(sensor.y - row_to_monitor)
+            coverage_left = abs(distance - distance_needed)
 
-sensors, beacons = parse_sensor_list(sensor_list)
-columns_without_beacon = set()
-beacons_on_row = set()
+            for x in range(-coverage_left + sensor.x, coverage_left + sensor.x + 1):
+                if x not in beacons_on_row:
+                    columns_without_beacon.add(x)
 
-# Keep track of the beacons that are present on the monitored row
-for beacon in filter(lambda beacon: beacon.y == row_to_monitor, beacons):
-    beacons_on_row.add(beacon.x)
+    return len(columns_without_beacon)
 
-for sensor, distance in sensors:
-    # Can the coverage of this sensor reach the row we're interested in at all?
-    if not sensor.y - distance <= row_to_monitor <= sensor.y + distance:
-        continue
 
-    # Taking the steps from the sensor's Y position needed to get to the
-    # monitored row into account, what X coordinates of that row are being
-    # covered by the sensor?
-    distance_needed = abs(sensor.y - row_to_monitor)
-    coverage_left = abs(distance - distance_needed)
+if __name__ == "__main__":
+    # input_text = open("../puzzle-input/day15-example-input.txt").read()
+    # print(solve(input_text, row_to_monitor=10))
 
-    for x in range(-coverage_left + sensor.x, coverage_left + sensor.x + 1):
-        if x not in beacons_on_row:
-            columns_without_beacon.add(x)
+    input_text = open("../puzzle-input/day15-input.txt").read()
 
-print(len(columns_without_beacon))
+    print(solve(input_text))
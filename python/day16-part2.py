@@ -262,19 +262,28 @@ With you and an elephant working together for 26 minutes, what is the most
 pressure you could release?
 """
 
-from collections import defaultdict, namedtuple
-from copy import copy
+from collections import defaultdict, deque, namedtuple
+from collections.abc import Iterator
 from heapq import heappop, heappush
 
+import instrument
+
 
 MAX_VALUE = 2**31 - 1
 
 TIME_LIMIT = 26
 
+# The valve-set engine keeps a result for every set of valves, so 2^n of them.
+# The puzzle input has 15 valves with a positive flow rate.
+MAX_VALVE_SET_VALVES = 24
+
 Graph = dict[str, "Node"]
-Matrix = dict[str, dict[str, int]]
+# Only the valves that are worth a visit, see `compress_graph()`
+CompressedGraph = namedtuple("CompressedGraph", ["flow_rates", "distances"])
+# The valves are numbered (see `compress_graph()`), and the closed valves are
+# the set bits of an int
 State = namedtuple("State", ["agents", "closed_valves", "total_pressure_released"])
-Agent = namedtuple("Agent", ["current_node", "time_passed", "pressure_release_rate"])
+Agent = namedtuple("Agent", ["current_valve", "time_passed", "pressure_release_rate"])
 
 
 class Node:
@@ -287,6 +296,7 @@ class Node:
         return self.name
 
 
+@instrument.phase("parse")
 def parse_tunnel_layout(lines: list[str]) -> dict[str, Node]:
     # Format: [valve name]: flow rate
     graph = {}
@@ -303,51 +313,104 @@ def parse_tunnel_layout(lines: list[str]) -> dict[str, Node]:
     return graph
 
 
-def find_max_releasable_pressure(graph: Graph, num_agents: int) -> int:
-    distance_matrix = floyd_warshal(graph)
-
-    closed_valves = set([valve for valve in graph if graph[valve].flow_rate > 0])
+@instrument.phase("search")
+def find_max_releasable_pressure(
+    graph: CompressedGraph, num_agents: int, prune: bool = True
+) -> int:
+    """Moves the agents around together, always trying the most promising
+    state first. With `prune`, it also skips the states that can't release
+    more pressure than the best one so far, even in the most optimistic case
+    (see `upper_bound()`).
+    """
+    flow_rates, distances = graph
+    num_valves = len(flow_rates)
+    step_time = shortest_step_time(graph)
+
+    # The starting valve comes after the ones with a positive flow rate
     initial_state = State(
-        [Agent("AA", 0, 0) for _ in range(num_agents)], closed_valves, 0
+        [Agent(num_valves, 0, 0) for _ in range(num_agents)],
+        (1 << num_valves) - 1,
+        0,
     )
     queue = [(0, initial_state)]
 
     # Caches the best results (total pressure released + remaining release at
-    # the current rate) that was achieved with a combination of opened valves.
-    #
-    # If a possible next step of an agent isn't providing a higher value with
-    # the same combination of opened valves, it means it's lagging behind on a
-    # better option.
+    # the current rate) that were achieved with a combination of opened valves
+    # and the agents at the same valves at the same times.
     #
-    # We can be sure it's a worse option because all agents start from the same
-    # node and so it takes the same amount of time to open the same combination
-    # of valves. So if a lower amount of released pressure is calculated for
-    # the same set of opened valves, it means the agents opened them in a less
-    # efficient order.
+    # If a possible next step isn't providing a higher value for the same
+    # combination, it's lagging behind on a better option: from there on both
+    # can make exactly the same moves, which add the same amount of pressure.
+    # So if a lower amount of released pressure is calculated, the agents
+    # opened the same valves in a less efficient order.
     #
     # In such cases stop following that branch by not executing the next step at all.
     #
-    # This store is also used to determine the highest releasable pressure of all
-    # options, which is the answer to the puzzle.
+    # Only comparing the opened valves isn't enough, as agents that are
+    # somewhere else or have less time left can still do better from there.
     best_results = defaultdict(int)
+    highest_pressure_released = 0
 
     while queue:
         _, state = heappop(queue)
+        instrument.count("states expanded")
 
-        cache_key = frozenset(state.closed_valves)
-        best_results[cache_key] = max(
-            best_results[cache_key],
-            state.total_pressure_released + pressure_release_remaining(state.agents),
+        idle_pressure_released = (
+            state.total_pressure_released + pressure_release_remaining(state.agents)
         )
+        highest_pressure_released = max(
+            highest_pressure_released, idle_pressure_released
+        )
+
+        if prune:
+            best_case = idle_pressure_released + upper_bound(
+                flow_rates,
+                state.closed_valves,
+                [TIME_LIMIT - agent.time_passed for agent in state.agents],
+                step_time,
+            )
+            if best_case <= highest_pressure_released:
+                instrument.count("states pruned")
+                continue
 
         # Make the next move with the agent that has the most time left
-        current_agent = sorted(state.agents, key=lambda a: a.time_passed)[0]
+        current_agent = min(state.agents, key=lambda a: a.time_passed)
+        if current_agent.time_passed >= TIME_LIMIT:
+            # All agents are done
+            continue
+
+        other_agents = list(state.agents)
+        other_agents.remove(current_agent)
+
+        next_steps = []
+
+        # The agent can also stop opening valves and leave the rest of them to
+        # the other agents, which may be closer to them. Its valves keep
+        # releasing pressure until the time limit.
+        if any(agent.time_passed < TIME_LIMIT for agent in other_agents):
+            next_steps.append(
+                State(
+                    other_agents + [Agent(num_valves, TIME_LIMIT, 0)],
+                    state.closed_valves,
+                    state.total_pressure_released
+                    + current_agent.pressure_release_rate
+                    * (TIME_LIMIT - current_agent.time_passed),
+                )
+            )
+
+        # The distances from the agent's valve to all others
+        distances_offset = current_agent.current_valve * (num_valves + 1)
 
-        # For each unopened valve that offer some flow rate, simulate us going
-        # there and opening that valve. While we're underway to that
-        # destination valve the pressure released slowly ticks up.
-        for destination_node in state.closed_valves:
-            route_length = distance_matrix[current_agent.current_node][destination_node]
+        remaining_valves = state.closed_valves
+        while remaining_valves:
+            # For each unopened valve that offer some flow rate, simulate us going
+            # there and opening that valve. While we're underway to that
+            # destination valve the pressure released slowly ticks up.
+            valve_bit = remaining_valves & -remaining_valves
+            remaining_valves ^= valve_bit
+            destination_valve = valve_bit.bit_length() - 1
+
+            route_length = distances[distances_offset + destination_valve]
 
             # The time it takes us to get to the valve, plus 1 minute to open it
             next_time_passed = current_agent.time_passed + route_length + 1
@@ -357,51 +420,256 @@ def find_max_releasable_pressure(graph: Graph, num_agents: int) -> int:
                 continue
 
             # Open the valve
-            next_closed_valves = copy(state.closed_valves)
-            next_closed_valves.remove(destination_node)
-
             next_total_released = state.total_pressure_released + (
                 current_agent.pressure_release_rate * (route_length + 1)
             )
             next_release_rate = (
-                current_agent.pressure_release_rate + graph[destination_node].flow_rate
+                current_agent.pressure_release_rate + flow_rates[destination_valve]
             )
 
-            agents = [agent for agent in state.agents if agent is not current_agent]
-            agents.append(Agent(destination_node, next_time_passed, next_release_rate))
+            next_steps.append(
+                State(
+                    other_agents
+                    + [Agent(destination_valve, next_time_passed, next_release_rate)],
+                    state.closed_valves ^ valve_bit,
+                    next_total_released,
+                )
+            )
 
+        for next_step in next_steps:
             # Should this branch stop and not open any more valves, how much
             # pressure will there be released?
             minimum_pressure_released = (
-                next_total_released + pressure_release_remaining(agents)
+                next_step.total_pressure_released
+                + pressure_release_remaining(next_step.agents)
+            )
+            positions = tuple(
+                sorted(
+                    (agent.current_valve, agent.time_passed)
+                    for agent in next_step.agents
+                )
             )
-            if best_results[frozenset(next_closed_valves)] < minimum_pressure_released:
-                next_step = State(agents, next_closed_valves, next_total_released)
+            key = (next_step.closed_valves, positions)
+            if best_results[key] < minimum_pressure_released:
+                best_results[key] = minimum_pressure_released
 
                 heappush(queue, (MAX_VALUE - minimum_pressure_released, next_step))
+                instrument.maximum("queue size", len(queue))
+
+    return highest_pressure_released
+
+
+def shortest_step_time(graph: CompressedGraph) -> int:
+    """Returns the least time it takes to go from one valve to another and open
+    it.
+    """
+    num_valves = len(graph.flow_rates)
+
+    return 1 + min(
+        [
+            distance
+            for index, distance in enumerate(graph.distances)
+            # Skips the distances from the valves to themselves
+            if index % (num_valves + 2) != 0
+        ],
+        default=0,
+    )
+
+
+def upper_bound(
+    flow_rates: list[int], closed_valves: int, times_left: list[int], step_time: int
+) -> int:
+    """Returns how much more pressure opening the closed valves could release
+    at most, on top of what the open valves release. That would be when the
+    closed valves are all only `step_time` apart, and are opened from the
+    highest flow rate to the lowest, each by the agent that can open it the
+    soonest.
+    """
+    times_left = list(times_left)
+    pressure_released = 0
+
+    # The lowest numbers have the highest flow rates
+    while closed_valves:
+        agent = times_left.index(max(times_left))
+        if times_left[agent] <= step_time:
+            break
+
+        valve_bit = closed_valves & -closed_valves
+        closed_valves ^= valve_bit
+
+        times_left[agent] -= step_time
+        pressure_released += flow_rates[valve_bit.bit_length() - 1] * times_left[agent]
+
+    return pressure_released
+
+
+@instrument.phase("search")
+def find_max_releasable_pressure_per_valve_set(
+    graph: CompressedGraph, num_agents: int
+) -> int:
+    """Splits the valves between the agents instead of moving them around
+    together. Every agent opens its own set of valves, so the answer is the best
+    combination of disjoint sets of valves, given the most pressure that a
+    single agent can release with each set.
+    """
+    flow_rates, distances = graph
+    best_results = best_results_per_valve_set(flow_rates, distances)
+    all_valves = len(best_results) - 1
+
+    if num_agents == 1:
+        return best_results[all_valves]
+
+    # The best results of the agents before the last one, who gets the valves
+    # that are left. Adding an agent means trying every subset of every set of
+    # valves, which is 3^n work, so the last agent only does it for all of them.
+    best_results_so_far = best_results
+    for _ in range(num_agents - 2):
+        best_results_so_far = [
+            max(
+                best_results[valves] + best_results_so_far[valve_set ^ valves]
+                for valves in subsets(valve_set)
+            )
+            for valve_set in range(all_valves + 1)
+        ]
+
+    return max(
+        best_results[valves] + best_results_so_far[all_valves ^ valves]
+        for valves in range(all_valves + 1)
+    )
+
+
+def best_results_per_valve_set(
+    flow_rates: list[int], distances: list[int]
+) -> list[int]:
+    """Returns, for every set of valves (as the bits of the index), the most
+    pressure that a single agent can release within the time limit by opening
+    only valves from that set.
+    """
+    num_valves = len(flow_rates)
+    if num_valves > MAX_VALVE_SET_VALVES:
+        raise ValueError(
+            "Can't keep results for every set of %d valves, at most %d are supported"
+            % (num_valves, MAX_VALVE_SET_VALVES)
+        )
 
-    return max(best_results.values())
+    best_results = [0] * (1 << num_valves)
 
+    # Opening a valve adds all of the pressure it's going to release before the
+    # time limit right away, so a state doesn't need to know the release rate
+    stack = [(num_valves, 0, TIME_LIMIT, 0)]
+    while stack:
+        current_valve, opened_valves, time_left, total_pressure_released = stack.pop()
+        instrument.count("states expanded")
 
-def floyd_warshal(graph: Graph) -> Matrix:
-    matrix: Matrix = defaultdict(lambda: defaultdict(lambda: MAX_VALUE))
+        if total_pressure_released > best_results[opened_valves]:
+            best_results[opened_valves] = total_pressure_released
 
-    # Create adjacency matrix
-    for name, node in graph.items():
-        matrix[name][name] = 0
-        for edge in node.edges:
-            # Every edge in this graph has a length of 1
-            matrix[name][edge] = 1
+        distances_offset = current_valve * (num_valves + 1)
 
-    # Do the Floyd-Warshal
-    for k in graph:
-        for i in graph:
-            for j in graph:
-                through_k = matrix[i][k] + matrix[k][j]
-                if through_k < matrix[i][j]:
-                    matrix[i][j] = through_k
+        closed_valves = (len(best_results) - 1) ^ opened_valves
+        while closed_valves:
+            valve_bit = closed_valves & -closed_valves
+            closed_valves ^= valve_bit
+            destination_valve = valve_bit.bit_length() - 1
+
+            # The time it takes to get to the valve, plus 1 minute to open it
+            next_time_left = (
+                time_left - distances[distances_offset + destination_valve] - 1
+            )
+            if next_time_left <= 0:
+                continue
+
+            stack.append(
+                (
+                    destination_valve,
+                    opened_valves | valve_bit,
+                    next_time_left,
+                    total_pressure_released
+                    + flow_rates[destination_valve] * next_time_left,
+                )
+            )
+            instrument.maximum("queue size", len(stack))
+
+    # So far only the sets of valves that were opened exactly have a result.
+    # Carry the results over to their supersets, which can always do at least
+    # as well by leaving the extra valves closed.
+    for valve in range(num_valves):
+        valve_bit = 1 << valve
+
+        for valve_set in range(len(best_results)):
+            if valve_set & valve_bit:
+                best_results[valve_set] = max(
+                    best_results[valve_set], best_results[valve_set ^ valve_bit]
+                )
+
+    return best_results
+
+
+def subsets(valve_set: int) -> Iterator[int]:
+    """Yields every subset of a set of valves, including the empty one."""
+    valves = valve_set
+    while True:
+        yield valves
+
+        if valves == 0:
+            break
+
+        valves = (valves - 1) & valve_set
+
+
+def compressed_graph(input_text: str) -> CompressedGraph:
+    """Parses and compresses the tunnel layout. The result isn't kept between
+    solves, so that timing a solver repeatedly measures all of its work.
+    """
+    graph = parse_tunnel_layout(input_text.splitlines(keepends=True))
+
+    return compress_graph(graph)
 
-    return matrix
+
+@instrument.phase("precompute")
+def compress_graph(graph: Graph) -> CompressedGraph:
+    """Reduces the tunnels to the valves that are worth a visit: the ones that
+    have a positive flow rate, numbered from 0 to n - 1 (from the highest flow
+    rate to the lowest) so that any set of them fits in the bits of an int, and
+    the starting valve (AA) after them, at n.
+
+    The distances between them are kept as a flat list, in which the distance
+    from valve i to valve j is at i * (n + 1) + j.
+    """
+    valves = sorted(
+        [name for name, node in graph.items() if node.flow_rate > 0],
+        key=lambda name: graph[name].flow_rate,
+        reverse=True,
+    )
+    flow_rates = [graph[valve].flow_rate for valve in valves]
+    valves.append("AA")
+
+    distances = []
+    for from_valve in valves:
+        distances_from_valve = find_distances(graph, from_valve)
+        distances.extend(
+            distances_from_valve.get(to_valve, MAX_VALUE) for to_valve in valves
+        )
+
+    return CompressedGraph(flow_rates, distances)
+
+
+def find_distances(graph: Graph, start_valve: str) -> dict[str, int]:
+    """Finds the distances from a valve to all valves that can be reached from
+    it, with a breadth-first search. Every tunnel has a length of 1.
+    """
+    distances = {start_valve: 0}
+    queue = deque([start_valve])
+
+    while queue:
+        valve = queue.popleft()
+
+        for next_valve in graph[valve].edges:
+            if next_valve not in distances:
+                distances[next_valve] = distances[valve] + 1
+                queue.append(next_valve)
+
+    return distances
 
 
 def pressure_release_remaining(agents: list[Agent]) -> int:
@@ -413,9 +681,29 @@ def pressure_release_remaining(agents: list[Agent]) -> int:
     )
 
 
-# tunnel_layout = open("../puzzle-input/day16-example-input.txt").readlines()
-tunnel_layout = open("../puzzle-input/day16-input.txt").readlines()
+def solve(
+    input_text: str, engine: str = "valve-sets", num_agents: int = 2, prune: bool = True
+) -> int:
+    """The engine is either "valve-sets", which divides the valves between the
+    agents, or "search", which moves the agents around together. Only the
+    latter can `prune`.
+    """
+    if num_agents < 1:
+        raise ValueError("Can't open any valves with %d agents" % num_agents)
+
+    graph = compressed_graph(input_text)
+
+    match engine:
+        case "valve-sets":
+            return find_max_releasable_pressure_per_valve_set(graph, num_agents)
+        case "search":
+            return find_max_releasable_pressure(graph, num_agents, prune)
+        case _:
+            raise Exception("Unknown engine %s" % engine)
+
 
-graph = parse_tunnel_layout(tunnel_layout)
+if __name__ == "__main__":
+    # input_text = open("../puzzle-input/day16-example-input.txt").read()
+    input_text = open("../puzzle-input/day16-input.txt").read()
 
-print(find_max_releasable_pressure(graph, num_agents=2))
+    print(solve(input_text))
@@ -175,8 +175,9 @@ Work out the steps to release the most pressure in 30 minutes. What is the most
 pressure you can release?
 """
 
-from collections import defaultdict, deque, namedtuple
-from copy import copy
+from collections import deque, namedtuple
+
+import instrument
 
 
 MAX_VALUE = 2**31 - 1
@@ -184,11 +185,14 @@ MAX_VALUE = 2**31 - 1
 TIME_LIMIT = 30
 
 Graph = dict[str, "Node"]
-Matrix = dict[str, dict[str, int]]
+# Only the valves that are worth a visit, see `compress_graph()`
+CompressedGraph = namedtuple("CompressedGraph", ["flow_rates", "distances"])
+# The valves are numbered (see `compress_graph()`), and the closed valves are
+# the set bits of an int
 State = namedtuple(
     "State",
     [
-        "current_node",
+        "current_valve",
         "closed_valves",
         "time_passed",
         "pressure_release_rate",
@@ -207,6 +211,7 @@ class Node:
         return self.name
 
 
+@instrument.phase("parse")
 def parse_tunnel_layout(lines: list[str]) -> dict[str, Node]:
     # Format: [valve name]: flow rate
     graph = {}
@@ -223,89 +228,190 @@ def parse_tunnel_layout(lines: list[str]) -> dict[str, Node]:
     return graph
 
 
-def find_max_releasable_pressure(graph: Graph) -> int:
-    distance_matrix = floyd_warshal(graph)
-
-    closed_valves = set([valve for valve in graph if graph[valve].flow_rate > 0])
+@instrument.phase("search")
+def find_max_releasable_pressure(graph: CompressedGraph, prune: bool = True) -> int:
+    """Tries every order in which the valves can be opened. With `prune`, it
+    skips the states that can't release more pressure than the best one so
+    far, even in the most optimistic case (see `upper_bound()`).
+    """
+    flow_rates, distances = graph
+    num_valves = len(flow_rates)
+    step_time = shortest_step_time(graph)
 
-    queue = deque([State("AA", closed_valves, 0, 0, 0)])
+    # The starting valve comes after the ones with a positive flow rate
+    queue = deque([State(num_valves, (1 << num_valves) - 1, 0, 0, 0)])
     highest_pressure_released = 0
     while queue:
-        step = queue.popleft()
-        current_node = step.current_node
+        (
+            current_valve,
+            closed_valves,
+            time_passed,
+            pressure_release_rate,
+            total_pressure_released,
+        ) = queue.popleft()
+        instrument.count("states expanded")
 
         # If we would stop here and let time run out, how much pressed will there be
         # released at the time limit?
-        idle_pressure_released = step.total_pressure_released + (
-            (TIME_LIMIT - step.time_passed) * step.pressure_release_rate
+        idle_pressure_released = total_pressure_released + (
+            (TIME_LIMIT - time_passed) * pressure_release_rate
         )
         highest_pressure_released = max(
             highest_pressure_released, idle_pressure_released
         )
 
-        for destination_node in step.closed_valves:
+        if prune:
+            best_case = idle_pressure_released + upper_bound(
+                flow_rates, closed_valves, TIME_LIMIT - time_passed, step_time
+            )
+            if best_case <= highest_pressure_released:
+                instrument.count("states pruned")
+                continue
+
+        # The distances from the current valve to all others
+        distances_offset = current_valve * (num_valves + 1)
+
+        # The valves with the lowest numbers, and the highest flow rates, are
+        # added last, so they're tried first. That way a good result is found
+        # early on, which lets more of the other states be pruned.
+        remaining_valves = closed_valves
+        while remaining_valves:
             # For each unopened valve that offer some flow rate, simulate us going
             # there and opening that valve. While we're underway to that
             # destination valve the pressure released slowly ticks up.
+            destination_valve = remaining_valves.bit_length() - 1
+            valve_bit = 1 << destination_valve
+            remaining_valves ^= valve_bit
 
-            route_length = distance_matrix[current_node][destination_node]
+            route_length = distances[distances_offset + destination_valve]
 
             # The time it takes us to get to the valve, plus 1 minute to open it
-            next_time_passed = step.time_passed + route_length + 1
+            next_time_passed = time_passed + route_length + 1
             if next_time_passed >= TIME_LIMIT:
                 # Time's up, we can't make it to the destination node in time.
                 continue
 
-            # Open the valve
-            next_closed_valves = copy(step.closed_valves)
-            next_closed_valves.remove(destination_node)
-
-            next_release_rate = (
-                step.pressure_release_rate + graph[destination_node].flow_rate
-            )
-            next_total_released = step.total_pressure_released + (
-                step.pressure_release_rate * (route_length + 1)
+            next_release_rate = pressure_release_rate + flow_rates[destination_valve]
+            next_total_released = total_pressure_released + (
+                pressure_release_rate * (route_length + 1)
             )
 
             next_step = State(
-                destination_node,
-                next_closed_valves,
+                destination_valve,
+                # Open the valve
+                closed_valves ^ valve_bit,
                 next_time_passed,
                 next_release_rate,
                 next_total_released,
             )
             queue.appendleft(next_step)
+            instrument.maximum("queue size", len(queue))
 
     return highest_pressure_released
 
 
-def floyd_warshal(graph: dict[str, Node]) -> Matrix:
-    matrix: Matrix = defaultdict(lambda: defaultdict(lambda: MAX_VALUE))
+def shortest_step_time(graph: CompressedGraph) -> int:
+    """Returns the least time it takes to go from one valve to another and open
+    it.
+    """
+    num_valves = len(graph.flow_rates)
+
+    return 1 + min(
+        [
+            distance
+            for index, distance in enumerate(graph.distances)
+            # Skips the distances from the valves to themselves
+            if index % (num_valves + 2) != 0
+        ],
+        default=0,
+    )
+
+
+def upper_bound(
+    flow_rates: list[int], closed_valves: int, time_left: int, step_time: int
+) -> int:
+    """Returns how much more pressure opening the closed valves could release
+    at most, on top of what the open valves release. That would be when the
+    closed valves are all only `step_time` apart, and are opened from the
+    highest flow rate to the lowest.
+    """
+    pressure_released = 0
+
+    # The lowest numbers have the highest flow rates
+    while closed_valves and time_left > step_time:
+        valve_bit = closed_valves & -closed_valves
+        closed_valves ^= valve_bit
+
+        time_left -= step_time
+        pressure_released += flow_rates[valve_bit.bit_length() - 1] * time_left
+
+    return pressure_released
+
+
+def compressed_graph(input_text: str) -> CompressedGraph:
+    """Parses and compresses the tunnel layout. The result isn't kept between
+    solves, so that timing a solver repeatedly measures all of its work.
+    """
+    graph = parse_tunnel_layout(input_text.splitlines(keepends=True))
+
+    return compress_graph(graph)
+
+
+@instrument.phase("precompute")
+def compress_graph(graph: Graph) -> CompressedGraph:
+    """Reduces the tunnels to the valves that are worth a visit: the ones that
+    have a positive flow rate, numbered from 0 to n - 1 (from the highest flow
+    rate to the lowest) so that any set of them fits in the bits of an int, and
+    the starting valve (AA) after them, at n.
+
+    The distances between them are kept as a flat list, in which the distance
+    from valve i to valve j is at i * (n + 1) + j.
+    """
+    valves = sorted(
+        [name for name, node in graph.items() if node.flow_rate > 0],
+        key=lambda name: graph[name].flow_rate,
+        reverse=True,
+    )
+    flow_rates = [graph[valve].flow_rate for valve in valves]
+    valves.append("AA")
+
+    distances = []
+    for from_valve in valves:
+        distances_from_valve = find_distances(graph, from_valve)
+        distances.extend(
+            distances_from_valve.get(to_valve, MAX_VALUE) for to_valve in valves
+        )
+
+    return CompressedGraph(flow_rates, distances)
+
+
+def find_distances(graph: Graph, start_valve: str) -> dict[str, int]:
+    """Finds the distances from a valve to all valves that can be reached from
+    it, with a breadth-first search. Every tunnel has a length of 1.
+    """
+    distances = {start_valve: 0}
+    queue = deque([start_valve])
+
+    while queue:
+        valve = queue.popleft()
 
-    # Create adjacency matrix
-    for name, node in graph.items():
-        matrix[name][name] = 0
-        for edge in node.edges:
-            # Every edge in this graph has a length of 1
-            matrix[name][edge] = 1
+        for next_valve in graph[valve].edges:
+            if next_valve not in distances:
+                distances[next_valve] = distances[valve] + 1
+                queue.append(next_valve)
 
-    # Do the Floyd-Warshal
-    for k in graph:
-        for i in graph:
-            for j in graph:
-                through_k = matrix[i][k] + matrix[k][j]
-                if through_k < matrix[i][j]:
-                    matrix[i][j] = through_k
+    return distances
 
-    return matrix
 
+def solve(input_text: str, prune: bool = True) -> int:
+    return find_max_releasable_pressure(compressed_graph(input_text), prune)
 
-# tunnel_layout = open("../puzzle-input/day16-example-input.txt").readlines()
-tunnel_layout = open("../puzzle-input/day16-input.txt").readlines()
 
-graph = parse_tunnel_layout(tunnel_layout)
+if __name__ == "__main__":
+    # input_text = open("../puzzle-input/day16-example-input.txt").read()
+    input_text = open("../puzzle-input/day16-input.txt").read()
 
-print(find_max_releasable_pressure(graph))
+    print(solve(input_text))
 
 
 # def dijkstra(graph: dict[str, Node], start_node: str):
@@ -373,206 +373,297 @@ In the example above, the tower would be 1514285714288 units tall!
 How tall will the tower be after 1000000000000 rocks have stopped?
 """
 
-import sys
+from itertools import cycle, count
 
-from itertools import cycle, tee, count
+import instrument
 
 
-PIECES = [
+# Every piece is a tuple of rows, from the bottom up, and every row is a bitmask
+# of the spaces it takes up: bit 6 is the left of the chamber, bit 0 the right.
+# They start out where they appear, two spaces away from the left wall.
+PIECE_ROWS = [
     # Horizontal "straight tetromino" (https://en.wikipedia.org/wiki/Tetromino)
-    [
-        [".", ".", ".", "."],
-        [".", ".", ".", "."],
-        [".", ".", ".", "."],
-        ["#", "#", "#", "#"],
-    ],
+    (0b0011110,),
     # Plus sign
-    [
-        [".", ".", ".", "."],
-        [".", "#", ".", "."],
-        ["#", "#", "#", "."],
-        [".", "#", ".", "."],
-    ],
+    (
+        0b0001000,
+        0b0011100,
+        0b0001000,
+    ),
     # Corner piece
-    [
-        [".", ".", ".", "."],
-        [".", ".", "#", "."],
-        [".", ".", "#", "."],
-        ["#", "#", "#", "."],
-    ],
+    (
+        0b0011100,
+        0b0000100,
+        0b0000100,
+    ),
     # Vertical 'straight tetromino'
-    [
-        ["#", ".", ".", "."],
-        ["#", ".", ".", "."],
-        ["#", ".", ".", "."],
-        ["#", ".", ".", "."],
-    ],
+    (
+        0b0010000,
+        0b0010000,
+        0b0010000,
+        0b0010000,
+    ),
     # Square
-    [
-        [".", ".", ".", "."],
-        [".", ".", ".", "."],
-        ["#", "#", ".", "."],
-        ["#", "#", ".", "."],
-    ],
+    (
+        0b0011000,
+        0b0011000,
+    ),
 ]
 
 CHAMBER_WIDTH = 7
+MAX_PIECE_HEIGHT = 4
+FLOOR = (1 << CHAMBER_WIDTH) - 1
+# How many rows the chamber holds on to at most. Once it has more, it drops the
+# ones below the rows that pieces can still reach, or else the lowest ones.
+MAX_ROWS = 1024
 SYMBOL_ROCK = "#"
 SYMBOL_EMPTY = "."
 
 
+def pack(rows: tuple[int, ...]) -> int:
+    """Packs the rows of a piece into a single int, one byte per row with the
+    bottom row in the lowest byte, so that a whole piece can be shifted and
+    compared with the chamber at once.
+    """
+    return int.from_bytes(bytes(rows), "little")
+
+
+PIECES = [pack(rows) for rows in PIECE_ROWS]
+
+# The left and right columns of the chamber, in every row a piece can take up
+LEFT_COLUMN = pack((1 << (CHAMBER_WIDTH - 1),) * MAX_PIECE_HEIGHT)
+RIGHT_COLUMN = pack((1,) * MAX_PIECE_HEIGHT)
+
+
 class Chamber:
     def __init__(self) -> None:
-        # Floor
-        self.rows = [[SYMBOL_ROCK for _ in range(CHAMBER_WIDTH + 2)]]
+        # A bitmask of the blocked spaces per row, like the rows of the pieces.
+        # The first row is the floor, everything above the tower is empty.
+        self.rows = bytearray([FLOOR])
+        # How many rows have been dropped from the bottom, as no piece could
+        # reach them anymore. Heights are counted from the floor all the same.
+        self.height_offset = 0
+        # The height the tower has to reach before looking for rows that
+        # pieces can't reach again, after the last look didn't find any
+        self.next_drop_height = 0
 
     def tower_height(self) -> int:
-        return len(self.rows) - 1
-
-    def add_level(self):
-        self.rows.append(
-            [s for s in SYMBOL_ROCK + (CHAMBER_WIDTH * SYMBOL_EMPTY) + SYMBOL_ROCK]
-        )
+        return self.height_offset + len(self.rows) - 1
+
+    def collides(self, piece: int, y: int) -> bool:
+        """Returns whether the piece would overlap with any blocked space, if
+        its bottom row were at height y.
+        """
+        # The rows it would take up, packed like the piece itself. Rows above
+        # the tower are left out, and count as empty. The rows that have been
+        # dropped count as blocked.
+        y -= self.height_offset
+        if y < 0:
+            return True
+
+        rows = int.from_bytes(self.rows[y : y + MAX_PIECE_HEIGHT], "little")
+
+        return piece & rows != 0
+
+    def put_at_rest(self, piece: int, y: int):
+        rows = self.rows
+        y -= self.height_offset
+        for piece_row in piece.to_bytes((piece.bit_length() + 7) // 8, "little"):
+            if y < len(rows):
+                rows[y] |= piece_row
+            else:
+                rows.append(piece_row)
+
+            y += 1
+
+        if len(rows) > MAX_ROWS:
+            if self.tower_height() >= self.next_drop_height:
+                self.drop_unreachable_rows()
+
+            # When pieces can still get through every row, the lowest rows are
+            # dropped anyway. Pieces would have to fall through a shaft as deep
+            # as all the rows that are kept to notice.
+            if len(rows) > MAX_ROWS:
+                self.drop_rows(len(rows) - MAX_ROWS)
+
+    def drop_rows(self, num_rows: int):
+        del self.rows[:num_rows]
+        self.height_offset += num_rows
+
+    def drop_unreachable_rows(self):
+        """Drops the rows below the highest row that pieces can't get through.
+        Pieces only move down, left and right, so going down from the top of
+        the tower, a space can only be reached from the space above it or from
+        a reachable space next to it.
+        """
+        all_columns = (1 << CHAMBER_WIDTH) - 1
+        # Every space above the tower can be reached
+        reachable = all_columns
+
+        for y in range(len(self.rows) - 1, -1, -1):
+            empty = ~self.rows[y] & all_columns
+            reachable &= empty
+            while True:
+                spread = (reachable | reachable << 1 | reachable >> 1) & empty
+                if spread == reachable:
+                    break
 
-    def get(self, x: int, y: int) -> str:
-        if y >= len(self.rows):
-            if x == 0 or x == (CHAMBER_WIDTH + 2) - 1:
-                return SYMBOL_ROCK
+                reachable = spread
 
-            return SYMBOL_EMPTY:
+            if not reachable:
+                # Pieces can still come to rest on this row, but can't get to
+                # any of the rows below it
+                if y > 0:
+                    self.drop_rows(y)
+                    return
 
-        return self.rows[y][x]
+                break
 
-    def mark_blocked(self, x: int, y: int):
-        for _ in range(y - self.tower_height()):
-            self.add_level()
+        # There's nothing to drop, so it's not worth looking again until the
+        # tower has grown by as many rows as are kept
+        self.next_drop_height = self.tower_height() + MAX_ROWS
+
+    def surface_profile(self) -> tuple[int, ...]:
+        """Returns how far the highest blocked space in every column is below
+        the top of the tower. Columns without any blocked space in the rows
+        that are kept get MAX_ROWS instead, as far as anyone can tell they're
+        open all the way down.
+        """
+        depths = [MAX_ROWS] * CHAMBER_WIDTH
+        columns_left = (1 << CHAMBER_WIDTH) - 1
+
+        for depth, row in enumerate(reversed(self.rows)):
+            found = row & columns_left
+            if not found:
+                continue
+
+            for x in range(CHAMBER_WIDTH):
+                if found & (1 << (CHAMBER_WIDTH - 1 - x)):
+                    depths[x] = depth
+
+            columns_left &= ~found
+            if not columns_left:
+                break
 
-        self.rows[y][x] = SYMBOL_ROCK
+        return tuple(depths)
 
-    def __str__(self):
+    def __str__(self) -> str:
         output = []
         for row in reversed(self.rows):
-            output.append("".join(row))
+            symbols = [
+                SYMBOL_ROCK if row & (1 << (CHAMBER_WIDTH - 1 - x)) else SYMBOL_EMPTY
+                for x in range(CHAMBER_WIDTH)
+            ]
+            output.append(SYMBOL_ROCK + "".join(symbols) + SYMBOL_ROCK)
 
         return "\n".join(output)
 
 
-def delta_x_for_symbol(symbol: str):
+def push(piece: int, symbol: str) -> int:
+    """Returns the piece moved one space to the left or right by a jet of gas,
+    or the piece as it is when a wall is in the way.
+    """
     match symbol:
         case "<":
-            return -1
+            if piece & LEFT_COLUMN:
+                return piece
+
+            return piece << 1
 
         case ">":
-            return 1
+            if piece & RIGHT_COLUMN:
+                return piece
+
+            return piece >> 1
 
         case _:
             raise Exception("Unknown symbol")
 
 
-# jet_pattern = cycle(zip(count(), open("../puzzle-input/day17-example-input.txt").read().strip()))
-jet_pattern = cycle(
-    zip(count(), open("../puzzle-input/day17-input.txt").read().strip())
-)
-
-chamber = Chamber()
-iter_pieces = cycle(zip(count(), PIECES))
-
-# Because both the jet patterns (puzzle input) and pieces cycle, there will be
-# a point at which there's a repeating pattern of them. This dictionary is used
-# to keep track of the jet/piece combinations that have been seen.
-#
-# When a duplicate combination is detected, a cycle, we can calculate how much
-# different there is in the height of the tower since then and extrapolate how
-# high it will be after many, many more cycles (up to 1 trillion pieces)
-seen_jet_piece_combinations = {}
-
 NUM_PIECES = 1_000_000_000_000
-for piece_count in range(NUM_PIECES):
-    piece_index, piece = next(iter_pieces)
-
-    # Piece positions are seen from their bottom-left corner, 0-indexed
-    piece_x = 3
-    piece_y = chamber.tower_height() + 4
-
-    piece_put_at_rest = False
-    while not piece_put_at_rest:
-        jet_index, jet_direction = next(jet_pattern)
-        delta_x = delta_x_for_symbol(jet_direction)
-
-        can_move = True
-        for row_y, row in enumerate(reversed(piece)):
-            for row_x, symbol in enumerate(row):
-                if symbol == SYMBOL_EMPTY:
-                    continue
-
-                if (
-                    chamber.get(piece_x + row_x + delta_x, piece_y + row_y)
-                    == SYMBOL_ROCK
-                ):
-                    can_move = False
-                    break
-
-        if can_move:
-            piece_x += delta_x
-
-        # Going from the bottom row of the piece, check if it has dropped on any
-        # block or floor below
-        is_blocked = False
-        for symbol_y, piece_row in enumerate(reversed(piece)):
-            for symbol_x, symbol in enumerate(piece_row):
-                if symbol == SYMBOL_EMPTY:
-                    continue
 
-                x = piece_x + symbol_x
-                y = piece_y + symbol_y
 
-                if chamber.get(x, y - 1) == SYMBOL_ROCK:
-                    is_blocked = True
+def solve(input_text: str, num_pieces: int = NUM_PIECES) -> int:
+    jet_pattern = cycle(zip(count(), input_text.strip()))
+
+    chamber = Chamber()
+    iter_pieces = cycle(zip(count(), PIECES))
+
+    # Because both the jet patterns (puzzle input) and pieces cycle, there will
+    # be a point at which the tower starts to repeat itself. That's the case
+    # once the same jet, piece and shape of the top of the tower come by
+    # again. This dictionary keeps track of the numbers of pieces after which
+    # each of those states was seen.
+    #
+    # The shape of the top doesn't include overhangs, so a cycle is only
+    # trusted once it has repeated twice, and the tower grew in the same way,
+    # piece by piece, both times. From then on, we can extrapolate how high it
+    # will be after many, many more cycles (up to 1 trillion pieces).
+    seen_states: dict[tuple, list[int]] = {}
+
+    # The height of the tower after every number of pieces
+    tower_heights = [0]
+
+    with instrument.phase("simulate"):
+        for pieces_dropped in range(1, num_pieces + 1):
+            instrument.count("rocks dropped")
+            piece_index, piece = next(iter_pieces)
+
+            # It appears with 3 empty rows below it, so until it's fallen that
+            # far only the walls can be in its way
+            for _ in range(3):
+                jet_index, jet_direction = next(jet_pattern)
+                piece = push(piece, jet_direction)
+
+            # The bottom row of the piece, with the floor at 0
+            piece_y = chamber.tower_height() + 1
+
+            while True:
+                jet_index, jet_direction = next(jet_pattern)
+                pushed_piece = push(piece, jet_direction)
+                if not chamber.collides(pushed_piece, piece_y):
+                    piece = pushed_piece
+
+                # Has it dropped on any block or floor below?
+                if chamber.collides(piece, piece_y - 1):
+                    chamber.put_at_rest(piece, piece_y)
                     break
 
-            if is_blocked:
-                break
-
-        if not is_blocked:
-            # Piece is not stopped by collision so let it fall down one row
-            piece_y -= 1
-            continue
-
-        for symbol_y, piece_row in enumerate(reversed(piece)):
-            for symbol_x, symbol in enumerate(piece_row):
-                # Put all symbols of the piece to rest in the chamber
+                # Piece is not stopped by collision so let it fall down one row
+                piece_y -= 1
+
+            tower_heights.append(chamber.tower_height())
+
+            state = (jet_index, piece_index, chamber.surface_profile())
+            seen_at = seen_states.setdefault(state, [])
+            seen_at.append(pieces_dropped)
+            if len(seen_at) < 3:
+                continue
+
+            instrument.count("cycle checks")
+            first, second, third = seen_at[-3:]
+            period = third - second
+            growth = tower_heights[third] - tower_heights[second]
+            if second - first != period or any(
+                tower_heights[second + offset] - tower_heights[first + offset] != growth
+                for offset in range(period)
+            ):
+                continue
+
+            cycles_remaining, pieces_remaining = divmod(num_pieces - third, period)
+            # The pieces that are left after the last full cycle make the tower
+            # grow as much as the same pieces after the start of a cycle
+            partial_growth = (
+                tower_heights[second + pieces_remaining] - tower_heights[second]
+            )
 
-                if symbol == SYMBOL_EMPTY:
-                    continue
+            return tower_heights[third] + cycles_remaining * growth + partial_growth
 
-                x = piece_x + symbol_x
-                y = piece_y + symbol_y
+    return chamber.tower_height()
 
-                chamber.mark_blocked(x, y)
-                piece_put_at_rest = True
 
-        jet_piece_id = (jet_index, piece_index)
-        if jet_piece_id in seen_jet_piece_combinations:
-            prev_block_count, prev_tower_height = seen_jet_piece_combinations[
-                jet_piece_id
-            ]
-            period = piece_count - prev_block_count
-            if piece_count % period == NUM_PIECES % period:
-                print(
-                    f"Cycle of period {period} detected",
-                    f"(in iterations {prev_block_count-period}-{prev_block_count}",
-                    f"and {prev_block_count}-{piece_count})",
-                )
-                cycle_height = chamber.tower_height() - prev_tower_height
-                pieces_remaining = NUM_PIECES - piece_count
-                cycles_remaining = (pieces_remaining // period) + 1
-                print(prev_tower_height + (cycle_height * cycles_remaining) - 1)
-
-                sys.exit(0)
-        else:
-            seen_jet_piece_combinations[jet_piece_id] = (
-                piece_count,
-                chamber.tower_height(),
-            )
+if __name__ == "__main__":
+    # input_text = open("../puzzle-input/day17-example-input.txt").read()
+    input_text = open("../puzzle-input/day17-input.txt").read()
 
-chamber.tower_height()
+    print(solve(input_text))
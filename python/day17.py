@@ -369,164 +369,234 @@ falling?
 
 from itertools import cycle
 
+import instrument
 
-PIECES = [
+
+# Every piece is a tuple of rows, from the bottom up, and every row is a bitmask
+# of the spaces it takes up: bit 6 is the left of the chamber, bit 0 the right.
+# They start out where they appear, two spaces away from the left wall.
+PIECE_ROWS = [
     # Horizontal "straight tetromino" (https://en.wikipedia.org/wiki/Tetromino)
-    [
-        [".", ".", ".", "."],
-        [".", ".", ".", "."],
-        [".", ".", ".", "."],
-        ["#", "#", "#", "#"],
-    ],
+    (0b0011110,),
     # Plus sign
-    [
-        [".", ".", ".", "."],
-        [".", "#", ".", "."],
-        ["#", "#", "#", "."],
-        [".", "#", ".", "."],
-    ],
+    (
+        0b0001000,
+        0b0011100,
+        0b0001000,
+    ),
     # Corner piece
-    [
-        [".", ".", ".", "."],
-        [".", ".", "#", "."],
-        [".", ".", "#", "."],
-        ["#", "#", "#", "."],
-    ],
+    (
+        0b0011100,
+        0b0000100,
+        0b0000100,
+    ),
     # Vertical 'straight tetromino'
-    [
-        ["#", ".", ".", "."],
-        ["#", ".", ".", "."],
-        ["#", ".", ".", "."],
-        ["#", ".", ".", "."],
-    ],
+    (
+        0b0010000,
+        0b0010000,
+        0b0010000,
+        0b0010000,
+    ),
     # Square
-    [
-        [".", ".", ".", "."],
-        [".", ".", ".", "."],
-        ["#", "#", ".", "."],
-        ["#", "#", ".", "."],
-    ],
+    (
+        0b0011000,
+        0b0011000,
+    ),
 ]
 
 CHAMBER_WIDTH = 7
+MAX_PIECE_HEIGHT = 4
+FLOOR = (1 << CHAMBER_WIDTH) - 1
+# How many rows the chamber holds on to at most. Once it has more, it drops the
+# ones below the rows that pieces can still reach, or else the lowest ones.
+MAX_ROWS = 1024
 SYMBOL_ROCK = "#"
 SYMBOL_EMPTY = "."
 
 
-class Chamber:
-    def __init__(self):
-        # Floor
-        self.rows = [[SYMBOL_ROCK for _ in range(CHAMBER_WIDTH + 2)]]
+def pack(rows: tuple[int, ...]) -> int:
+    """Packs the rows of a piece into a single int, one byte per row with the
+    bottom row in the lowest byte, so that a whole piece can be shifted and
+    compared with the chamber at once.
+    """
+    return int.from_bytes(bytes(rows), "little")
 
-    def tower_height(self) -> int:
-        return len(self.rows) - 1
 
-    def add_level(self):
-        self.rows.append(
-            [s for s in SYMBOL_ROCK + (CHAMBER_WIDTH * SYMBOL_EMPTY) + SYMBOL_ROCK]
-        )
+PIECES = [pack(rows) for rows in PIECE_ROWS]
 
-    def get(self, x: int, y: int) -> str:
-        if y >= len(self.rows):
-            if x == 0 or x == (CHAMBER_WIDTH + 2) - 1:
-                return SYMBOL_ROCK
+# The left and right columns of the chamber, in every row a piece can take up
+LEFT_COLUMN = pack((1 << (CHAMBER_WIDTH - 1),) * MAX_PIECE_HEIGHT)
+RIGHT_COLUMN = pack((1,) * MAX_PIECE_HEIGHT)
 
-            return SYMBOL_EMPTY
 
-        return self.rows[y][x]
+class Chamber:
+    def __init__(self) -> None:
+        # A bitmask of the blocked spaces per row, like the rows of the pieces.
+        # The first row is the floor, everything above the tower is empty.
+        self.rows = bytearray([FLOOR])
+        # How many rows have been dropped from the bottom, as no piece could
+        # reach them anymore. Heights are counted from the floor all the same.
+        self.height_offset = 0
+        # The height the tower has to reach before looking for rows that
+        # pieces can't reach again, after the last look didn't find any
+        self.next_drop_height = 0
 
-    def mark_blocked(self, x: int, y: int):
-        for _ in range(y - self.tower_height()):
-            self.add_level()
+    def tower_height(self) -> int:
+        return self.height_offset + len(self.rows) - 1
+
+    def collides(self, piece: int, y: int) -> bool:
+        """Returns whether the piece would overlap with any blocked space, if
+        its bottom row were at height y.
+        """
+        # The rows it would take up, packed like the piece itself. Rows above
+        # the tower are left out, and count as empty. The rows that have been
+        # dropped count as blocked.
+        y -= self.height_offset
+        if y < 0:
+            return True
+
+        rows = int.from_bytes(self.rows[y : y + MAX_PIECE_HEIGHT], "little")
+
+        return piece & rows != 0
+
+    def put_at_rest(self, piece: int, y: int):
+        rows = self.rows
+        y -= self.height_offset
+        for piece_row in piece.to_bytes((piece.bit_length() + 7) // 8, "little"):
+            if y < len(rows):
+                rows[y] |= piece_row
+            else:
+                rows.append(piece_row)
+
+            y += 1
+
+        if len(rows) > MAX_ROWS:
+            if self.tower_height() >= self.next_drop_height:
+                self.drop_unreachable_rows()
+
+            # When pieces can still get through every row, the lowest rows are
+            # dropped anyway. Pieces would have to fall through a shaft as deep
+            # as all the rows that are kept to notice.
+            if len(rows) > MAX_ROWS:
+                self.drop_rows(len(rows) - MAX_ROWS)
+
+    def drop_rows(self, num_rows: int):
+        del self.rows[:num_rows]
+        self.height_offset += num_rows
+
+    def drop_unreachable_rows(self):
+        """Drops the rows below the highest row that pieces can't get through.
+        Pieces only move down, left and right, so going down from the top of
+        the tower, a space can only be reached from the space above it or from
+        a reachable space next to it.
+        """
+        all_columns = (1 << CHAMBER_WIDTH) - 1
+        # Every space above the tower can be reached
+        reachable = all_columns
+
+        for y in range(len(self.rows) - 1, -1, -1):
+            empty = ~self.rows[y] & all_columns
+            reachable &= empty
+            while True:
+                spread = (reachable | reachable << 1 | reachable >> 1) & empty
+                if spread == reachable:
+                    break
+
+                reachable = spread
 
-        self.rows[y][x] = SYMBOL_ROCK
+            if not reachable:
+                # Pieces can still come to rest on this row, but can't get to
+                # any of the rows below it
+                if y > 0:
+                    self.drop_rows(y)
+                    return
+
+                break
+
+        # There's nothing to drop, so it's not worth looking again until the
+        # tower has grown by as many rows as are kept
+        self.next_drop_height = self.tower_height() + MAX_ROWS
 
     def __str__(self) -> str:
         output = []
         for row in reversed(self.rows):
-            output.append("".join(row))
+            symbols = [
+                SYMBOL_ROCK if row & (1 << (CHAMBER_WIDTH - 1 - x)) else SYMBOL_EMPTY
+                for x in range(CHAMBER_WIDTH)
+            ]
+            output.append(SYMBOL_ROCK + "".join(symbols) + SYMBOL_ROCK)
 
         return "\n".join(output)
 
 
-def delta_x_for_symbol(symbol: str) -> int:
+def push(piece: int, symbol: str) -> int:
+    """Returns the piece moved one space to the left or right by a jet of gas,
+    or the piece as it is when a wall is in the way.
+    """
     match symbol:
         case "<":
-            return -1
+            if piece & LEFT_COLUMN:
+                return piece
+
+            return piece << 1
 
         case ">":
-            return 1
+            if piece & RIGHT_COLUMN:
+                return piece
+
+            return piece >> 1
 
         case _:
             raise Exception("Unknown symbol")
 
 
-# jet_pattern = cycle(open("../puzzle-input/day17-example-input.txt").read().strip())
-jet_pattern = cycle(open("../puzzle-input/day17-input.txt").read().strip())
-
-chamber = Chamber()
-iter_pieces = cycle(PIECES)
+NUM_PIECES = 2022
 
-for block_count in range(2022):
-    piece = next(iter_pieces)
 
-    # Piece positions are seen from their bottom-left corner, 0-indexed
-    piece_x = 3
-    piece_y = chamber.tower_height() + 4
+@instrument.phase("simulate")
+def build_tower(input_text: str, num_pieces: int) -> Chamber:
+    """Drops the given number of pieces and returns the chamber they came to
+    rest in.
+    """
+    jet_pattern = cycle(input_text.strip())
 
-    piece_put_at_rest = False
-    while not piece_put_at_rest:
-        delta_x = delta_x_for_symbol(next(jet_pattern))
-        can_move = True
-        for row_y, row in enumerate(reversed(piece)):
-            for row_x, symbol in enumerate(row):
-                if symbol == SYMBOL_EMPTY:
-                    continue
+    chamber = Chamber()
+    iter_pieces = cycle(PIECES)
 
-                if (
-                    chamber.get(piece_x + row_x + delta_x, piece_y + row_y)
-                    == SYMBOL_ROCK
-                ):
-                    can_move = False
-                    break
-
-        if can_move:
-            piece_x += delta_x
+    for block_count in range(num_pieces):
+        instrument.count("rocks dropped")
+        piece = next(iter_pieces)
 
-        # Going from the bottom row of the piece, check if it has dropped on any
-        # block or floor below
-        is_blocked = False
-        for symbol_y, piece_row in enumerate(reversed(piece)):
-            for symbol_x, symbol in enumerate(piece_row):
-                if symbol == SYMBOL_EMPTY:
-                    continue
+        # It appears with 3 empty rows below it, so until it's fallen that
+        # far only the walls can be in its way
+        for _ in range(3):
+            piece = push(piece, next(jet_pattern))
 
-                x = piece_x + symbol_x
-                y = piece_y + symbol_y
+        # The bottom row of the piece, with the floor at 0
+        piece_y = chamber.tower_height() + 1
 
-                if chamber.get(x, y - 1) == SYMBOL_ROCK:
-                    is_blocked = True
-                    break
+        while True:
+            pushed_piece = push(piece, next(jet_pattern))
+            if not chamber.collides(pushed_piece, piece_y):
+                piece = pushed_piece
 
-            if is_blocked:
+            # Has it dropped on any block or floor below?
+            if chamber.collides(piece, piece_y - 1):
+                chamber.put_at_rest(piece, piece_y)
                 break
 
-        if not is_blocked:
             # Piece is not stopped by collision so let it fall down one row
             piece_y -= 1
-            continue
 
-        for symbol_y, piece_row in enumerate(reversed(piece)):
-            for symbol_x, symbol in enumerate(piece_row):
-                # Put all symbols of the piece to rest in the chamber
+    return chamber
+
 
-                if symbol == SYMBOL_EMPTY:
-                    continue
+def solve(input_text: str, num_pieces: int = NUM_PIECES) -> int:
+    return build_tower(input_text, num_pieces).tower_height()
 
-                x = piece_x + symbol_x
-                y = piece_y + symbol_y
 
-                chamber.mark_blocked(x, y)
-                piece_put_at_rest = True
+if __name__ == "__main__":
+    # input_text = open("../puzzle-input/day17-example-input.txt").read()
+    input_text = open("../puzzle-input/day17-input.txt").read()
 
-print(chamber.tower_height())
+    print(solve(input_text))
@@ -64,6 +64,8 @@ What is the exterior surface area of your scanned lava droplet?
 from collections import deque, namedtuple
 from heapq import heappush, heappop
 
+import instrument
+
 
 Coordinate = namedtuple("Coordinate", ["x", "y", "z"])
 
@@ -171,6 +173,7 @@ def is_reachable_dfs(cubes, from_: Coordinate) -> bool:
     visited = {from_}
     queue = [from_]
 
+    instrument.count("searches")
     while queue:
         current = queue.pop()
 
@@ -180,6 +183,7 @@ def is_reachable_dfs(cubes, from_: Coordinate) -> bool:
             or (current.y == -1 or current.y == AREA_SIZE)
             or (current.z == -1 or current.z == AREA_SIZE)
         ):
+            instrument.count("cells visited", len(visited))
             return True
 
         for next_x, next_y, next_z in ADJACENT_COORDINATES:
@@ -203,30 +207,43 @@ def is_reachable_dfs(cubes, from_: Coordinate) -> bool:
                 queue.append(edge_node)
                 visited.add(edge_node)
 
+    instrument.count("cells visited", len(visited))
     return False
 
 
-# scan_data = open("../puzzle-input/day18-example-input.txt").readlines()
-scan_data = open("../puzzle-input/day18-input.txt").readlines()
+def solve(input_text: str) -> int:
+    scan_data = input_text.splitlines(keepends=True)
+
+    cubes = set()
+
+    with instrument.phase("parse"):
+        for line in scan_data:
+            x, y, z = map(int, line.strip().split(","))
+            cubes.add(Coordinate(x, y, z))
+
+    exterior_surfaces_exposed = 0
+    with instrument.phase("search"):
+        for cube in cubes:
+            for x, y, z in ADJACENT_COORDINATES:
+                test_coordinate = Coordinate(cube[0] + x, cube[1] + y, cube[2] + z)
 
-cubes = set()
+                # Create a coordinate of what is certainly 'outside air' and
+                # likely to be close (Manhattan distance-wise) to the cube
+                # under test
+                goal = Coordinate(-1, cube.y, cube.z)
 
-for line in scan_data:
-    x, y, z = map(int, line.strip().split(","))
-    cubes.add(Coordinate(x, y, z))
+                # if test_coordinate not in cubes and is_reachable_astar(cubes, test_coordinate, goal):
+                # if test_coordinate not in cubes and is_reachable_bfs(cubes, test_coordinate):
+                if test_coordinate not in cubes and is_reachable_dfs(
+                    cubes, test_coordinate
+                ):
+                    exterior_surfaces_exposed += 1
 
-exterior_surfaces_exposed = 0
-for cube in cubes:
-    for x, y, z in ADJACENT_COORDINATES:
-        test_coordinate = Coordinate(cube[0] + x, cube[1] + y, cube[2] + z)
+    return exterior_surfaces_exposed
 
-        # Create a coordinate of what is certainly 'outside air' and likely to be
-        # close (Manhattan distance-wise) to the cube under test
-        goal = Coordinate(-1, cube.y, cube.z)
 
-        # if test_coordinate not in cubes and is_reachable_astar(cubes, test_coordinate, goal):
-        # if test_coordinate not in cubes and is_reachable_bfs(cubes, test_coordinate):
-        if test_coordinate not in cubes and is_reachable_dfs(cubes, test_coordinate):
-            exterior_surfaces_exposed += 1
+if __name__ == "__main__":
+    # input_text = open("../puzzle-input/day18-example-input.txt").read()
+    input_text = open("../puzzle-input/day18-input.txt").read()
 
-print(exterior_surfaces_exposed)
+    print(solve(input_text))
@@ -45,37 +45,45 @@ another cube, the total surface area is 64.
 What is the surface area of your scanned lava droplet?
 """
 
-# scan_data = ['1,1,1']  # 6
-# scan_data = ['1,1,1', '2,1,1']  # 10
-# scan_data = ['1,1,1', '2,1,1', '3,1,1']  # 14
-# scan_data = ['1,1,1', '2,1,1', '3,1,1', '2,2,1']  # 18
-# scan_data = ['1,1,1', '2,1,1', '3,1,1', '2,2,1', '2,0,1']  # 22
-# scan_data = ['1,1,1', '2,1,1', '3,1,1', '2,2,1', '2,0,1', '2,1,2']  # 26
-# scan_data = ['1,1,1', '2,1,1', '3,1,1', '2,2,1', '2,0,1', '2,1,2', '2,1,0']  # 30
-# scan_data = ['1,1,1', '2,1,1', '3,1,1', '2,2,1', '2,0,1', '2,1,2', '2,1,0', '1,0,0']  # 36
-# scan_data = open('day18-example-input.txt').readlines()
-scan_data = open("../puzzle-input/day18-input.txt").readlines()
-
-cubes = set()
-
-for line in scan_data:
-    x, y, z = map(int, line.strip().split(","))
-    cubes.add((x, y, z))
-
-test_coordinates = [
-    (0, -1, 0),
-    (0, +1, 0),
-    (-1, 0, 0),
-    (+1, 0, 0),
-    (0, 0, -1),
-    (0, 0, +1),
-]
-surfaces_exposed = 0
-for cube in cubes:
-    for x, y, z in test_coordinates:
-        test_coordinate = (cube[0] + x, cube[1] + y, cube[2] + z)
-
-        if test_coordinate not in cubes:
-            surfaces_exposed += 1
-
-print(surfaces_exposed)
+
+def solve(input_text: str) -> int:
+    scan_data = input_text.splitlines(keepends=True)
+
+    cubes = set()
+
+    for line in scan_data:
+        x, y, z = map(int, line.strip().split(","))
+        cubes.add((x, y, z))
+
+    test_coordinates = [
+        (0, -1, 0),
+        (0, +1, 0),
+        (-1, 0, 0),
+        (+1, 0, 0),
+        (0, 0, -1),
+        (0, 0, +1),
+    ]
+    surfaces_exposed = 0
+    for cube in cubes:
+        for x, y, z in test_coordinates:
+            test_coordinate = (cube[0] + x, cube[1] + y, cube[2] + z)
+
+            if test_coordinate not in cubes:
+                surfaces_exposed += 1
+
+    return surfaces_exposed
+
+
+if __name__ == "__main__":
+    # input_text = "1,1,1"  # 6
+    # input_text = "1,1,1\n2,1,1"  # 10
+    # input_text = "1,1,1\n2,1,1\n3,1,1"  # 14
+    # input_text = "1,1,1\n2,1,1\n3,1,1\n2,2,1"  # 18
+    # input_text = "1,1,1\n2,1,1\n3,1,1\n2,2,1\n2,0,1"  # 22
+    # input_text = "1,1,1\n2,1,1\n3,1,1\n2,2,1\n2,0,1\n2,1,2"  # 26
+    # input_text = "1,1,1\n2,1,1\n3,1,1\n2,2,1\n2,0,1\n2,1,2\n2,1,0"  # 30
+    # input_text = "1,1,1\n2,1,1\n3,1,1\n2,2,1\n2,0,1\n2,1,2\n2,1,0\n1,0,0"  # 36
+    # input_text = open("../puzzle-input/day18-example-input.txt").read()
+    input_text = open("../puzzle-input/day18-input.txt").read()
+
+    print(solve(input_text))
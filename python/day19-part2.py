@@ -415,100 +415,93 @@ geodes you could open using each of the first three blueprints. What do you get
 if you multiply these numbers together?
 """
 
-from collections import namedtuple, deque, OrderedDict, defaultdict
-from copy import copy, deepcopy
-from enum import Enum
-from itertools import repeat, count
-
-
-class Resource(Enum):
-    Ore = 1
-    Clay = 2
-    Obsidian = 3
-    Geode = 4
-
-
-class Bot(Enum):
-    Ore = 1
-    Clay = 2
-    Obsidian = 3
-    Geode = 4
-
-
-Cost = namedtuple("Cost", ["ore", "clay", "obsidian"])
-
-
-class RobotFactory:
-    def __init__(self, blueprint):
-        self.blueprint = blueprint
-        self.resources = OrderedDict(zip(list(Resource), repeat(0)))
-
-    def deposit(self, resource: Resource, amount: int):
-        self.resources[resource] += amount
-
-    def can_build(self, bot: Bot) -> bool:
-        cost = self.blueprint[bot]
-
-        return (
-            self.resources[Resource.Ore] >= cost.ore
-            and self.resources[Resource.Clay] >= cost.clay
-            and self.resources[Resource.Obsidian] >= cost.obsidian
-        )
-
-    def build(self, bot: Bot):
-        if not self.can_build(bot):
-            raise Exception("Not enough materials to build %s bot!", bot)
-
-        cost = self.blueprint[bot]
-
-        self.use(Resource.Ore, cost.ore)
-        self.use(Resource.Clay, cost.clay)
-        self.use(Resource.Obsidian, cost.obsidian)
-
-    def use(self, resource: Resource, amount: int):
-        if amount > self.resources[resource]:
-            raise Exception("Insufficient materials!")
-
-        self.resources[resource] -= amount
-
-
-def parse_blueprints(lines: list[str]) -> list[dict[Bot, Cost]]:
+import os
+import sys
+import time
+from collections import namedtuple, deque, defaultdict
+from collections.abc import Callable, Iterator
+from itertools import count
+
+import instrument
+
+
+TIME_LIMIT = 32
+
+# What each of the bots costs, in plain ints
+Blueprint = namedtuple(
+    "Blueprint",
+    [
+        "ore_bot_ore",
+        "clay_bot_ore",
+        "obsidian_bot_ore",
+        "obsidian_bot_clay",
+        "geode_bot_ore",
+        "geode_bot_obsidian",
+    ],
+)
+# The resources in stock and the bots that collect them, in the order ore,
+# clay, obsidian and geodes. A State is a plain tuple of ints, so it can be
+# stored in the `seen` set as it is.
+State = namedtuple(
+    "State",
+    [
+        "minutes_remaining",
+        "ore",
+        "clay",
+        "obsidian",
+        "geodes",
+        "ore_bots",
+        "clay_bots",
+        "obsidian_bots",
+        "geode_bots",
+    ],
+)
+# How many geodes a blueprint cracked, how long it took to find out and the
+# instrument recording of the search, if it was recorded
+BlueprintRun = namedtuple(
+    "BlueprintRun", ["id_", "geodes_cracked", "seconds", "recording"]
+)
+
+
+@instrument.phase("parse")
+def parse_blueprints(lines: list[str]) -> list[Blueprint]:
     blueprints = []
 
     for line in lines:
         parts = line.strip().split()
         blueprints.append(
-            {
-                Bot.Ore: Cost(int(parts[6]), 0, 0),
-                Bot.Clay: Cost(int(parts[12]), 0, 0),
-                Bot.Obsidian: Cost(int(parts[18]), int(parts[21]), 0),
-                Bot.Geode: Cost(int(parts[27]), 0, int(parts[30])),
-            }
+            Blueprint(
+                int(parts[6]),
+                int(parts[12]),
+                int(parts[18]),
+                int(parts[21]),
+                int(parts[27]),
+                int(parts[30]),
+            )
         )
 
     return blueprints
 
 
-def do_blueprint_run(blueprint) -> int:
-    factory = RobotFactory(blueprint)
-    bots = OrderedDict(
-        [
-            (Bot.Ore, 1),
-            (Bot.Clay, 0),
-            (Bot.Obsidian, 0),
-            (Bot.Geode, 0),
-        ]
-    )
+@instrument.phase("search")
+def do_blueprint_run(blueprint: Blueprint, minutes: int = TIME_LIMIT) -> int:
+    (
+        ore_bot_ore,
+        clay_bot_ore,
+        obsidian_bot_ore,
+        obsidian_bot_clay,
+        geode_bot_ore,
+        geode_bot_obsidian,
+    ) = blueprint
 
     # Since we can only construct 1 bot per minute, it's no use to produce more
     # of a resource than is needed by even the most expensive both. Find the
     # highest cost for each resource.
-    max_ore = max([costs.ore for costs in factory.blueprint.values()])
-    max_clay = max([costs.clay for costs in factory.blueprint.values()])
-    max_obsidian = max([costs.obsidian for costs in factory.blueprint.values()])
+    max_ore = max(ore_bot_ore, clay_bot_ore, obsidian_bot_ore, geode_bot_ore)
+    max_clay = obsidian_bot_clay
+    max_obsidian = geode_bot_obsidian
 
-    minutes_remaining = 32
-    queue = deque([(factory, bots, minutes_remaining)])
+    queue = deque([State(minutes, 0, 0, 0, 0, 1, 0, 0, 0)])
 
     max_geodes_cracked = 0
     best_geode_count_at_time = defaultdict(int)
@@ -516,65 +509,71 @@ def do_blueprint_run(blueprint) -> int:
     seen = set()
 
     while queue:
-        factory, bots, minutes_remaining = queue.pop()
+        state = queue.pop()
+        instrument.count("states expanded")
 
         # Don't process paths we already ended up at before
-        seen_key = (
-            minutes_remaining,
-            tuple(factory.resources.values()),
-            tuple(bots.values()),
-        )
-        if seen_key in seen:
+        if state in seen:
+            instrument.count("states seen before")
             continue
-        seen.add(seen_key)
+        seen.add(state)
+
+        (
+            minutes_remaining,
+            ore,
+            clay,
+            obsidian,
+            geodes,
+            ore_bots,
+            clay_bots,
+            obsidian_bots,
+            geode_bots,
+        ) = state
 
         if minutes_remaining == 0:
-            max_geodes_cracked = max(
-                max_geodes_cracked, factory.resources[Resource.Geode]
-            )
+            max_geodes_cracked = max(max_geodes_cracked, geodes)
             continue
 
         # Can this path still catch up the highest geode score so far, even
         # if it would build 1 Geode bot per minute from now on?
-        if max_geodes_cracked > factory.resources[Resource.Geode] + (
-            bots[Bot.Geode] * minutes_remaining
-        ) + sum(range(minutes_remaining)):
+        if max_geodes_cracked > geodes + (geode_bots * minutes_remaining) + (
+            minutes_remaining * (minutes_remaining - 1) // 2
+        ):
             continue
 
-        # Build additional bot, if possible
-        buildable_bots = []
-
-        # Always build a Geode bot if possible
-        if factory.can_build(Bot.Geode):
-            buildable_bots.append(Bot.Geode)
-        else:
-            # Build the following bots only if the current mining rate and
-            # storage is not enough to build that bot every minute from now
-            # on
-            if factory.can_build(Bot.Obsidian) and not (
-                bots[Bot.Obsidian] * minutes_remaining
-                + factory.resources[Resource.Obsidian]
+        # Build additional bot, if possible. Always build a Geode bot if
+        # possible.
+        build_geode_bot = ore >= geode_bot_ore and obsidian >= geode_bot_obsidian
+
+        # Build the following bots only if the current mining rate and storage
+        # is not enough to build that bot every minute from now on
+        build_obsidian_bot = (
+            not build_geode_bot
+            and ore >= obsidian_bot_ore
+            and clay >= obsidian_bot_clay
+            and not (
+                obsidian_bots * minutes_remaining + obsidian
                 >= minutes_remaining * max_obsidian
-            ):
-                buildable_bots.append(Bot.Obsidian)
-
-            if factory.can_build(Bot.Clay) and not (
-                bots[Bot.Clay] * minutes_remaining + factory.resources[Resource.Clay]
-                >= minutes_remaining * max_clay
-            ):
-                buildable_bots.append(Bot.Clay)
-
-            if factory.can_build(Bot.Ore) and not (
-                bots[Bot.Ore] * minutes_remaining + factory.resources[Resource.Ore]
-                >= minutes_remaining * max_ore
-            ):
-                buildable_bots.append(Bot.Ore)
+            )
+        )
+        build_clay_bot = (
+            not build_geode_bot
+            and ore >= clay_bot_ore
+            and not (
+                clay_bots * minutes_remaining + clay >= minutes_remaining * max_clay
+            )
+        )
+        build_ore_bot = (
+            not build_geode_bot
+            and ore >= ore_bot_ore
+            and not (ore_bots * minutes_remaining + ore >= minutes_remaining * max_ore)
+        )
 
         # Collect resources
-        factory.deposit(Resource.Ore, bots[Bot.Ore])
-        factory.deposit(Resource.Clay, bots[Bot.Clay])
-        factory.deposit(Resource.Obsidian, bots[Bot.Obsidian])
-        factory.deposit(Resource.Geode, bots[Bot.Geode])
+        ore += ore_bots
+        clay += clay_bots
+        obsidian += obsidian_bots
+        geodes += geode_bots
 
         # Stop following this path if there have been others who collected
         # more geodes by now.
@@ -583,37 +582,382 @@ def do_blueprint_run(blueprint) -> int:
         # army of Geode bots later on catch up? But this pruning method
         # seems to work well for our short runtime of 24 and 32
         # steps/minutes
-        if (
-            best_geode_count_at_time[minutes_remaining]
-            > factory.resources[Resource.Geode]
-        ):
+        if best_geode_count_at_time[minutes_remaining] > geodes:
             continue
-        best_geode_count_at_time[minutes_remaining] = factory.resources[Resource.Geode]
+        best_geode_count_at_time[minutes_remaining] = geodes
 
         # One path that we can always take is not building any bot at this time
-        queue.append((factory, bots, minutes_remaining - 1))
+        minutes_remaining -= 1
+        queue.append(
+            State(
+                minutes_remaining,
+                ore,
+                clay,
+                obsidian,
+                geodes,
+                ore_bots,
+                clay_bots,
+                obsidian_bots,
+                geode_bots,
+            )
+        )
 
         # Each bot that can be built signifies a new route that we can
         # take.
-        for bot in buildable_bots:
-            next_factory = deepcopy(factory)
-            next_bots = copy(bots)
+        if build_geode_bot:
+            queue.append(
+                State(
+                    minutes_remaining,
+                    ore - geode_bot_ore,
+                    clay,
+                    obsidian - geode_bot_obsidian,
+                    geodes,
+                    ore_bots,
+                    clay_bots,
+                    obsidian_bots,
+                    geode_bots + 1,
+                )
+            )
+        if build_obsidian_bot:
+            queue.append(
+                State(
+                    minutes_remaining,
+                    ore - obsidian_bot_ore,
+                    clay - obsidian_bot_clay,
+                    obsidian,
+                    geodes,
+                    ore_bots,
+                    clay_bots,
+                    obsidian_bots + 1,
+                    geode_bots,
+                )
+            )
+        if build_clay_bot:
+            queue.append(
+                State(
+                    minutes_remaining,
+                    ore - clay_bot_ore,
+                    clay,
+                    obsidian,
+                    geodes,
+                    ore_bots,
+                    clay_bots + 1,
+                    obsidian_bots,
+                    geode_bots,
+                )
+            )
+        if build_ore_bot:
+            queue.append(
+                State(
+                    minutes_remaining,
+                    ore - ore_bot_ore,
+                    clay,
+                    obsidian,
+                    geodes,
+                    ore_bots + 1,
+                    clay_bots,
+                    obsidian_bots,
+                    geode_bots,
+                )
+            )
+        instrument.maximum("queue size", len(queue))
+
+    return max_geodes_cracked
 
-            next_factory.build(bot)
-            next_bots[bot] += 1
 
-            queue.append((next_factory, next_bots, minutes_remaining - 1))
+@instrument.phase("search")
+def find_max_geodes(blueprint: Blueprint, minutes: int = TIME_LIMIT) -> int:
+    """Decides which bot to build next, instead of what to do every minute.
+    Every branch waits until there are enough resources for its bot and then
+    builds it, skipping over the minutes in between.
+
+    The geodes that a Geode bot is going to crack before the time runs out are
+    counted as soon as it's built, so the Geode bots themselves don't have to
+    be kept track of.
+    """
+    (
+        ore_bot_ore,
+        clay_bot_ore,
+        obsidian_bot_ore,
+        obsidian_bot_clay,
+        geode_bot_ore,
+        geode_bot_obsidian,
+    ) = blueprint
+
+    # Since we can only construct 1 bot per minute, it's no use to have more
+    # bots collecting a resource than the most expensive bot needs of it
+    max_ore_bots = max(ore_bot_ore, clay_bot_ore, obsidian_bot_ore, geode_bot_ore)
+    max_clay_bots = obsidian_bot_clay
+    max_obsidian_bots = geode_bot_obsidian
+
+    # Minutes remaining, the resources in stock, the bots that collect them
+    # and the geodes that will have been cracked in the end
+    stack = [(minutes, 0, 0, 0, 1, 0, 0, 0)]
+    max_geodes_cracked = 0
+
+    while stack:
+        (
+            minutes_remaining,
+            ore,
+            clay,
+            obsidian,
+            ore_bots,
+            clay_bots,
+            obsidian_bots,
+            geodes,
+        ) = stack.pop()
+        instrument.count("states expanded")
+
+        max_geodes_cracked = max(max_geodes_cracked, geodes)
+
+        # Can this path still beat the highest geode score so far, even if
+        # ore and clay were for free?
+        if (
+            most_geodes_possible(
+                minutes_remaining, obsidian, obsidian_bots, geodes, geode_bot_obsidian
+            )
+            <= max_geodes_cracked
+        ):
+            instrument.count("states pruned")
+            continue
+
+        # Every next bot takes the minutes it takes to collect the resources
+        # for it, plus 1 minute to build it. Bots that can't be built before
+        # the last minute wouldn't collect anything anymore. Neither would
+        # bots that collect more of a resource than can be spent.
+        if ore_bots * minutes_remaining + ore < max_ore_bots * minutes_remaining:
+            minutes_passed = minutes_to_collect(ore_bot_ore - ore, ore_bots) + 1
+            if minutes_passed < minutes_remaining:
+                stack.append(
+                    (
+                        minutes_remaining - minutes_passed,
+                        ore + ore_bots * minutes_passed - ore_bot_ore,
+                        clay + clay_bots * minutes_passed,
+                        obsidian + obsidian_bots * minutes_passed,
+                        ore_bots + 1,
+                        clay_bots,
+                        obsidian_bots,
+                        geodes,
+                    )
+                )
+
+        if clay_bots * minutes_remaining + clay < max_clay_bots * minutes_remaining:
+            minutes_passed = minutes_to_collect(clay_bot_ore - ore, ore_bots) + 1
+            if minutes_passed < minutes_remaining:
+                stack.append(
+                    (
+                        minutes_remaining - minutes_passed,
+                        ore + ore_bots * minutes_passed - clay_bot_ore,
+                        clay + clay_bots * minutes_passed,
+                        obsidian + obsidian_bots * minutes_passed,
+                        ore_bots,
+                        clay_bots + 1,
+                        obsidian_bots,
+                        geodes,
+                    )
+                )
+
+        if (
+            clay_bots
+            and obsidian_bots * minutes_remaining + obsidian
+            < max_obsidian_bots * minutes_remaining
+        ):
+            minutes_passed = (
+                max(
+                    minutes_to_collect(obsidian_bot_ore - ore, ore_bots),
+                    minutes_to_collect(obsidian_bot_clay - clay, clay_bots),
+                )
+                + 1
+            )
+            if minutes_passed < minutes_remaining:
+                stack.append(
+                    (
+                        minutes_remaining - minutes_passed,
+                        ore + ore_bots * minutes_passed - obsidian_bot_ore,
+                        clay + clay_bots * minutes_passed - obsidian_bot_clay,
+                        obsidian + obsidian_bots * minutes_passed,
+                        ore_bots,
+                        clay_bots,
+                        obsidian_bots + 1,
+                        geodes,
+                    )
+                )
+
+        # Geode bots go on the stack last, so they're tried first. That way a
+        # high geode score is found early on, and more paths can be pruned.
+        if obsidian_bots:
+            minutes_passed = (
+                max(
+                    minutes_to_collect(geode_bot_ore - ore, ore_bots),
+                    minutes_to_collect(geode_bot_obsidian - obsidian, obsidian_bots),
+                )
+                + 1
+            )
+            if minutes_passed < minutes_remaining:
+                stack.append(
+                    (
+                        minutes_remaining - minutes_passed,
+                        ore + ore_bots * minutes_passed - geode_bot_ore,
+                        clay + clay_bots * minutes_passed,
+                        obsidian + obsidian_bots * minutes_passed - geode_bot_obsidian,
+                        ore_bots,
+                        clay_bots,
+                        obsidian_bots,
+                        geodes + minutes_remaining - minutes_passed,
+                    )
+                )
+
+        instrument.maximum("queue size", len(stack))
 
     return max_geodes_cracked
 
 
-puzzle_input = open("../puzzle-input/day19-example-input.txt").readlines()
-# puzzle_input = open("../puzzle-input/day19-input.txt").readlines()
+def most_geodes_possible(
+    minutes_remaining: int,
+    obsidian: int,
+    obsidian_bots: int,
+    geodes: int,
+    geode_bot_obsidian: int,
+) -> int:
+    """Returns how many geodes could be cracked at most, if ore and clay were
+    for free: an Obsidian bot would be built every minute, and on top of that a
+    Geode bot whenever there's enough obsidian for one.
+    """
+    for minutes_left in range(minutes_remaining, 0, -1):
+        if obsidian >= geode_bot_obsidian:
+            obsidian -= geode_bot_obsidian
+            geodes += minutes_left - 1
+
+        obsidian += obsidian_bots
+        obsidian_bots += 1
+
+    return geodes
+
+
+def minutes_to_collect(amount: int, bots: int) -> int:
+    """Returns how many minutes it takes the bots to collect another `amount`
+    of a resource.
+    """
+    if amount <= 0:
+        return 0
+
+    return -(-amount // bots)
+
+
+def run_blueprint(
+    find_geodes: Callable[[Blueprint, int], int],
+    id_: int,
+    blueprint: Blueprint,
+    minutes: int,
+    record: bool,
+) -> BlueprintRun:
+    """Finds out how many geodes a blueprint can crack, either in this process
+    or in a worker process, and with `record` keeps track of the work that
+    took.
+    """
+    start = time.perf_counter()
+    if record:
+        with instrument.record() as recording:
+            geodes_cracked = find_geodes(blueprint, minutes)
+    else:
+        recording = None
+        geodes_cracked = find_geodes(blueprint, minutes)
+    seconds = time.perf_counter() - start
+
+    return BlueprintRun(id_, geodes_cracked, seconds, recording)
+
+
+def run_blueprints(
+    find_geodes: Callable[[Blueprint, int], int],
+    blueprints: list[tuple[int, Blueprint]],
+    minutes: int,
+    jobs: int,
+    record: bool,
+) -> Iterator[BlueprintRun]:
+    """Yields the runs of the blueprints as soon as they're done. Every
+    blueprint can be run on its own, so with more than 1 job they're spread
+    over a pool of worker processes, and complete in any order.
+    """
+    if jobs < 0:
+        raise Exception("Can't run %d jobs" % jobs)
+
+    if jobs == 1:
+        for id_, blueprint in blueprints:
+            yield run_blueprint(find_geodes, id_, blueprint, minutes, record)
+        return
+
+    # Only imported when needed, as it takes a while to import and most runs
+    # don't use it
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    num_workers = min(jobs or os.cpu_count(), len(blueprints))
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        futures = [
+            executor.submit(run_blueprint, find_geodes, id_, blueprint, minutes, record)
+            for id_, blueprint in blueprints
+        ]
+
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def print_blueprint_run(run: BlueprintRun):
+    # On stderr, so that stdout only holds the answer
+    states_expanded = run.recording.counters.get("states expanded", 0)
+    print(
+        "Blueprint %d: %d geodes, %.4f s, %d states expanded"
+        % (run.id_, run.geodes_cracked, run.seconds, states_expanded),
+        file=sys.stderr,
+    )
+
+
+def solve(
+    input_text: str,
+    minutes: int = TIME_LIMIT,
+    engine: str = "next-bot",
+    jobs: int = 1,
+    report: bool = False,
+) -> int:
+    """The engine is either "next-bot", which branches on the bot to build
+    next, or "minute-by-minute", which branches on what to do every minute.
+    The latter prunes too eagerly to find the best answer for the example.
+
+    With `jobs` the blueprints are run by that many worker processes, or by
+    one per CPU core with 0. Only three blueprints are run, so more than three
+    jobs won't help. With `report` the time each blueprint took and how many
+    states its search expanded are printed as well.
+    """
+    blueprints = zip(
+        count(start=1), parse_blueprints(input_text.splitlines(keepends=True))
+    )
+
+    match engine:
+        case "next-bot":
+            find_geodes = find_max_geodes
+        case "minute-by-minute":
+            find_geodes = do_blueprint_run
+        case _:
+            raise Exception("Unknown engine %s" % engine)
+
+    # Recording the searches slows them down, so they're only recorded when
+    # there's something to do with the recordings
+    record = report or instrument.is_recording()
+
+    # Only the first three blueprints survived the elephants' snack
+    geodes_product = 1
+    for run in run_blueprints(find_geodes, list(blueprints)[:3], minutes, jobs, record):
+        if run.recording is not None:
+            instrument.merge(run.recording)
+        if report:
+            print_blueprint_run(run)
+
+        geodes_product *= run.geodes_cracked
+
+    return geodes_product
 
-blueprints = zip(count(start=1), parse_blueprints(puzzle_input))
 
-max_geodes_cracked = 0
-for id_, blueprint in list(blueprints)[:3]:
-    max_geodes_cracked = max(do_blueprint_run(blueprint), max_geodes_cracked)
+if __name__ == "__main__":
+    # input_text = open("../puzzle-input/day19-example-input.txt").read()
+    input_text = open("../puzzle-input/day19-input.txt").read()
 
-print(max_geodes_cracked)
+    print(solve(input_text))
@@ -79,6 +79,8 @@ Following the Elf's instructions for the second column, what would your total
 score be if everything goes exactly according to your strategy guide?
 """
 
+from collections.abc import Iterable
+
 
 class HandShape:
     ROCK = 1
@@ -93,42 +95,53 @@ class DesiredOutcome:
 
 
 SYMBOL_MAP = {
-    "A": HandShape.ROCK,
-    "B": HandShape.PAPER,
-    "C": HandShape.SCISSORS,
-    "X": DesiredOutcome.LOSE,
-    "Y": DesiredOutcome.DRAW,
-    "Z": DesiredOutcome.WIN,
+    b"A": HandShape.ROCK,
+    b"B": HandShape.PAPER,
+    b"C": HandShape.SCISSORS,
+    b"X": DesiredOutcome.LOSE,
+    b"Y": DesiredOutcome.DRAW,
+    b"Z": DesiredOutcome.WIN,
 }
 
 
-# rounds = open('../puzzle-input/day2-example-input.txt').readlines()
-rounds = open("../puzzle-input/day2-input.txt").readlines()
-
-total_score = 0
-for round_ in rounds:
-    enemy_move, req_outcome = map(lambda s: SYMBOL_MAP[s], round_.split())
-
-    if req_outcome == DesiredOutcome.WIN:
-        # Winning moves
-        match enemy_move:
-            case HandShape.ROCK:
-                total_score += HandShape.PAPER + 6
-            case HandShape.PAPER:
-                total_score += HandShape.SCISSORS + 6
-            case HandShape.SCISSORS:
-                total_score += HandShape.ROCK + 6
-    elif req_outcome == DesiredOutcome.DRAW:
-        total_score += enemy_move + 3
-    # Loss
-    else:
-        # Losing moves
-        match enemy_move:
-            case HandShape.ROCK:
-                total_score += HandShape.SCISSORS
-            case HandShape.PAPER:
-                total_score += HandShape.ROCK
-            case HandShape.SCISSORS:
-                total_score += HandShape.PAPER
-
-print(total_score)
+def solve(input_text: str) -> int:
+    return solve_lines(input_text.encode().splitlines())
+
+
+def solve_lines(rounds: Iterable[bytes]) -> int:
+    total_score = 0
+    for round_ in rounds:
+        enemy_move, req_outcome = map(lambda s: SYMBOL_MAP[s], round_.split())
+
+        if req_outcome == DesiredOutcome.WIN:
+            # Winning moves
+            match enemy_move:
+                case HandShape.ROCK:
+                    total_score += HandShape.PAPER + 6
+                case HandShape.PAPER:
+                    total_score += HandShape.SCISSORS + 6
+                case HandShape.SCISSORS:
+                    total_score += HandShape.ROCK + 6
+        elif req_outcome == DesiredOutcome.DRAW:
+            total_score += enemy_move + 3
+        # Loss
+        else:
+            # Losing moves
+            match enemy_move:
+                case HandShape.ROCK:
+                    total_score += HandShape.SCISSORS
+                case HandShape.PAPER:
+                    total_score += HandShape.ROCK
+                case HandShape.SCISSORS:
+                    total_score += HandShape.PAPER
+
+    return total_score
+
+
+if __name__ == "__main__":
+    from puzzle_input import PuzzleInput
+
+    # puzzle_input = PuzzleInput("../puzzle-input/day2-example-input.txt")
+    puzzle_input = PuzzleInput("../puzzle-input/day2-input.txt")
+
+    print(solve_lines(puzzle_input))
@@ -54,6 +54,8 @@ What would your total score be if everything goes exactly according to your
 strategy guide?
 """
 
+from collections.abc import Iterable
+
 
 class HandShape:
     ROCK = 1
@@ -62,35 +64,46 @@ class HandShape:
 
 
 SYMBOL_MAP = {
-    "A": HandShape.ROCK,
-    "B": HandShape.PAPER,
-    "C": HandShape.SCISSORS,
-    "X": HandShape.ROCK,
-    "Y": HandShape.PAPER,
-    "Z": HandShape.SCISSORS,
+    b"A": HandShape.ROCK,
+    b"B": HandShape.PAPER,
+    b"C": HandShape.SCISSORS,
+    b"X": HandShape.ROCK,
+    b"Y": HandShape.PAPER,
+    b"Z": HandShape.SCISSORS,
 }
 
 
-# rounds = open('../puzzle-input/day2-example-input.txt').readlines()
-rounds = open("../puzzle-input/day2-input.txt").readlines()
+def solve(input_text: str) -> int:
+    return solve_lines(input_text.encode().splitlines())
+
+
+def solve_lines(rounds: Iterable[bytes]) -> int:
+    total_score = 0
+    for round_ in rounds:
+        enemy_move, your_move = map(lambda s: SYMBOL_MAP[s], round_.strip().split())
+
+        # Winning moves
+        if (
+            (enemy_move == HandShape.ROCK and your_move == HandShape.PAPER)
+            or (enemy_move == HandShape.PAPER and your_move == HandShape.SCISSORS)
+            or (enemy_move == HandShape.SCISSORS and your_move == HandShape.ROCK)
+        ):
+
+            total_score += your_move + 6
+        # Tie
+        elif enemy_move == your_move:
+            total_score += your_move + 3
+        # Loss
+        else:
+            total_score += your_move
+
+    return total_score
 
-total_score = 0
-for round_ in rounds:
-    enemy_move, your_move = map(lambda s: SYMBOL_MAP[s], round_.strip().split())
 
-    # Winning moves
-    if (
-        (enemy_move == HandShape.ROCK and your_move == HandShape.PAPER)
-        or (enemy_move == HandShape.PAPER and your_move == HandShape.SCISSORS)
-        or (enemy_move == HandShape.SCISSORS and your_move == HandShape.ROCK)
-    ):
+if __name__ == "__main__":
+    from puzzle_input import PuzzleInput
 
-        total_score += your_move + 6
-    # Tie
-    elif enemy_move == your_move:
-        total_score += your_move + 3
-    # Loss
-    else:
-        total_score += your_move
+    # puzzle_input = PuzzleInput("../puzzle-input/day2-example-input.txt")
+    puzzle_input = PuzzleInput("../puzzle-input/day2-input.txt")
 
-print(total_score)
+    print(solve_lines(puzzle_input))
@@ -138,48 +138,61 @@ from collections import deque
 from copy import copy
 from itertools import count
 
+import instrument
+
 
 DECRYPTION_KEY = 811589153
 NUM_ROUNDS = 10
 
-# encrypted_coordinates = list(map(lambda n: int(n) * DECRYPTION_KEY, open("../puzzle-input/day20-example-input.txt").readlines()))
-encrypted_coordinates = list(
-    map(
-        lambda n: int(n) * DECRYPTION_KEY,
-        open("../puzzle-input/day20-input.txt").readlines(),
+
+def solve(input_text: str) -> int:
+    encrypted_coordinates = list(
+        map(
+            lambda n: int(n) * DECRYPTION_KEY,
+            input_text.splitlines(keepends=True),
+        )
     )
-)
 
-num_encrypted_coordinates = len(encrypted_coordinates)
-shift_values = copy(encrypted_coordinates)
-mixed_coordinates = deque(list(zip(count(), encrypted_coordinates)))
+    num_encrypted_coordinates = len(encrypted_coordinates)
+    shift_values = copy(encrypted_coordinates)
+    mixed_coordinates = deque(list(zip(count(), encrypted_coordinates)))
+
+    # Numbers that are 0 stay where they are
+    num_moving_numbers = sum(1 for shift_by in shift_values if shift_by != 0)
+
+    with instrument.phase("simulate"):
+        for _ in range(NUM_ROUNDS):
+            instrument.count("rounds")
+            instrument.count("numbers moved", num_moving_numbers)
+            for original_index, shift_by in enumerate(shift_values):
+                if shift_by == 0:
+                    continue
 
-for _ in range(NUM_ROUNDS):
-    for original_index, shift_by in enumerate(shift_values):
-        if shift_by == 0:
-            continue
+                entry = (original_index, shift_by)
 
-        entry = (original_index, shift_by)
+                mixed_position = mixed_coordinates.index(entry)
+                new_index = (mixed_position + shift_by) % (
+                    num_encrypted_coordinates - 1
+                )
+                if new_index == 0:
+                    new_index = num_encrypted_coordinates - 1
 
-        mixed_position = mixed_coordinates.index(entry)
-        new_index = (mixed_position + shift_by) % (num_encrypted_coordinates - 1)
-        if new_index == 0:
-            new_index = num_encrypted_coordinates - 1
+                mixed_coordinates.remove(entry)
+                mixed_coordinates.rotate(-new_index)
+                mixed_coordinates.appendleft(entry)
+                mixed_coordinates.rotate(new_index)
 
-        mixed_coordinates.remove(entry)
-        mixed_coordinates.rotate(-new_index)
-        mixed_coordinates.appendleft(entry)
-        mixed_coordinates.rotate(new_index)
+    numbers = [n[1] for n in mixed_coordinates]
+    zero_index = numbers.index(0)
+    num_1k = numbers[(zero_index + 1000) % num_encrypted_coordinates]
+    num_2k = numbers[(zero_index + 2000) % num_encrypted_coordinates]
+    num_3k = numbers[(zero_index + 3000) % num_encrypted_coordinates]
 
-        if num_encrypted_coordinates == 7:
-            numbers = [n[1] for n in mixed_coordinates]
-            print(numbers)
+    return num_1k + num_2k + num_3k
 
 
-numbers = [n[1] for n in mixed_coordinates]
-zero_index = numbers.index(0)
-num_1k = numbers[(zero_index + 1000) % num_encrypted_coordinates]
-num_2k = numbers[(zero_index + 2000) % num_encrypted_coordinates]
-num_3k = numbers[(zero_index + 3000) % num_encrypted_coordinates]
+if __name__ == "__main__":
+    # input_text = open("../puzzle-input/day20-example-input.txt").read()
+    input_text = open("../puzzle-input/day20-input.txt").read()
 
-print(num_1k + num_2k + num_3k)
+    print(solve(input_text))
@@ -81,40 +81,40 @@ from copy import copy
 from itertools import count
 
 
-# encrypted_coordinates = list(map(int, open("../puzzle-input/day20-example-input.txt").readlines()))
-encrypted_coordinates = list(
-    map(int, open("../puzzle-input/day20-input.txt").readlines())
-)
+def solve(input_text: str) -> int:
+    encrypted_coordinates = list(map(int, input_text.splitlines(keepends=True)))
 
-num_encrypted_coordinates = len(encrypted_coordinates)
-shift_values = copy(encrypted_coordinates)
-mixed_coordinates = deque(list(zip(count(), encrypted_coordinates)))
+    num_encrypted_coordinates = len(encrypted_coordinates)
+    shift_values = copy(encrypted_coordinates)
+    mixed_coordinates = deque(list(zip(count(), encrypted_coordinates)))
 
-for original_index, shift_by in enumerate(shift_values):
-    if shift_by == 0:
-        continue
+    for original_index, shift_by in enumerate(shift_values):
+        if shift_by == 0:
+            continue
 
-    entry = (original_index, shift_by)
+        entry = (original_index, shift_by)
 
-    mixed_position = mixed_coordinates.index(entry)
-    new_index = (mixed_position + shift_by) % (num_encrypted_coordinates - 1)
-    if new_index == 0:
-        new_index = num_encrypted_coordinates - 1
+        mixed_position = mixed_coordinates.index(entry)
+        new_index = (mixed_position + shift_by) % (num_encrypted_coordinates - 1)
+        if new_index == 0:
+            new_index = num_encrypted_coordinates - 1
 
-    mixed_coordinates.remove(entry)
-    mixed_coordinates.rotate(-new_index)
-    mixed_coordinates.appendleft(entry)
-    mixed_coordinates.rotate(new_index)
+        mixed_coordinates.remove(entry)
+        mixed_coordinates.rotate(-new_index)
+        mixed_coordinates.appendleft(entry)
+        mixed_coordinates.rotate(new_index)
 
-    if num_encrypted_coordinates == 7:
-        numbers = [n[1] for n in mixed_coordinates]
-        print(numbers)
+    numbers = [n[1] for n in mixed_coordinates]
+    zero_index = numbers.index(0)
+    num_1k = numbers[(zero_index + 1000) % num_encrypted_coordinates]
+    num_2k = numbers[(zero_index + 2000) % num_encrypted_coordinates]
+    num_3k = numbers[(zero_index + 3000) % num_encrypted_coordinates]
 
+    return num_1k + num_2k + num_3k
 
-numbers = [n[1] for n in mixed_coordinates]
-zero_index = numbers.index(0)
-num_1k = numbers[(zero_index + 1000) % num_encrypted_coordinates]
-num_2k = numbers[(zero_index + 2000) % num_encrypted_coordinates]
-num_3k = numbers[(zero_index + 3000) % num_encrypted_coordinates]
 
-print(num_1k + num_2k + num_3k)
+if __name__ == "__main__":
+    # input_text = open("../puzzle-input/day20-example-input.txt").read()
+    input_text = open("../puzzle-input/day20-input.txt").read()
+
+    print(solve(input_text))
@@ -164,26 +164,33 @@ def resolve_value(monkey: Monkey) -> int | complex:
     return monkey.resolved_value
 
 
-# monkey_data = open("../puzzle-input/day21-example-input.txt").readlines()
-monkey_data = open("../puzzle-input/day21-input.txt").readlines()
+def solve(input_text: str) -> int:
+    monkey_data = input_text.splitlines(keepends=True)
 
-monkeys = parse_monkeys(monkey_data)
-root = monkeys["root"]
-dependency_1 = root.dependencies[0]
-dependency_2 = root.dependencies[1]
+    monkeys = parse_monkeys(monkey_data)
+    root = monkeys["root"]
+    dependency_1 = root.dependencies[0]
+    dependency_2 = root.dependencies[1]
 
-res1 = resolve_value(dependency_1)
-res2 = resolve_value(dependency_2)
+    res1 = resolve_value(dependency_1)
+    res2 = resolve_value(dependency_2)
 
-# Apparently this works because of complex number magic
-solution = int((res1.real - res2.real) / (res2.imag - res1.imag))
+    # Apparently this works because of complex number magic
+    solution = int((res1.real - res2.real) / (res2.imag - res1.imag))
 
-# Reset the monkey data so any calculated (i.e. cache) values are erased
-monkeys = parse_monkeys(monkey_data)
-monkeys["humn"].resolved_value = solution
+    # Reset the monkey data so any calculated (i.e. cache) values are erased
+    monkeys = parse_monkeys(monkey_data)
+    monkeys["humn"].resolved_value = solution
 
-# It should pass the assertion for equality now
-root = monkeys["root"]
-resolve_value(root)
+    # It should pass the assertion for equality now
+    root = monkeys["root"]
+    resolve_value(root)
 
-print(solution)
+    return solution
+
+
+if __name__ == "__main__":
+    # input_text = open("../puzzle-input/day21-example-input.txt").read()
+    input_text = open("../puzzle-input/day21-input.txt").read()
+
+    print(solve(input_text))
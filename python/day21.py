@@ -62,16 +62,14 @@ However, your actual situation involves considerably more monkeys. What number
 will the monkey named root yell?
 """
 
-from typing import Optional
-
 
 class Monkey:
     def __init__(
         self, *, resolved_value=None, dependencies=None, operation=None
     ) -> None:
-        self.resolved_value: Optional[int] = resolved_value
-        self.dependencies: Optional[tuple[str, str]] = dependencies
-        self.operation: Optional[str] = operation
+        self.resolved_value: int | None = resolved_value
+        self.dependencies: tuple[str, str] | None = dependencies
+        self.operation: str | None = operation
 
     def __repr__(self) -> str:
         return " ".join(
@@ -129,8 +127,14 @@ def resolve_value(monkey: Monkey, monkeys: dict[str, Monkey]) -> int:
     return monkey.resolved_value
 
 
-# monkey_data = open("../puzzle-input/day21-example-input.txt").readlines()
-monkey_data = open("../puzzle-input/day21-input.txt").readlines()
-monkeys = parse_monkeys(monkey_data)
+def solve(input_text: str) -> int:
+    monkeys = parse_monkeys(input_text.splitlines(keepends=True))
+
+    return resolve_value(monkeys["root"], monkeys)
+
+
+if __name__ == "__main__":
+    # input_text = open("../puzzle-input/day21-example-input.txt").read()
+    input_text = open("../puzzle-input/day21-input.txt").read()
 
-print(resolve_value(monkeys["root"], monkeys))
+    print(solve(input_text))
@@ -261,37 +261,44 @@ def parse_map(lines: list[str]) -> Map:
     return map
 
 
-# puzzle_input = open("../puzzle-input/day22-example-input.txt").readlines()
-puzzle_input = open("../puzzle-input/day22-input.txt").readlines()
-
-steps = parse_steps(puzzle_input[-1])
-map = parse_map(puzzle_input[:-1])
-
-assert map.rows[0][0].type is not CellType.Wall
-current_cell = map.rows[0][0]
-current_direction = Direction.RIGHT
-
-for step in steps:
-    if type(step) is int:
-        # Take X steps in the current direction (or until we hit a wall)
-        for _ in range(step):
-            if current_cell.neighbours[current_direction].type is CellType.Wall:
-                break
-
-            current_cell = current_cell.neighbours[current_direction]
-    elif step == "R":
-        current_direction = current_direction.turn_right()
-    elif step == "L":
-        current_direction = current_direction.turn_left()
-    else:
-        raise Exception("Unknown instruction")
-
-direction_value = (
-    3 if current_direction is Direction.UP else (current_direction.value // 90) - 1
-)
-password = (
-    1000 * (current_cell.coordinates.y + 1)
-    + 4 * (current_cell.coordinates.x + 1)
-    + direction_value
-)
-print(password)
+def solve(input_text: str) -> int:
+    puzzle_input = input_text.splitlines(keepends=True)
+
+    steps = parse_steps(puzzle_input[-1])
+    map = parse_map(puzzle_input[:-1])
+
+    assert map.rows[0][0].type is not CellType.Wall
+    current_cell = map.rows[0][0]
+    current_direction = Direction.RIGHT
+
+    for step in steps:
+        if type(step) is int:
+            # Take X steps in the current direction (or until we hit a wall)
+            for _ in range(step):
+                if current_cell.neighbours[current_direction].type is CellType.Wall:
+                    break
+
+                current_cell = current_cell.neighbours[current_direction]
+        elif step == "R":
+            current_direction = current_direction.turn_right()
+        elif step == "L":
+            current_direction = current_direction.turn_left()
+        else:
+            raise Exception("Unknown instruction")
+
+    direction_value = (
+        3 if current_direction is Direction.UP else (current_direction.value // 90) - 1
+    )
+    password = (
+        1000 * (current_cell.coordinates.y + 1)
+        + 4 * (current_cell.coordinates.x + 1)
+        + direction_value
+    )
+    return password
+
+
+if __name__ == "__main__":
+    # input_text = open("../puzzle-input/day22-example-input.txt").read()
+    input_text = open("../puzzle-input/day22-input.txt").read()
+
+    print(solve(input_text))
@@ -276,6 +276,8 @@ where no Elf moves?
 from collections import namedtuple
 from enum import Enum
 
+import instrument
+
 
 NUM_ROUNDS = 10
 
@@ -293,6 +295,7 @@ class Direction(Enum):
     West = Coordinates(-1, 0)
 
 
+@instrument.phase("parse")
 def parse_grove(lines: list[str]) -> set[Coordinates]:
     elves = set()
 
@@ -306,97 +309,103 @@ def parse_grove(lines: list[str]) -> set[Coordinates]:
     return elves
 
 
-# In order of which direction the elves will consider first
-scan_directions = [
-    Direction.North,
-    Direction.South,
-    Direction.West,
-    Direction.East,
-]
-
-# grove = open("../puzzle-input/day23-example-input.txt").readlines()
-grove = open("../puzzle-input/day23-input.txt").readlines()
-
-elves = parse_grove(grove)
-
-for round_number in range(1, 1_000_000):
-    new_elf_positions: dict[Coordinates, Coordinates] = {}
-    stationary_elves = set()
-
-    for elf in elves:
-        # First, check if all the adjacent positions next to this elf are free
-        # at the moment
-        alone = True
-        for x in [-1, 0, 1]:
-            for y in [-1, 0, 1]:
-                if x == 0 and y == 0:
-                    continue
-
-                if Coordinates(elf.x + x, elf.y + y) in elves:
-                    alone = False
+def solve(input_text: str) -> int:
+    # In order of which direction the elves will consider first
+    scan_directions = [
+        Direction.North,
+        Direction.South,
+        Direction.West,
+        Direction.East,
+    ]
+
+    elves = parse_grove(input_text.splitlines(keepends=True))
+
+    for round_number in range(1, 1_000_000):
+        instrument.count("rounds")
+        new_elf_positions: dict[Coordinates, Coordinates] = {}
+        stationary_elves = set()
+
+        for elf in elves:
+            # First, check if all the adjacent positions next to this elf are free
+            # at the moment
+            alone = True
+            for x in [-1, 0, 1]:
+                for y in [-1, 0, 1]:
+                    if x == 0 and y == 0:
+                        continue
+
+                    if Coordinates(elf.x + x, elf.y + y) in elves:
+                        alone = False
+                        break
+
+                if not alone:
                     break
 
-            if not alone:
-                break
+            if alone:
+                stationary_elves.add(elf)
+                continue
 
-        if alone:
-            stationary_elves.add(elf)
-            continue
+            for direction in scan_directions:
+                found_empty_spot = True
 
-        for direction in scan_directions:
-            found_empty_spot = True
+                for delta in [-1, 0, 1]:
+                    match direction:
+                        case Direction.North:
+                            coordinates_to_check = Coordinates(elf.x + delta, elf.y - 1)
 
-            for delta in [-1, 0, 1]:
-                match direction:
-                    case Direction.North:
-                        coordinates_to_check = Coordinates(elf.x + delta, elf.y - 1)
+                        case Direction.East:
+                            coordinates_to_check = Coordinates(elf.x + 1, elf.y + delta)
 
-                    case Direction.East:
-                        coordinates_to_check = Coordinates(elf.x + 1, elf.y + delta)
+                        case Direction.South:
+                            coordinates_to_check = Coordinates(elf.x + delta, elf.y + 1)
 
-                    case Direction.South:
-                        coordinates_to_check = Coordinates(elf.x + delta, elf.y + 1)
+                        case Direction.West:
+                            coordinates_to_check = Coordinates(elf.x - 1, elf.y + delta)
 
-                    case Direction.West:
-                        coordinates_to_check = Coordinates(elf.x - 1, elf.y + delta)
+                    if coordinates_to_check in elves:
+                        found_empty_spot = False
+                        break
 
-                if coordinates_to_check in elves:
-                    found_empty_spot = False
-                    break
+                if not found_empty_spot:
+                    continue
 
-            if not found_empty_spot:
-                continue
+                new_position = Coordinates(
+                    elf.x + direction.value.x, elf.y + direction.value.y
+                )
 
-            new_position = Coordinates(
-                elf.x + direction.value.x, elf.y + direction.value.y
-            )
+                if new_position in new_elf_positions:
+                    # Two elves want to move to the same spot, cancel both their
+                    # movements
+                    stationary_elves.add(new_elf_positions[new_position])
+                    stationary_elves.add(elf)
+                    del new_elf_positions[new_position]
+                else:
+                    new_elf_positions[new_position] = elf
 
-            if new_position in new_elf_positions:
-                # Two elves want to move to the same spot, cancel both their
-                # movements
-                stationary_elves.add(new_elf_positions[new_position])
-                stationary_elves.add(elf)
-                del new_elf_positions[new_position]
+                break
             else:
-                new_elf_positions[new_position] = elf
+                # Didn't find any empty spot to move to
+                stationary_elves.add(elf)
 
+        # Build a new list of elves with their (possibly updated) positions
+        num_elves = len(elves)
+        elves = set(new_elf_positions.keys())
+        elves.update(stationary_elves)
+        # Head count. Did we lose any elves?
+        assert len(elves) == num_elves
+
+        # Did anyone move?
+        if not new_elf_positions:
             break
-        else:
-            # Didn't find any empty spot to move to
-            stationary_elves.add(elf)
 
-    # Build a new list of elves with their (possibly updated) positions
-    num_elves = len(elves)
-    elves = set(new_elf_positions.keys())
-    elves.update(stationary_elves)
-    # Head count. Did we lose any elves?
-    assert len(elves) == num_elves
+        # Rotate scan directions
+        scan_directions = scan_directions[1:] + scan_directions[:1]
+
+    return round_number
 
-    # Did anyone move?
-    if not new_elf_positions:
-        break
 
-    # Rotate scan directions
-    scan_directions = scan_directions[1:] + scan_directions[:1]
+if __name__ == "__main__":
+    # input_text = open("../puzzle-input/day23-example-input.txt").read()
+    input_text = open("../puzzle-input/day23-input.txt").read()
 
-print(round_number)
+    print(solve(input_text))
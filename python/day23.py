@@ -253,6 +253,8 @@ Elves after 10 rounds. How many empty ground tiles does that rectangle contain?
 from collections import namedtuple
 from enum import Enum
 
+import instrument
+
 
 NUM_ROUNDS = 10
 
@@ -270,6 +272,7 @@ class Direction(Enum):
     West = Coordinates(-1, 0)
 
 
+@instrument.phase("parse")
 def parse_grove(lines: list[str]) -> set[Coordinates]:
     elves = set()
 
@@ -323,98 +326,101 @@ def elf_area(elves: set[Coordinates]) -> tuple[Coordinates, Coordinates]:
     return (top_left, bottom_right)
 
 
-# In order of which direction the elves will consider first
-scan_directions = [
-    Direction.North,
-    Direction.South,
-    Direction.West,
-    Direction.East,
-]
+def solve(input_text: str) -> int:
+    # In order of which direction the elves will consider first
+    scan_directions = [
+        Direction.North,
+        Direction.South,
+        Direction.West,
+        Direction.East,
+    ]
+
+    elves = parse_grove(input_text.splitlines(keepends=True))
+
+    for round_number in range(1, NUM_ROUNDS + 1):
+        instrument.count("rounds")
+        new_elf_positions: dict[Coordinates, Coordinates] = {}
+        stationary_elves = set()
+
+        for elf in elves:
+            # First, check if all the adjacent positions next to this elf are free
+            # at the moment
+            alone = True
+            for x in [-1, 0, 1]:
+                for y in [-1, 0, 1]:
+                    if x == 0 and y == 0:
+                        continue
+
+                    if Coordinates(elf.x + x, elf.y + y) in elves:
+                        alone = False
+                        break
+
+                if not alone:
+                    break
 
-# grove = open("../puzzle-input/day23-example-input.txt").readlines()
-grove = open("../puzzle-input/day23-input.txt").readlines()
+            if alone:
+                stationary_elves.add(elf)
+                continue
 
-elves = parse_grove(grove)
+            for direction in scan_directions:
+                found_empty_spot = True
 
-print("== Initial State ==")
-print_elf_positions(elves)
+                for delta in [-1, 0, 1]:
+                    match direction:
+                        case Direction.North:
+                            coordinates_to_check = Coordinates(elf.x + delta, elf.y - 1)
 
-for round_number in range(1, NUM_ROUNDS + 1):
-    new_elf_positions: dict[Coordinates, Coordinates] = {}
-    stationary_elves = set()
+                        case Direction.East:
+                            coordinates_to_check = Coordinates(elf.x + 1, elf.y + delta)
 
-    for elf in elves:
-        # First, check if all the adjacent positions next to this elf are free
-        # at the moment
-        alone = True
-        for x in [-1, 0, 1]:
-            for y in [-1, 0, 1]:
-                if x == 0 and y == 0:
-                    continue
+                        case Direction.South:
+                            coordinates_to_check = Coordinates(elf.x + delta, elf.y + 1)
 
-                if Coordinates(elf.x + x, elf.y + y) in elves:
-                    alone = False
-                    break
+                        case Direction.West:
+                            coordinates_to_check = Coordinates(elf.x - 1, elf.y + delta)
 
-            if not alone:
-                break
+                    if coordinates_to_check in elves:
+                        found_empty_spot = False
+                        break
 
-        if alone:
-            stationary_elves.add(elf)
-            continue
+                if not found_empty_spot:
+                    continue
 
-        for direction in scan_directions:
-            found_empty_spot = True
+                new_position = Coordinates(
+                    elf.x + direction.value.x, elf.y + direction.value.y
+                )
 
-            for delta in [-1, 0, 1]:
-                match direction:
-                    case Direction.North:
-                        coordinates_to_check = Coordinates(elf.x + delta, elf.y - 1)
+                if new_position in new_elf_positions:
+                    # Two elves want to move to the same spot, cancel both their
+                    # movements
+                    stationary_elves.add(new_elf_positions[new_position])
+                    stationary_elves.add(elf)
+                    del new_elf_positions[new_position]
+                else:
+                    new_elf_positions[new_position] = elf
 
-                    case Direction.East:
-                        coordinates_to_check = Coordinates(elf.x + 1, elf.y + delta)
+                break
+            else:
+                # Didn't find any empty spot to move to
+                stationary_elves.add(elf)
 
-                    case Direction.South:
-                        coordinates_to_check = Coordinates(elf.x + delta, elf.y + 1)
+        # Build a new list of elves with their (possibly updated) positions
+        num_elves = len(elves)
+        elves = set(new_elf_positions.keys())
+        elves.update(stationary_elves)
+        # Head count. Did we lose any elves?
+        assert len(elves) == num_elves
 
-                    case Direction.West:
-                        coordinates_to_check = Coordinates(elf.x - 1, elf.y + delta)
+        # Rotate scan directions
+        scan_directions = scan_directions[1:] + scan_directions[:1]
 
-                if coordinates_to_check in elves:
-                    found_empty_spot = False
-                    break
+    area = elf_area(elves)
+    num_tiles = (1 + area[1].x - area[0].x) * (1 + area[1].y - area[0].y)
+    return num_tiles - len(elves)
 
-            if not found_empty_spot:
-                continue
 
-            new_position = Coordinates(
-                elf.x + direction.value.x, elf.y + direction.value.y
-            )
+if __name__ == "__main__":
+    # input_text = open("../puzzle-input/day23-example-input.txt").read()
+    input_text = open("../puzzle-input/day23-input.txt").read()
 
-            if new_position in new_elf_positions:
-                # Two elves want to move to the same spot, cancel both their
-                # movements
-                stationary_elves.add(new_elf_positions[new_position])
-                stationary_elves.add(elf)
-                del new_elf_positions[new_position]
-            else:
-                new_elf_positions[new_position] = elf
-
-            break
-        else:
-            # Didn't find any empty spot to move to
-            stationary_elves.add(elf)
-
-    # Build a new list of elves with their (possibly updated) positions
-    num_elves = len(elves)
-    elves = set(new_elf_positions.keys())
-    elves.update(stationary_elves)
-    # Head count. Did we lose any elves?
-    assert len(elves) == num_elves
-
-    # Rotate scan directions
-    scan_directions = scan_directions[1:] + scan_directions[:1]
-
-area = elf_area(elves)
-num_tiles = (1 + area[1].x - area[0].x) * (1 + area[1].y - area[0].y)
-print(num_tiles - len(elves))
+    print(solve(input_text))
@@ -271,13 +271,16 @@ the goal?
 """
 
 from collections import defaultdict, namedtuple
+from math import lcm
 from heapq import heappush, heappop
 
+import instrument
+
 
 Point = namedtuple("Point", ["x", "y"])
 Size = namedtuple("Size", ["width", "height"])
-Blizzard = namedtuple("Blizzard", ["position", "direction"])
-Step = namedtuple("Step", ["position", "minute", "map_variation_idx"])
+# Where the expedition is at a given minute of a route
+Step = namedtuple("Step", ["position", "minute"])
 
 
 class Symbol:
@@ -300,30 +303,80 @@ class Direction:
 
 
 class Map:
-    """A map of the basin, with all blizzards and where they are located at a
-    given minute.
+    """A map of the basin, and where the blizzards are located at any given
+    minute.
+
+    Since the blizzards simply wrap around when hitting a wall, every row of
+    blizzards going left or right is back where it started after as many
+    minutes as the basin is wide, and every column of blizzards going up or
+    down after as many minutes as it is high. The blizzards as a whole are
+    therefore back where they started after the least common multiple of both,
+    the period.
+
+    The blizzards are kept as a bitmask per row and per direction, of where they
+    were at the start, with bit x for column x. Where they are at any other
+    minute follows from that: the ones going left or right are rotated within
+    their row, and the ones going up or down are those that started that many
+    rows away.
     """
 
     def __init__(
-        self, size: Size, entrance: Point, exit: Point, blizzards: list[Blizzard]
+        self,
+        size: Size,
+        entrance: Point,
+        exit: Point,
+        blizzard_rows: dict[Point, list[int]],
     ) -> None:
         self.size = size
         self.entrance = entrance
         self.exit = exit
-        self.blizzards = blizzards
+        self.blizzard_rows = blizzard_rows
+
+        self.inner_size = Size(size.width - 2, size.height - 2)
+        self.period = lcm(*self.inner_size)
 
-        self._cache_blizzard_positions()
+        # The positions of the blizzards at each minute of the period that has
+        # been looked at so far, as a bitmask per row
+        self._blizzards_per_minute: dict[int, list[int]] = {}
 
-    def _cache_blizzard_positions(self):
-        """Builds a set of positions (`Point`) that contain at least one
-        blizzard, speeds up checks of if a certain Coordinate is occupied from
-        O(N) to O(1).
+    def blizzards_at(self, minute: int) -> list[int]:
+        """Returns a bitmask per row of the positions that contain at least one
+        blizzard at the given minute. Once a minute has been worked out, this
+        is a lookup for it and every minute a multiple of the period later.
         """
-        self.blizzard_positions = set([b.position for b in self.blizzards])
+        minute %= self.period
+
+        blizzards = self._blizzards_per_minute.get(minute)
+        if blizzards is None:
+            blizzards = [
+                self._blizzards_in_row(y, minute) for y in range(self.size.height)
+            ]
+            self._blizzards_per_minute[minute] = blizzards
+
+        return blizzards
+
+    def _blizzards_in_row(self, y: int, minute: int) -> int:
+        # There are no blizzards in the walls at the top and bottom
+        if not 0 < y < self.size.height - 1:
+            return 0
+
+        inner_width, inner_height = self.inner_size
+        # The rows without the walls, so that y = 0 is the first row inside them
+        inner_y = y - 1
+
+        blizzards = (
+            rotate(self.blizzard_rows[Direction.RIGHT][y], minute, inner_width)
+            | rotate(self.blizzard_rows[Direction.LEFT][y], -minute, inner_width)
+            | self.blizzard_rows[Direction.DOWN][(inner_y - minute) % inner_height + 1]
+            | self.blizzard_rows[Direction.UP][(inner_y + minute) % inner_height + 1]
+        )
 
-    def is_accessible(self, position: Point) -> bool:
+        # Bit 0 is the wall to the left
+        return blizzards << 1
+
+    def is_accessible(self, position: Point, minute: int) -> bool:
         """Is the given position free to go to, or is it occupied by either a
-        wall or a blizzard?
+        wall or a blizzard at the given minute?
         """
 
         # Don't go out of bounds
@@ -343,7 +396,7 @@ class Map:
         if self.is_wall(position):
             return False
 
-        if position in self.blizzard_positions:
+        if self.blizzards_at(minute)[position.y] >> position.x & 1:
             return False
 
         return True
@@ -360,14 +413,27 @@ class Map:
         return False
 
 
+def rotate(bits: int, shift: int, width: int) -> int:
+    """Rotates the lowest `width` bits towards the higher bits, or towards the
+    lower ones when `shift` is negative.
+    """
+    shift %= width
+
+    return ((bits << shift) | (bits >> (width - shift))) & ((1 << width) - 1)
+
+
+@instrument.phase("parse")
 def parse_map(lines: list[str]) -> Map:
     map_size = Size(len(lines[0].strip()), len(lines))
     entrance = Point(lines[0].index(Symbol.EMPTY), 0)
     exit = Point(lines[-1].index(Symbol.EMPTY), map_size.height - 1)
 
-    blizzards = []
+    # Where the blizzards going in each direction start out, see Map
+    blizzard_rows = {
+        direction: [0] * map_size.height
+        for direction in [Direction.UP, Direction.RIGHT, Direction.DOWN, Direction.LEFT]
+    }
     for y, line in enumerate(lines):
-        SYMBOL_UP = "^"
         for x, symbol in enumerate(line.strip()):
             match symbol:
                 case Symbol.UP:
@@ -385,106 +451,60 @@ def parse_map(lines: list[str]) -> Map:
                 case _:
                     continue
 
-            blizzards.append(Blizzard(Point(x, y), direction))
-
-    return Map(map_size, entrance, exit, blizzards)
+            # Bit 0 is the first column inside the walls
+            blizzard_rows[direction][y] |= 1 << (x - 1)
 
-
-def create_map_variations(map: Map) -> list[Map]:
-    """
-    Builds a list of all possible maps, with regards to the positions of the
-    blizzards.
-
-    Since the blizzards simply wrap around when hitting a wall, there are a
-    finite number of places they can be in. At some point it will simply become
-    a cycle.
-    """
-    map_variations = [map]
-
-    map_variation = move_blizzards(map)
-    while map_variation.blizzards != map_variations[0].blizzards:
-        map_variations.append(map_variation)
-        map_variation = move_blizzards(map_variation)
-
-    return map_variations
-
-
-def move_blizzards(map: Map) -> Map:
-    moved_blizzards = []
-    for blizzard in map.blizzards:
-        new_blizzard_pos = Point(
-            blizzard.position.x + blizzard.direction.x,
-            blizzard.position.y + blizzard.direction.y,
-        )
-
-        if map.is_wall(new_blizzard_pos):
-            # Wrap the blizzard to the other side of the basin
-            match blizzard.direction:
-                case Direction.UP:
-                    new_blizzard_pos = Point(new_blizzard_pos.x, map.size.height - 2)
-
-                case Direction.RIGHT:
-                    new_blizzard_pos = Point(1, new_blizzard_pos.y)
-
-                case Direction.DOWN:
-                    new_blizzard_pos = Point(new_blizzard_pos.x, 1)
-
-                case Direction.LEFT:
-                    new_blizzard_pos = Point(map.size.width - 2, new_blizzard_pos.y)
-
-        moved_blizzards.append(Blizzard(new_blizzard_pos, blizzard.direction))
-
-    return Map(map.size, map.entrance, map.exit, moved_blizzards)
+    return Map(map_size, entrance, exit, blizzard_rows)
 
 
+@instrument.phase("search")
 def find_path(map: Map):
-    map_variations = create_map_variations(map)
-    num_map_variations = len(map_variations)
-    print("There are", num_map_variations, "variations of the map")
-    current_map_variation_idx = 0
+    current_period_minute = 0
 
     queue = []
     heappush(queue, (0, map.entrance, 0, 0))
 
+    # Per minute of the blizzards' period
     cost_so_far = []
-    for _ in range(num_map_variations):
+    for _ in range(map.period):
         cost_so_far.append(defaultdict(lambda: 999_999_999))
 
-    came_from = []
-    for _ in range(num_map_variations):
-        came_from.append(defaultdict(lambda: None))
+    # The position that every step was reached from, a minute earlier. Unlike
+    # the costs, these are kept per minute since the start of the route, as
+    # the route can take longer than the period.
+    came_from: dict[Step, Point] = {}
 
     while queue:
         (
             cost_to_reach_exit,
             current_position,
             minute,
-            current_map_variation_idx,
+            current_period_minute,
         ) = heappop(queue)
+        instrument.count("states expanded")
 
         if current_position == map.exit:
-            cost_so_far[current_map_variation_idx][map.exit] = cost_to_reach_exit
+            cost_so_far[current_period_minute][map.exit] = cost_to_reach_exit
             break
 
         # Because all movement (elf and blizzards) happen at the same minute,
-        # look at how the map will look like in the next minute
-        current_map_variation = map_variations[current_map_variation_idx]
+        # look at where the blizzards will be in the next minute
 
-        # next_cost = cost_so_far[map_variation_idx][current_position] + 1
+        # next_cost = cost_so_far[period_minute][current_position] + 1
         next_cost = minute + 1
         next_minute = minute + 1
-        next_map_variation_idx = (current_map_variation_idx + 1) % num_map_variations
+        next_period_minute = (current_period_minute + 1) % map.period
 
         # Consider movement options
-        next_possible_positions = next_moves(current_map_variation, current_position)
+        next_possible_positions = next_moves(map, current_position, next_period_minute)
 
         for next_position in next_possible_positions:
             if (
-                next_position not in cost_so_far[current_map_variation_idx]
-                or cost_so_far[current_map_variation_idx][next_position] > next_cost
+                next_position not in cost_so_far[current_period_minute]
+                or cost_so_far[current_period_minute][next_position] > next_cost
             ):
-                cost_so_far[current_map_variation_idx][next_position] = next_cost
-                came_from[current_map_variation_idx][next_position] = current_position
+                cost_so_far[current_period_minute][next_position] = next_cost
+                came_from[Step(next_position, next_minute)] = current_position
 
                 next_cost_to_reach_exit = next_cost + manhattan_distance(
                     next_position, map.exit
@@ -495,26 +515,27 @@ def find_path(map: Map):
                         next_cost_to_reach_exit,
                         next_position,
                         next_minute,
-                        next_map_variation_idx,
+                        next_period_minute,
                     ),
                 )
+                instrument.maximum("queue size", len(queue))
 
-    if map.exit not in cost_so_far[current_map_variation_idx]:
+    if map.exit not in cost_so_far[current_period_minute]:
         raise Exception("Could not find a route")
 
-    time_passed = cost_so_far[current_map_variation_idx][map.exit] - 1
+    time_passed = cost_so_far[current_period_minute][map.exit]
 
-    # This route is not complete: it doesn't show any backtracking done by the elves.
+    # The position at every minute of the route, so including the minutes
+    # spent waiting or backtracking
     route = [map.exit]
-    while route[-1] != map.entrance:
-        current_map_variation_idx = (current_map_variation_idx - 1) % num_map_variations
-        route.append(came_from[current_map_variation_idx][route[-1]])
+    for minute in range(time_passed, 0, -1):
+        route.append(came_from[Step(route[-1], minute)])
     route.reverse()
 
     return route, time_passed
 
 
-def next_moves(map: Map, from_: Point) -> list[Point]:
+def next_moves(map: Map, from_: Point, minute: int) -> list[Point]:
     """Build a list of positions that can be visited from position `from_`,
     discarding those that would move you into a wall, a blizzard or would go
     out-of-bounds of the map.
@@ -527,7 +548,7 @@ def next_moves(map: Map, from_: Point) -> list[Point]:
         next_y = from_.y + delta_y
         next_point = Point(next_x, next_y)
 
-        if not map.is_accessible(next_point):
+        if not map.is_accessible(next_point, minute):
             continue
 
         next_points.append(Point(next_x, next_y))
@@ -539,30 +560,112 @@ def manhattan_distance(from_: Point, to_: Point) -> int:
     return abs(from_[0] - to_[0]) + abs(from_[1] - to_[1])
 
 
-def print_route(map, route):
+@instrument.phase("search")
+def find_fastest_time(map: Map, from_: Point, to: Point, start_minute: int = 0) -> int:
+    """Finds how many minutes it takes at least to go from one position to
+    another, starting at the given minute.
+
+    Every move takes a minute, so instead of searching for a route, this keeps
+    track of all positions the expedition could be in at every next minute,
+    the frontier, as a bitmask per row. All moves at once then come down to
+    shifting those bitmasks left and right (and taking the ones of the rows
+    above and below), and dropping the positions that are walls or blizzards
+    by then.
+    """
+    width, height = map.size
+
+    # The positions that aren't walls: the basin within the walls, and the
+    # entrance and exit
+    open_rows = [((1 << (width - 2)) - 1) << 1] * height
+    open_rows[0] = 1 << map.entrance.x
+    open_rows[-1] = 1 << map.exit.x
+
+    frontier = [0] * height
+    frontier[from_.y] = 1 << from_.x
+    minute = start_minute
+
+    # Once the same frontier comes by again at the same minute of the
+    # blizzards' period, it keeps repeating, so the goal can't be reached. That
+    # includes a frontier without any positions left, when every one of them
+    # got caught by a blizzard.
+    seen_frontiers = set()
+
+    while not frontier[to.y] >> to.x & 1:
+        instrument.count("states expanded", sum(row.bit_count() for row in frontier))
+
+        frontier_id = (minute % map.period, tuple(frontier))
+        if frontier_id in seen_frontiers:
+            raise Exception("Could not find a route")
+        seen_frontiers.add(frontier_id)
+
+        minute += 1
+        blizzards = map.blizzards_at(minute)
+
+        frontier = [
+            (
+                # Wait, move left, move right
+                row
+                | row << 1
+                | row >> 1
+                # Move down from the row above, or up from the row below
+                | (frontier[y - 1] if y > 0 else 0)
+                | (frontier[y + 1] if y < height - 1 else 0)
+            )
+            & open_rows[y]
+            & ~blizzards[y]
+            for y, row in enumerate(frontier)
+        ]
+
+    return minute - start_minute
+
+
+def print_route(map: Map, route: list[Point]):
+    # Looking up every position of the map in a set, instead of in the route
+    # itself, keeps this quick for large maps with long routes
+    route_positions = set(route)
+
     for y in range(map.size.height):
+        symbols = []
         for x in range(map.size.width):
             point = Point(x, y)
             if point == route[0]:
                 # Start of the route
-                print(Symbol.START, end="")
+                symbols.append(Symbol.START)
             elif point == route[-1]:
                 # End of the route
-                print(Symbol.EXIT, end="")
-            elif point in route:
-                print(Symbol.PATH, end="")
+                symbols.append(Symbol.EXIT)
+            elif point in route_positions:
+                symbols.append(Symbol.PATH)
             else:
-                print(Symbol.EMPTY, end="")
+                symbols.append(Symbol.EMPTY)
+
+        print("".join(symbols))
+
+
+def solve(input_text: str, engine: str = "frontier") -> int:
+    """The engine is either "frontier", which keeps track of all positions the
+    expedition could be in at once, or "a-star", which searches for a route.
+    """
+    map = parse_map(input_text.splitlines(keepends=True))
+
+    match engine:
+        case "frontier":
+            return find_fastest_time(map, map.entrance, map.exit)
+
+        case "a-star":
+            _, time_passed = find_path(map)
+            return time_passed
 
-        # Newline
-        print()
+        case _:
+            raise Exception("Unknown engine %s" % engine)
 
 
-# map_data = open("../puzzle-input/day24-simple-example-input.txt").readlines()
-# map_data = open("../puzzle-input/day24-complex-example-input.txt").readlines()
-map_data = open("../puzzle-input/day24-input.txt").readlines()
+if __name__ == "__main__":
+    # map_data = open("../puzzle-input/day24-simple-example-input.txt").read()
+    # map_data = open("../puzzle-input/day24-complex-example-input.txt").read()
+    map_data = open("../puzzle-input/day24-input.txt").read()
 
-map = parse_map(map_data)
-route, time_passed = find_path(map)
-print_route(map, route)
-print(time_passed)
+    map = parse_map(map_data.splitlines(keepends=True))
+    route, time_passed = find_path(map)
+    print_route(map, route)
+    print(time_passed)
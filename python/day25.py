@@ -139,6 +139,8 @@ The Elves are starting to get cold. What SNAFU number do you supply to Bob's
 console?
 """
 
+from collections.abc import Iterable
+
 
 class Snafu:
     BASE = 5
@@ -232,11 +234,23 @@ def run_tests():
 
 run_tests()
 
-# fuel_requirements = open("../puzzle-input/day25-example-input.txt").readlines()
-fuel_requirements = open("../puzzle-input/day25-input.txt").readlines()
 
-sum_snafu = Snafu("0")
-for requirement in fuel_requirements:
-    sum_snafu += requirement.strip()
+def solve(input_text: str) -> str:
+    return solve_lines(input_text.encode().splitlines())
+
+
+def solve_lines(fuel_requirements: Iterable[bytes]) -> str:
+    sum_snafu = Snafu("0")
+    for requirement in fuel_requirements:
+        sum_snafu += requirement.strip().decode()
+
+    return sum_snafu.value
+
+
+if __name__ == "__main__":
+    from puzzle_input import PuzzleInput
+
+    # puzzle_input = PuzzleInput("../puzzle-input/day25-example-input.txt")
+    puzzle_input = PuzzleInput("../puzzle-input/day25-input.txt")
 
-print(sum_snafu.value)
+    print(solve_lines(puzzle_input))
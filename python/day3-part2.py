@@ -101,23 +101,41 @@ Find the item type that corresponds to the badges of each three-Elf group. What
 is the sum of the priorities of those item types?
 """
 
+from collections.abc import Iterable
 from string import ascii_letters
 
 
-# rucksacks = open("../puzzle-input/day3-example-input.txt").readlines()
-rucksacks = open("../puzzle-input/day3-input.txt").readlines()
+# Item types as bytes, because the rucksacks are read as such
+ITEM_TYPES = ascii_letters.encode()
 
-total_priority = 0
-for group in range(0, len(rucksacks), 3):
-    for elf in range(3):
-        rucksack = rucksacks[group + elf].strip()
 
-        if elf == 0:
-            common_group_items = set(rucksack)
-        else:
-            common_group_items = common_group_items.intersection(rucksack)
+def solve(input_text: str) -> int:
+    return solve_lines(input_text.encode().splitlines())
 
-    duplicate_item = common_group_items.pop()
-    total_priority += ascii_letters.index(duplicate_item) + 1
 
-print(total_priority)
+def solve_lines(rucksacks: Iterable[bytes]) -> int:
+    total_priority = 0
+    # Taking three at a time from the same iterator gives the groups of elves
+    rucksacks = iter(rucksacks)
+    for group in zip(rucksacks, rucksacks, rucksacks):
+        for elf in range(3):
+            rucksack = group[elf].strip()
+
+            if elf == 0:
+                common_group_items = set(rucksack)
+            else:
+                common_group_items = common_group_items.intersection(rucksack)
+
+        duplicate_item = common_group_items.pop()
+        total_priority += ITEM_TYPES.index(duplicate_item) + 1
+
+    return total_priority
+
+
+if __name__ == "__main__":
+    from puzzle_input import PuzzleInput
+
+    # puzzle_input = PuzzleInput("../puzzle-input/day3-example-input.txt")
+    puzzle_input = PuzzleInput("../puzzle-input/day3-input.txt")
+
+    print(solve_lines(puzzle_input))
@@ -56,22 +56,38 @@ Find the item type that appears in both compartments of each rucksack. What is
 the sum of the priorities of those item types?
 """
 
+from collections.abc import Iterable
 from string import ascii_letters
 
 
-# rucksacks = open('../puzzle-input/day3-example-input.txt').readlines()
-rucksacks = open("../puzzle-input/day3-input.txt").readlines()
+# Item types as bytes, because the rucksacks are read as such
+ITEM_TYPES = ascii_letters.encode()
 
-total_priority = 0
-for rucksack in rucksacks:
-    rucksack = rucksack.strip()
 
-    num_items = len(rucksack)
-    compartment_size = num_items // 2
-    duplicate_item = set(rucksack[:compartment_size]).intersection(
-        rucksack[compartment_size:]
-    )
+def solve(input_text: str) -> int:
+    return solve_lines(input_text.encode().splitlines())
 
-    total_priority += ascii_letters.index(duplicate_item.pop()) + 1
 
-print(total_priority)
+def solve_lines(rucksacks: Iterable[bytes]) -> int:
+    total_priority = 0
+    for rucksack in rucksacks:
+        rucksack = rucksack.strip()
+
+        num_items = len(rucksack)
+        compartment_size = num_items // 2
+        duplicate_item = set(rucksack[:compartment_size]).intersection(
+            rucksack[compartment_size:]
+        )
+
+        total_priority += ITEM_TYPES.index(duplicate_item.pop()) + 1
+
+    return total_priority
+
+
+if __name__ == "__main__":
+    from puzzle_input import PuzzleInput
+
+    # puzzle_input = PuzzleInput("../puzzle-input/day3-example-input.txt")
+    puzzle_input = PuzzleInput("../puzzle-input/day3-input.txt")
+
+    print(solve_lines(puzzle_input))
@@ -66,23 +66,36 @@ So, in this example, the number of overlapping assignment pairs is 4.
 In how many assignment pairs do the ranges overlap?
 """
 
+from collections.abc import Iterable
 
-def assignments_to_range(assignments: str) -> range:
-    from_, to_ = map(lambda s: int(s), assignments.split("-"))
+
+def assignments_to_range(assignments: bytes) -> range:
+    from_, to_ = map(lambda s: int(s), assignments.split(b"-"))
     return range(from_, to_ + 1)
 
 
-# pairs = open('../puzzle-input/day4-example-input.txt').readlines()
-pairs = open("../puzzle-input/day4-input.txt").readlines()
+def solve(input_text: str) -> int:
+    return solve_lines(input_text.encode().splitlines())
+
+
+def solve_lines(pairs: Iterable[bytes]) -> int:
+    overlap_count = 0
+    for pair in pairs:
+        assignments_one, assignments_two = pair.split(b",")
+
+        sections_one = set(assignments_to_range(assignments_one))
+        sections_two = set(assignments_to_range(assignments_two))
+
+        if sections_one.intersection(sections_two):
+            overlap_count += 1
+
+    return overlap_count
 
-overlap_count = 0
-for pair in pairs:
-    assignments_one, assignments_two = pair.split(",")
 
-    sections_one = set(assignments_to_range(assignments_one))
-    sections_two = set(assignments_to_range(assignments_two))
+if __name__ == "__main__":
+    from puzzle_input import PuzzleInput
 
-    if sections_one.intersection(sections_two):
-        overlap_count += 1
+    # puzzle_input = PuzzleInput("../puzzle-input/day4-example-input.txt")
+    puzzle_input = PuzzleInput("../puzzle-input/day4-input.txt")
 
-print(overlap_count)
+    print(solve_lines(puzzle_input))
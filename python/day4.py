@@ -49,23 +49,36 @@ are 2 such pairs.
 In how many assignment pairs does one range fully contain the other?
 """
 
+from collections.abc import Iterable
 
-def assignments_to_range(assignments: str) -> range:
-    from_, to_ = map(lambda s: int(s), assignments.split("-"))
+
+def assignments_to_range(assignments: bytes) -> range:
+    from_, to_ = map(lambda s: int(s), assignments.split(b"-"))
     return range(from_, to_ + 1)
 
 
-# pairs = open('../puzzle-input/day4-example-input.txt').readlines()
-pairs = open("../puzzle-input/day4-input.txt").readlines()
+def solve(input_text: str) -> int:
+    return solve_lines(input_text.encode().splitlines())
+
+
+def solve_lines(pairs: Iterable[bytes]) -> int:
+    fully_contained_count = 0
+    for pair in pairs:
+        assignments_one, assignments_two = pair.split(b",")
+
+        sections_one = set(assignments_to_range(assignments_one))
+        sections_two = set(assignments_to_range(assignments_two))
+
+        if sections_one.issubset(sections_two) or sections_two.issubset(sections_one):
+            fully_contained_count += 1
+
+    return fully_contained_count
 
-fully_contained_count = 0
-for pair in pairs:
-    assignments_one, assignments_two = pair.split(",")
 
-    sections_one = set(assignments_to_range(assignments_one))
-    sections_two = set(assignments_to_range(assignments_two))
+if __name__ == "__main__":
+    from puzzle_input import PuzzleInput
 
-    if sections_one.issubset(sections_two) or sections_two.issubset(sections_one):
-        fully_contained_count += 1
+    # puzzle_input = PuzzleInput("../puzzle-input/day4-example-input.txt")
+    puzzle_input = PuzzleInput("../puzzle-input/day4-input.txt")
 
-print(fully_contained_count)
+    print(solve_lines(puzzle_input))
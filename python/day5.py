@@ -114,21 +114,28 @@ def parse_rearrangement_procedure(procedure_lines: list[str]) -> list[Step]:
     return procedure
 
 
-# lines = open("../puzzle-input/day5-example-input.txt").readlines()
-lines = open("../puzzle-input/day5-input.txt").readlines()
+def solve(input_text: str) -> str:
+    lines = input_text.splitlines(keepends=True)
 
-# Find the line that marks the end of the crate diagram
-for line_num, line in enumerate(lines):
-    if line.strip().startswith("1"):
-        break
+    # Find the line that marks the end of the crate diagram
+    for line_num, line in enumerate(lines):
+        if line.strip().startswith("1"):
+            break
 
-stacks = parse_crate_diagram(lines[:line_num])
-# 2 lines are skipped: the stack numbers and an empty line
-procedure = parse_rearrangement_procedure(lines[line_num + 2 :])
+    stacks = parse_crate_diagram(lines[:line_num])
+    # 2 lines are skipped: the stack numbers and an empty line
+    procedure = parse_rearrangement_procedure(lines[line_num + 2 :])
 
-for step in procedure:
-    for _ in range(step.num_crates):
-        crate = stacks[step.from_ - 1].pop()
-        stacks[step.to_ - 1].append(crate)
+    for step in procedure:
+        for _ in range(step.num_crates):
+            crate = stacks[step.from_ - 1].pop()
+            stacks[step.to_ - 1].append(crate)
 
-print("".join([stack.pop() for stack in stacks]))
+    return "".join([stack.pop() for stack in stacks])
+
+
+if __name__ == "__main__":
+    # input_text = open("../puzzle-input/day5-example-input.txt").read()
+    input_text = open("../puzzle-input/day5-input.txt").read()
+
+    print(solve(input_text))
@@ -57,32 +57,41 @@ marker is detected?
 
 START_MARKER_LEN = 4
 
-# data = open("../puzzle-input/day6-example-input.txt").read().strip()
-data = open("../puzzle-input/day6-input.txt").read().strip()
-
-cursor_pos = 0
-while cursor_pos <= len(data) - START_MARKER_LEN:
-    found_start = True
-
-    for n in range(0, START_MARKER_LEN - 1):
-        character = data[cursor_pos + n]
-        updated_cursor_pos = False
-
-        for i in range(1, START_MARKER_LEN - n):
-            other_character = data[cursor_pos + n + i]
-
-            if other_character == character:
-                # Duplicate character found so the current `character` does not
-                # mark the beginning of a start-of-packet. Keep searching!
-                cursor_pos += 1
-                found_start = False
-                updated_cursor_pos = True
+
+def solve(input_text: str) -> int:
+    data = input_text.strip()
+
+    cursor_pos = 0
+    while cursor_pos <= len(data) - START_MARKER_LEN:
+        found_start = True
+
+        for n in range(0, START_MARKER_LEN - 1):
+            character = data[cursor_pos + n]
+            updated_cursor_pos = False
+
+            for i in range(1, START_MARKER_LEN - n):
+                other_character = data[cursor_pos + n + i]
+
+                if other_character == character:
+                    # Duplicate character found so the current `character` does
+                    # not mark the beginning of a start-of-packet. Keep
+                    # searching!
+                    cursor_pos += 1
+                    found_start = False
+                    updated_cursor_pos = True
+                    break
+
+            if updated_cursor_pos:
                 break
 
-        if updated_cursor_pos:
-            break
+        if found_start:
+            return cursor_pos + START_MARKER_LEN
+
+    raise Exception("No start-of-packet marker found")
+
+
+if __name__ == "__main__":
+    # input_text = open("../puzzle-input/day6-example-input.txt").read()
+    input_text = open("../puzzle-input/day6-input.txt").read()
 
-    if found_start:
-        print(data[cursor_pos : cursor_pos + START_MARKER_LEN])
-        print(cursor_pos, "+", START_MARKER_LEN, "=", cursor_pos + START_MARKER_LEN)
-        break
+    print(solve(input_text))
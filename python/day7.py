@@ -198,19 +198,26 @@ def parse_terminal_output(lines: list[str]) -> Directory:
     return filesystem_root
 
 
-# terminal_output_lines = open("../puzzle-input/day7-example-input.txt").readlines()
-terminal_output_lines = open("../puzzle-input/day7-input.txt").readlines()
+def solve(input_text: str) -> int:
+    terminal_output_lines = input_text.splitlines(keepends=True)
 
-filesystem_root = parse_terminal_output(terminal_output_lines)
+    filesystem_root = parse_terminal_output(terminal_output_lines)
 
-directory_stack = [filesystem_root]
-matching_dirs = []
+    directory_stack = [filesystem_root]
+    matching_dirs = []
 
-while len(directory_stack):
-    directory = directory_stack.pop()
-    directory_stack.extend(directory.dirs.values())
+    while len(directory_stack):
+        directory = directory_stack.pop()
+        directory_stack.extend(directory.dirs.values())
 
-    if directory.get_total_size() <= 100_000:
-        matching_dirs.append(directory)
+        if directory.get_total_size() <= 100_000:
+            matching_dirs.append(directory)
 
-print(sum([d.get_total_size() for d in matching_dirs]))
+    return sum([d.get_total_size() for d in matching_dirs])
+
+
+if __name__ == "__main__":
+    # input_text = open("../puzzle-input/day7-example-input.txt").read()
+    input_text = open("../puzzle-input/day7-input.txt").read()
+
+    print(solve(input_text))
@@ -167,13 +167,22 @@ def get_scenic_score(grid: Grid, column: int, row: int) -> int:
     return total_scenic_score
 
 
-# grid = parse_grid(open("../puzzle-input/day8-example-input.txt").readlines())
-grid = parse_grid(open("../puzzle-input/day8-input.txt").readlines())
+def solve(input_text: str) -> int:
+    grid = parse_grid(input_text.splitlines(keepends=True))
 
-highest_scenic_score = 0
-# Go through all the trees, except the ones on the edges of the grid
-for x in range(1, grid.dimension - 1):
-    for y in range(1, grid.dimension - 1):
-        highest_scenic_score = max(highest_scenic_score, get_scenic_score(grid, x, y))
+    highest_scenic_score = 0
+    # Go through all the trees, except the ones on the edges of the grid
+    for x in range(1, grid.dimension - 1):
+        for y in range(1, grid.dimension - 1):
+            highest_scenic_score = max(
+                highest_scenic_score, get_scenic_score(grid, x, y)
+            )
 
-print(highest_scenic_score)
+    return highest_scenic_score
+
+
+if __name__ == "__main__":
+    # input_text = open("../puzzle-input/day8-example-input.txt").read()
+    input_text = open("../puzzle-input/day8-input.txt").read()
+
+    print(solve(input_text))
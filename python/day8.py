@@ -107,13 +107,20 @@ def is_tree_visible(grid: Grid, column: int, row: int) -> bool:
     return False
 
 
-# grid = parse_grid(open("../puzzle-input/day8-example-input.txt").readlines())
-grid = parse_grid(open("../puzzle-input/day8-input.txt").readlines())
+def solve(input_text: str) -> int:
+    grid = parse_grid(input_text.splitlines(keepends=True))
 
-num_visible = 0
-for x in range(grid.dimension):
-    for y in range(grid.dimension):
-        if is_tree_visible(grid, x, y):
-            num_visible += 1
+    num_visible = 0
+    for x in range(grid.dimension):
+        for y in range(grid.dimension):
+            if is_tree_visible(grid, x, y):
+                num_visible += 1
 
-print(num_visible)
+    return num_visible
+
+
+if __name__ == "__main__":
+    # input_text = open("../puzzle-input/day8-example-input.txt").read()
+    input_text = open("../puzzle-input/day8-input.txt").read()
+
+    print(solve(input_text))
@@ -324,28 +324,35 @@ def move_tail(tail: Vector, head: Vector):
         tail.y += 1 if head.y > tail.y else -1
 
 
-head = Vector(x=0, y=0)
-tail = Vector(x=0, y=0)
+def solve(input_text: str) -> int:
+    head = Vector(x=0, y=0)
+    tail = Vector(x=0, y=0)
 
-# instructions = open("../puzzle-input/day9-example-input.txt").readlines()
-instructions = open("../puzzle-input/day9-input.txt").readlines()
+    instructions = input_text.splitlines(keepends=True)
 
-tail_position_counter = Counter()
-for instruction in instructions:
-    motion = instruction_to_vector(instruction)
+    tail_position_counter = Counter()
+    for instruction in instructions:
+        motion = instruction_to_vector(instruction)
 
-    delta_x = 1 if motion.x > 0 else -1
-    for _ in range(abs(motion.x)):
-        head.x += delta_x
+        delta_x = 1 if motion.x > 0 else -1
+        for _ in range(abs(motion.x)):
+            head.x += delta_x
 
-        move_tail(tail, head)
-        tail_position_counter[(tail.x, tail.y)] += 1
+            move_tail(tail, head)
+            tail_position_counter[(tail.x, tail.y)] += 1
 
-    delta_y = 1 if motion.y > 0 else -1
-    for _ in range(abs(motion.y)):
-        head.y += delta_y
+        delta_y = 1 if motion.y > 0 else -1
+        for _ in range(abs(motion.y)):
+            head.y += delta_y
 
-        move_tail(tail, head)
-        tail_position_counter[(tail.x, tail.y)] += 1
+            move_tail(tail, head)
+            tail_position_counter[(tail.x, tail.y)] += 1
 
-print(len(tail_position_counter))
+    return len(tail_position_counter)
+
+
+if __name__ == "__main__":
+    # input_text = open("../puzzle-input/day9-example-input.txt").read()
+    input_text = open("../puzzle-input/day9-input.txt").read()
+
+    print(solve(input_text))
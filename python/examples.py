@@ -0,0 +1,170 @@
+"""
+The example inputs from the puzzle descriptions, with the answers they should
+give, for every solver.
+
+Some solvers need options to solve an example, like day 15, which looks at a
+smaller area than for the real input. Solvers with engines or other options
+have an example for each of them as well. The first example of a solver is the
+one that `aoc.py run --example` uses, and tests/test_examples.py runs all of
+them.
+"""
+
+from collections import namedtuple
+
+
+# In seconds
+DEFAULT_TIME_BUDGET = 5
+
+Example = namedtuple(
+    "Example",
+    ["module_name", "input_file", "answer", "time_budget", "solve_kwargs"],
+    defaults=[DEFAULT_TIME_BUDGET, {}],
+)
+
+DAY10_IMAGE = """\
+##..##..##..##..##..##..##..##..##..##..
+###...###...###...###...###...###...###.
+####....####....####....####....####....
+#####.....#####.....#####.....#####.....
+######......######......######......####
+#######.......#######.......#######....."""
+
+EXAMPLES = [
+    Example("day1", "day1-example-input.txt", 24000),
+    Example("day1-part2", "day1-example-input.txt", 45000),
+    Example("day2", "day2-example-input.txt", 15),
+    Example("day2-part2", "day2-example-input.txt", 12),
+    Example("day3", "day3-example-input.txt", 157),
+    Example("day3-part2", "day3-example-input.txt", 70),
+    Example("day4", "day4-example-input.txt", 2),
+    Example("day4-part2", "day4-example-input.txt", 4),
+    Example("day5", "day5-example-input.txt", "CMZ"),
+    Example("day5-part2", "day5-example-input.txt", "MCD"),
+    Example("day6", "day6-example-input.txt", 7),
+    Example("day6-part2", "day6-example-input.txt", 19),
+    Example("day7", "day7-example-input.txt", 95437),
+    Example("day7-part2", "day7-example-input.txt", 24933642),
+    Example("day8", "day8-example-input.txt", 21),
+    Example("day8-part2", "day8-example-input.txt", 8),
+    Example("day9", "day9-example-input.txt", 13),
+    Example("day9-part2", "day9-example-input.txt", 1),
+    Example("day9-part2", "day9-example-input-part2.txt", 36),
+    Example("day10", "day10-example-input.txt", 13140),
+    Example("day10-part2", "day10-example-input.txt", DAY10_IMAGE),
+    Example("day11", "day11-example-input.txt", 10605),
+    Example("day11-part2", "day11-example-input.txt", 2713310158, time_budget=30),
+    Example("day12", "day12-example-input.txt", 31),
+    Example("day12-part2", "day12-example-input.txt", 29),
+    Example("day13", "day13-example-input.txt", 13),
+    Example("day13-part2", "day13-example-input.txt", 140),
+    Example("day14", "day14-example-input.txt", 24),
+    Example("day14-part2", "day14-example-input.txt", 93),
+    Example(
+        "day15",
+        "day15-example-input.txt",
+        26,
+        solve_kwargs={"row_to_monitor": 10},
+    ),
+    Example(
+        "day15-part2",
+        "day15-example-input.txt",
+        56000011,
+        solve_kwargs={"coverage_range_limit": 20},
+    ),
+    Example(
+        "day15-part2",
+        "day15-example-input.txt",
+        56000011,
+        solve_kwargs={"coverage_range_limit": 20, "skip_rows": False},
+    ),
+    Example(
+        "day15-part2",
+        "day15-example-input.txt",
+        56000011,
+        solve_kwargs={"coverage_range_limit": 20, "engine": "ranges"},
+    ),
+    Example("day16", "day16-example-input.txt", 1651),
+    Example(
+        "day16",
+        "day16-example-input.txt",
+        1651,
+        solve_kwargs={"prune": False},
+    ),
+    Example("day16-part2", "day16-example-input.txt", 1707),
+    Example(
+        "day16-part2",
+        "day16-example-input.txt",
+        1707,
+        solve_kwargs={"engine": "search"},
+    ),
+    Example(
+        "day16-part2",
+        "day16-example-input.txt",
+        1707,
+        solve_kwargs={"engine": "search", "prune": False},
+    ),
+    Example("day17", "day17-example-input.txt", 3068),
+    Example("day17-part2", "day17-example-input.txt", 1514285714288),
+    Example(
+        "day17-part2",
+        "day17-example-input.txt",
+        3068,
+        solve_kwargs={"num_pieces": 2022},
+    ),
+    Example("day18", "day18-example-input.txt", 64),
+    Example("day18-part2", "day18-example-input.txt", 58),
+    Example("day19", "day19-example-input.txt", 33),
+    Example(
+        "day19",
+        "day19-example-input.txt",
+        33,
+        time_budget=300,
+        solve_kwargs={"engine": "minute-by-minute"},
+    ),
+    Example("day19-part2", "day19-example-input.txt", 56 * 62),
+    Example(
+        "day19-part2",
+        "day19-example-input.txt",
+        56 * 62,
+        solve_kwargs={"jobs": 2},
+    ),
+    Example("day20", "day20-example-input.txt", 3),
+    Example("day20-part2", "day20-example-input.txt", 1623178306),
+    Example("day21", "day21-example-input.txt", 152),
+    Example("day21-part2", "day21-example-input.txt", 301),
+    Example("day22", "day22-example-input.txt", 6032),
+    Example("day23", "day23-example-input.txt", 110),
+    Example("day23-part2", "day23-example-input.txt", 20),
+    Example("day24", "day24-complex-example-input.txt", 18),
+    Example("day24", "day24-simple-example-input.txt", 10),
+    Example(
+        "day24",
+        "day24-complex-example-input.txt",
+        18,
+        solve_kwargs={"engine": "a-star"},
+    ),
+    Example("day24-part2", "day24-complex-example-input.txt", 54),
+    Example("day24-part2", "day24-simple-example-input.txt", 30),
+    Example(
+        "day24-part2",
+        "day24-simple-example-input.txt",
+        30,
+        solve_kwargs={"engine": "a-star"},
+    ),
+    Example(
+        "day24-part2",
+        "day24-complex-example-input.txt",
+        54,
+        solve_kwargs={"engine": "a-star"},
+    ),
+    Example("day25", "day25-example-input.txt", "2=-1=0"),
+]
+
+
+def example_for(module_name: str) -> Example | None:
+    """Returns the first example of a solver, if it has any."""
+    for example in EXAMPLES:
+        if example.module_name == module_name:
+            return example
+
+    return None
@@ -0,0 +1,36 @@
+"""
+Generators of synthetic puzzle inputs of arbitrary size, to see how the
+solvers hold up when the input grows well beyond the size of the real puzzle
+input.
+
+Every day has its own module (`generators/day16.py` for day 16, etc.) with:
+
+- `generate(size, rng)`, which returns the text of an input file. What `size`
+  means differs per day (the number of lines, the width of a grid, the number
+  of valves, ...) and is described in the module itself.
+- `SIZES`, the sizes the benchmark runs the solvers on by default.
+
+All randomness comes from the given `random.Random`, so the same seed always
+results in the same input. Generate an input from the python/ directory with:
+
+    python -m generators 16 60 > /tmp/day16-60-valves.txt
+"""
+
+import importlib
+import random
+from types import ModuleType
+
+
+DEFAULT_SEED = 2022
+
+
+def generator_for(day: int) -> ModuleType:
+    return importlib.import_module(f"generators.day{day}")
+
+
+def generate(day: int, size: int, seed: int = DEFAULT_SEED) -> str:
+    return generator_for(day).generate(size, random.Random(seed))
+
+
+def size_ladder(day: int) -> list[int]:
+    return generator_for(day).SIZES
@@ -0,0 +1,25 @@
+import argparse
+
+from generators import DEFAULT_SEED, generate
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m generators",
+        description="Prints a synthetic puzzle input of the given size.",
+    )
+    parser.add_argument("day", type=int, choices=range(1, 26), metavar="DAY")
+    parser.add_argument("size", type=int, metavar="SIZE")
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=DEFAULT_SEED,
+        help="seed of the random generator (default: %(default)s)",
+    )
+    args = parser.parse_args()
+
+    print(generate(args.day, args.size, args.seed), end="")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+"""
+Calorie lists for day 1. `size` is the number of calorie lines, spread over
+elves that carry 1 to 15 items each.
+"""
+
+from random import Random
+
+
+SIZES = [10_000, 100_000, 1_000_000]
+
+
+def generate(size: int, rng: Random) -> str:
+    lines = []
+
+    while len(lines) < size:
+        num_items = min(rng.randint(1, 15), size - len(lines))
+        lines.extend(str(rng.randint(1000, 70000)) for _ in range(num_items))
+        lines.append("")
+
+    return "\n".join(lines)
@@ -0,0 +1,26 @@
+"""
+CPU programs for day 10. `size` is the number of instructions.
+
+The value of the X register stays between 0 and 39, so the sprite remains
+on the screen.
+"""
+
+from random import Random
+
+
+SIZES = [10_000, 100_000, 1_000_000]
+
+
+def generate(size: int, rng: Random) -> str:
+    lines = []
+    register_x = 1
+
+    for _ in range(size):
+        if rng.random() < 0.3:
+            lines.append("noop")
+        else:
+            value = rng.randint(-register_x, 39 - register_x)
+            register_x += value
+            lines.append(f"addx {value}")
+
+    return "".join(f"{line}\n" for line in lines)
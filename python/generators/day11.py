@@ -0,0 +1,37 @@
+"""
+Monkey notes for day 11. `size` is the number of monkeys, each of which
+starts out with 1 to 8 items.
+"""
+
+from random import Random
+
+
+SIZES = [4, 8, 16]
+
+PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53]
+
+
+def generate(size: int, rng: Random) -> str:
+    lines = []
+
+    for monkey in range(size):
+        items = [str(rng.randint(50, 99)) for _ in range(rng.randint(1, 8))]
+        operation = rng.choice(
+            [
+                f"old + {rng.randint(1, 9)}",
+                f"old * {rng.randint(2, 19)}",
+                "old * old",
+            ]
+        )
+        other_monkeys = [other for other in range(size) if other != monkey]
+        to_monkey_true, to_monkey_false = rng.sample(other_monkeys, k=2)
+
+        lines.append(f"Monkey {monkey}:")
+        lines.append(f"  Starting items: {', '.join(items)}")
+        lines.append(f"  Operation: new = {operation}")
+        lines.append(f"  Test: divisible by {rng.choice(PRIMES)}")
+        lines.append(f"    If true: throw to monkey {to_monkey_true}")
+        lines.append(f"    If false: throw to monkey {to_monkey_false}")
+        lines.append("")
+
+    return "".join(f"{line}\n" for line in lines)
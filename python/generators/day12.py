@@ -0,0 +1,36 @@
+"""
+Heightmaps for day 12. `size` is the width of the map, which is half as high.
+The width should be at least 26, otherwise there are too few columns to climb
+from a to z.
+
+The terrain slopes up from a on the left to z on the right and is littered
+with steep rocks. The top row and the leftmost and rightmost columns are kept
+free of rocks, so there's always a way to the top.
+"""
+
+from random import Random
+
+
+SIZES = [32, 64, 128, 256]
+
+ROCK_DENSITY = 0.2
+
+
+def generate(size: int, rng: Random) -> str:
+    width = size
+    height = max(3, size // 2)
+
+    rows = []
+    for y in range(height):
+        row = []
+        for x in range(width):
+            elevation = min(25, x * 26 // width)
+            if 0 < x < width - 1 and y > 0 and rng.random() < ROCK_DENSITY:
+                elevation = min(25, elevation + 2 + rng.randint(0, 5))
+            row.append(chr(ord("a") + elevation))
+        rows.append(row)
+
+    rows[height // 2][0] = "S"
+    rows[height // 2][width - 1] = "E"
+
+    return "".join("".join(row) + "\n" for row in rows)
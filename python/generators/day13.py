@@ -0,0 +1,30 @@
+"""
+Distress signal packets for day 13. `size` is the number of packet pairs.
+"""
+
+from random import Random
+
+
+SIZES = [1_000, 10_000, 100_000]
+
+MAX_DEPTH = 4
+
+
+def generate(size: int, rng: Random) -> str:
+    pairs = [
+        f"{generate_packet(rng, 0)}\n{generate_packet(rng, 0)}\n" for _ in range(size)
+    ]
+
+    return "\n".join(pairs)
+
+
+def generate_packet(rng: Random, depth: int) -> str:
+    values = []
+
+    for _ in range(rng.randint(0, 5)):
+        if depth < MAX_DEPTH and rng.random() < 0.3:
+            values.append(generate_packet(rng, depth + 1))
+        else:
+            values.append(str(rng.randint(0, 10)))
+
+    return "[" + ",".join(values) + "]"
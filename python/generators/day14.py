@@ -0,0 +1,36 @@
+"""
+Rock structure scans for day 14. `size` is the depth of the cave, the number
+of rock paths grows along with it.
+
+The amount of sand that comes to rest grows with the square of the depth.
+"""
+
+from random import Random
+
+
+SIZES = [50, 100, 200, 400]
+
+SAND_SOURCE_X = 500
+
+
+def generate(size: int, rng: Random) -> str:
+    lines = []
+
+    for _ in range(max(1, size // 4)):
+        # Rocks are spread out over the width of the pile of sand, which is
+        # as wide as the cave is deep on either side of the sand source
+        y = rng.randint(2, size)
+        x = rng.randint(SAND_SOURCE_X - y, SAND_SOURCE_X + y)
+        points = [(x, y)]
+
+        for segment in range(rng.randint(1, 4)):
+            length = rng.randint(1, 10)
+            if segment % 2 == 0:
+                x += rng.choice((-length, length))
+            else:
+                y = min(size, max(1, y + rng.choice((-length, length))))
+            points.append((x, y))
+
+        lines.append(" -> ".join(f"{x},{y}" for x, y in points))
+
+    return "".join(f"{line}\n" for line in lines)
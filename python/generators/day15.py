@@ -0,0 +1,55 @@
+"""
+Sensor reports for day 15. `size` is the number of sensors, at least 4.
+
+The sensors leave exactly one position uncovered within the search area of
+part 2, which the first four sensors make sure of: they sit on the diagonals
+around the uncovered position, each with a range that reaches up to just next
+to it, which together covers the whole search area except for that position.
+The remaining sensors are placed at random, with ranges that also stay clear
+of it.
+"""
+
+from random import Random
+
+
+SIZES = [4, 16, 64, 256]
+
+SEARCH_AREA_SIZE = 4_000_000
+MAX_RANGE = 1_000_000
+
+
+def generate(size: int, rng: Random) -> str:
+    # Keeping the uncovered position away from the edges keeps the ranges of
+    # the first four sensors, and with that the work for part 1, in check
+    gap_x = rng.randint(SEARCH_AREA_SIZE // 4, SEARCH_AREA_SIZE * 3 // 4)
+    gap_y = rng.randint(SEARCH_AREA_SIZE // 4, SEARCH_AREA_SIZE * 3 // 4)
+
+    offset = max(gap_x, SEARCH_AREA_SIZE - gap_x, gap_y, SEARCH_AREA_SIZE - gap_y)
+    reports = []
+    for direction_x, direction_y in ((1, 1), (-1, 1), (1, -1), (-1, -1)):
+        sensor_x = gap_x + offset * direction_x
+        sensor_y = gap_y + offset * direction_y
+        # The beacon is as far away as the uncovered position, plus one
+        beacon_x = sensor_x - (2 * offset - 1) * direction_x
+        reports.append(((sensor_x, sensor_y), (beacon_x, sensor_y)))
+
+    while len(reports) < size:
+        sensor_x = rng.randint(0, SEARCH_AREA_SIZE)
+        sensor_y = rng.randint(0, SEARCH_AREA_SIZE)
+        distance_to_gap = abs(sensor_x - gap_x) + abs(sensor_y - gap_y)
+        if distance_to_gap == 0:
+            continue
+
+        sensor_range = rng.randint(0, min(MAX_RANGE, distance_to_gap - 1))
+
+        beacon_dx = rng.randint(-sensor_range, sensor_range)
+        beacon_dy = (sensor_range - abs(beacon_dx)) * rng.choice((-1, 1))
+        reports.append(
+            ((sensor_x, sensor_y), (sensor_x + beacon_dx, sensor_y + beacon_dy))
+        )
+
+    return "".join(
+        f"Sensor at x={sensor_x}, y={sensor_y}: "
+        f"closest beacon is at x={beacon_x}, y={beacon_y}\n"
+        for (sensor_x, sensor_y), (beacon_x, beacon_y) in reports
+    )
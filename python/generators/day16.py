@@ -0,0 +1,50 @@
+"""
+Valve scans for day 16. `size` is the number of valves, at most 676 (the
+number of two-letter names). A quarter of them have a positive flow rate,
+like in the real puzzle input.
+
+The tunnels form a random spanning tree, to make sure every valve can be
+reached from AA, plus a few extra tunnels that create loops.
+"""
+
+import string
+from itertools import product
+from random import Random
+
+
+SIZES = [20, 40, 60]
+
+
+def generate(size: int, rng: Random) -> str:
+    names = ["".join(letters) for letters in product(string.ascii_uppercase, repeat=2)]
+    names.remove("AA")
+    names = ["AA"] + rng.sample(names, k=size - 1)
+
+    flow_rates = {name: 0 for name in names}
+    for name in rng.sample(names[1:], k=size // 4):
+        flow_rates[name] = rng.randint(1, 25)
+
+    tunnels: dict[str, set[str]] = {name: set() for name in names}
+
+    def connect(from_valve: str, to_valve: str):
+        tunnels[from_valve].add(to_valve)
+        tunnels[to_valve].add(from_valve)
+
+    for index in range(1, size):
+        connect(names[index], names[rng.randrange(index)])
+    for _ in range(size // 4):
+        from_valve, to_valve = rng.sample(names, k=2)
+        connect(from_valve, to_valve)
+
+    lines = []
+    for name in names:
+        neighbours = sorted(tunnels[name])
+        if len(neighbours) == 1:
+            tunnel_description = f"tunnel leads to valve {neighbours[0]}"
+        else:
+            tunnel_description = f"tunnels lead to valves {', '.join(neighbours)}"
+        lines.append(
+            f"Valve {name} has flow rate={flow_rates[name]}; {tunnel_description}"
+        )
+
+    return "".join(f"{line}\n" for line in lines)
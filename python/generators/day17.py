@@ -0,0 +1,12 @@
+"""
+Jet patterns for day 17. `size` is the length of the pattern.
+"""
+
+from random import Random
+
+
+SIZES = [1_000, 10_000, 100_000]
+
+
+def generate(size: int, rng: Random) -> str:
+    return "".join(rng.choices("<>", k=size)) + "\n"
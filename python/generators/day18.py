@@ -0,0 +1,37 @@
+"""
+Lava droplet scans for day 18. `size` is the number of cubes.
+
+The droplet is a blob of cubes grown outwards from the centre of the area,
+which is 22 cubes wide in every direction (and can't be larger, because that
+is what part 2 expects). It therefore holds at most 22 ** 3 cubes.
+"""
+
+from random import Random
+
+
+SIZES = [500, 1_000, 2_000, 4_000]
+
+AREA_SIZE = 22
+
+
+def generate(size: int, rng: Random) -> str:
+    size = min(size, AREA_SIZE**3)
+    centre = (AREA_SIZE // 2,) * 3
+
+    cubes = {centre}
+    candidates = [centre]
+    while len(cubes) < size:
+        x, y, z = rng.choice(candidates)
+        dx, dy, dz = rng.choice(
+            ((1, 0, 0), (-1, 0, 0), (0, 1, 0), (0, -1, 0), (0, 0, 1), (0, 0, -1))
+        )
+        cube = (x + dx, y + dy, z + dz)
+
+        if cube not in cubes and all(0 <= axis < AREA_SIZE for axis in cube):
+            cubes.add(cube)
+            candidates.append(cube)
+
+    cubes_in_order = sorted(cubes)
+    rng.shuffle(cubes_in_order)
+
+    return "".join(f"{x},{y},{z}\n" for x, y, z in cubes_in_order)
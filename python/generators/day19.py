@@ -0,0 +1,26 @@
+"""
+Robot blueprints for day 19. `size` is the number of blueprints. Part 2 only
+looks at the first three.
+"""
+
+from random import Random
+
+
+SIZES = [1, 2, 4, 8]
+
+
+def generate(size: int, rng: Random) -> str:
+    lines = []
+
+    for blueprint_id in range(1, size + 1):
+        lines.append(
+            f"Blueprint {blueprint_id}: "
+            f"Each ore robot costs {rng.randint(2, 4)} ore. "
+            f"Each clay robot costs {rng.randint(2, 4)} ore. "
+            f"Each obsidian robot costs {rng.randint(2, 4)} ore "
+            f"and {rng.randint(5, 20)} clay. "
+            f"Each geode robot costs {rng.randint(2, 4)} ore "
+            f"and {rng.randint(5, 20)} obsidian."
+        )
+
+    return "".join(f"{line}\n" for line in lines)
@@ -0,0 +1,12 @@
+"""
+Strategy guides for day 2. `size` is the number of rounds.
+"""
+
+from random import Random
+
+
+SIZES = [10_000, 100_000, 1_000_000]
+
+
+def generate(size: int, rng: Random) -> str:
+    return "".join(f"{rng.choice('ABC')} {rng.choice('XYZ')}\n" for _ in range(size))
@@ -0,0 +1,16 @@
+"""
+Encrypted files for day 20. `size` is the number of numbers, exactly one of
+which is 0.
+"""
+
+from random import Random
+
+
+SIZES = [1_250, 2_500, 5_000, 10_000]
+
+
+def generate(size: int, rng: Random) -> str:
+    numbers = [rng.choice((-1, 1)) * rng.randint(1, 10_000) for _ in range(size - 1)]
+    numbers.insert(rng.randint(0, len(numbers)), 0)
+
+    return "".join(f"{number}\n" for number in numbers)
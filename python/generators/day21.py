@@ -0,0 +1,104 @@
+"""
+Monkey jobs for day 21. `size` is the number of monkeys, give or take one.
+
+One side of root is a chain of operations on the number humn yells, the
+other side a large tree of operations on plain numbers that, like in the real
+puzzle input, only divides when the division has no remainder. The two sides
+are made to match for one particular number yelled by humn, which is the
+answer to part 2. Numbers are kept small enough to be represented exactly by
+a float, because part 2 relies on that.
+"""
+
+import string
+from random import Random
+
+
+SIZES = [1_000, 10_000, 100_000]
+
+MAX_CHAIN_LENGTH = 30
+MAX_VALUE = 1_000_000
+
+
+def generate(size: int, rng: Random) -> str:
+    jobs: dict[str, str] = {}
+    names = set(["root", "humn"])
+
+    def add_monkey(job: str) -> str:
+        while True:
+            name = "".join(rng.choices(string.ascii_lowercase, k=4))
+            if name not in names:
+                break
+
+        names.add(name)
+        jobs[name] = job
+        return name
+
+    # The chain of operations on humn, evaluated both for the number that
+    # humn yells in part 1 and for the one that part 2 is looking for
+    jobs["humn"] = str(rng.randint(1, 100))
+    chain = "humn"
+    chain_value = rng.randint(1, 10_000)
+    chain_length = min(MAX_CHAIN_LENGTH, max(1, size // 8))
+    for _ in range(chain_length):
+        number = rng.randint(2, 5) if rng.random() < 0.3 else rng.randint(1, 100)
+        number_monkey = add_monkey(str(number))
+
+        operation = "*" if number <= 5 else rng.choice("+-")
+        if operation == "-" and rng.random() < 0.5:
+            chain = add_monkey(f"{number_monkey} - {chain}")
+            chain_value = number - chain_value
+        else:
+            chain = add_monkey(f"{chain} {operation} {number_monkey}")
+            chain_value = calculate(chain_value, operation, number)
+
+    # The other side of root starts out as a pool of numbers that get
+    # combined at random until one number remains
+    num_numbers = max(1, (size - len(jobs) - 3) // 2 + 1)
+    pool = []
+    for _ in range(num_numbers):
+        number = rng.randint(1, 20)
+        pool.append((add_monkey(str(number)), number))
+
+    while len(pool) > 1:
+        (name_1, value_1) = pool.pop(rng.randrange(len(pool)))
+        (name_2, value_2) = pool.pop(rng.randrange(len(pool)))
+
+        operations = ["+", "-", "*", "/"]
+        rng.shuffle(operations)
+        for operation in operations:
+            if operation == "/" and (value_2 == 0 or value_1 % value_2 != 0):
+                continue
+
+            value = calculate(value_1, operation, value_2)
+            if abs(value) <= MAX_VALUE:
+                break
+
+        pool.append((add_monkey(f"{name_1} {operation} {name_2}"), value))
+
+    [(other_side, other_side_value)] = pool
+    difference = add_monkey(str(abs(chain_value - other_side_value)))
+    if chain_value >= other_side_value:
+        other_side = add_monkey(f"{other_side} + {difference}")
+    else:
+        other_side = add_monkey(f"{other_side} - {difference}")
+
+    jobs["root"] = f"{chain} + {other_side}"
+
+    lines = [f"{name}: {job}" for name, job in jobs.items()]
+    rng.shuffle(lines)
+
+    return "".join(f"{line}\n" for line in lines)
+
+
+def calculate(value_1: int, operation: str, value_2: int) -> int:
+    match operation:
+        case "+":
+            return value_1 + value_2
+        case "-":
+            return value_1 - value_2
+        case "*":
+            return value_1 * value_2
+        case "/":
+            return value_1 // value_2
+
+    raise Exception(f"Unknown operation {operation}")
@@ -0,0 +1,30 @@
+"""
+Monkey maps for day 22. `size` is the width and height of the board, which is
+a square with walls scattered over it. The path has 10 * `size` instructions.
+"""
+
+from random import Random
+
+
+SIZES = [50, 100, 200, 400]
+
+WALL_DENSITY = 0.1
+
+
+def generate(size: int, rng: Random) -> str:
+    rows = []
+    for _ in range(size):
+        rows.append(
+            "".join("#" if rng.random() < WALL_DENSITY else "." for _ in range(size))
+        )
+
+    # The path starts at the leftmost open tile of the top row, so there has
+    # to be one
+    rows[0] = "." + rows[0][1:]
+
+    path = [str(rng.randint(1, 50))]
+    for _ in range(10 * size - 1):
+        path.append(rng.choice("LR"))
+        path.append(str(rng.randint(1, 50)))
+
+    return "\n".join(rows) + "\n\n" + "".join(path) + "\n"
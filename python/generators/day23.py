@@ -0,0 +1,15 @@
+"""
+Elf scans for day 23. `size` is the width and height of the scanned area,
+about half of which is taken up by elves.
+"""
+
+from random import Random
+
+
+SIZES = [25, 50, 75, 100]
+
+
+def generate(size: int, rng: Random) -> str:
+    return "".join(
+        "".join(rng.choice(".#") for _ in range(size)) + "\n" for _ in range(size)
+    )
@@ -0,0 +1,35 @@
+"""
+Blizzard basin maps for day 24. `size` is the width and height of the basin,
+walls included.
+
+Like in the real puzzle input, no blizzards move up or down in the columns of
+the entrance and the exit, because they would otherwise blow straight into
+them.
+"""
+
+from random import Random
+
+
+SIZES = [10, 20, 50, 100]
+
+BLIZZARD_DENSITY = 0.3
+
+
+def generate(size: int, rng: Random) -> str:
+    entrance_x = 1
+    exit_x = size - 2
+
+    rows = ["#." + "#" * (size - 2)]
+    for _ in range(size - 2):
+        row = "#"
+        for x in range(1, size - 1):
+            if rng.random() >= BLIZZARD_DENSITY:
+                row += "."
+            elif x in (entrance_x, exit_x):
+                row += rng.choice("<>")
+            else:
+                row += rng.choice("<>^v")
+        rows.append(row + "#")
+    rows.append("#" * (size - 2) + ".#")
+
+    return "".join(f"{row}\n" for row in rows)
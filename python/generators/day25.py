@@ -0,0 +1,29 @@
+"""
+Fuel requirements in SNAFU for day 25. `size` is the number of numbers.
+"""
+
+from random import Random
+
+
+SIZES = [10_000, 100_000, 1_000_000]
+
+SNAFU_DIGITS = "012=-"
+
+
+def generate(size: int, rng: Random) -> str:
+    return "".join(
+        to_snafu(rng.randint(1, 10 ** rng.randint(1, 13))) + "\n" for _ in range(size)
+    )
+
+
+def to_snafu(number: int) -> str:
+    digits = ""
+
+    while number > 0:
+        remainder = number % 5
+        digits = SNAFU_DIGITS[remainder] + digits
+        # The digits = and - stand for -2 and -1, so they borrow from the next
+        # position
+        number = number // 5 + (1 if remainder > 2 else 0)
+
+    return digits
@@ -0,0 +1,49 @@
+"""
+Rucksack contents for day 3. `size` is the number of groups of three elves,
+so the input has 3 * `size` lines.
+
+Every rucksack has exactly one item type in both of its compartments, and
+every group has exactly one item type (the badge) that all three of them
+carry, like in the real puzzle input.
+"""
+
+import string
+from random import Random
+
+
+SIZES = [1_000, 10_000, 100_000]
+
+ITEM_TYPES = string.ascii_letters
+
+
+def generate(size: int, rng: Random) -> str:
+    lines = []
+
+    for _ in range(size):
+        badge = rng.choice(ITEM_TYPES)
+
+        # Each elf of the group packs from their own share of the item types,
+        # so the badge is the only item type they have in common
+        other_item_types = [item for item in ITEM_TYPES if item != badge]
+        rng.shuffle(other_item_types)
+        share_size = len(other_item_types) // 3
+
+        for elf in range(3):
+            share = other_item_types[elf * share_size : (elf + 1) * share_size]
+            lines.append(generate_rucksack(share, badge, rng))
+
+    return "".join(f"{line}\n" for line in lines)
+
+
+def generate_rucksack(item_types: list[str], badge: str, rng: Random) -> str:
+    duplicate, *item_types = item_types
+    half = len(item_types) // 2
+    first_types, second_types = item_types[:half], item_types[half:]
+
+    compartment_size = rng.randint(4, 16)
+    first = [duplicate, badge] + rng.choices(first_types, k=compartment_size - 2)
+    second = [duplicate] + rng.choices(second_types, k=compartment_size - 1)
+    rng.shuffle(first)
+    rng.shuffle(second)
+
+    return "".join(first + second)
@@ -0,0 +1,19 @@
+"""
+Section assignment pairs for day 4. `size` is the number of pairs.
+"""
+
+from random import Random
+
+
+SIZES = [10_000, 100_000, 1_000_000]
+
+
+def generate(size: int, rng: Random) -> str:
+    lines = []
+
+    for _ in range(size):
+        first_start, first_end = sorted(rng.randint(1, 99) for _ in range(2))
+        second_start, second_end = sorted(rng.randint(1, 99) for _ in range(2))
+        lines.append(f"{first_start}-{first_end},{second_start}-{second_end}\n")
+
+    return "".join(lines)
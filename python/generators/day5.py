@@ -0,0 +1,45 @@
+"""
+Crate stacks and rearrangement procedures for day 5. `size` is the number of
+move instructions.
+
+Moves never take the last crate from a stack, so every stack still has a
+crate on top at the end.
+"""
+
+import string
+from random import Random
+
+
+SIZES = [10_000, 100_000, 1_000_000]
+
+NUM_STACKS = 9
+START_HEIGHT = 8
+
+
+def generate(size: int, rng: Random) -> str:
+    heights = [rng.randint(2, START_HEIGHT) for _ in range(NUM_STACKS)]
+
+    lines = []
+    for level in reversed(range(START_HEIGHT)):
+        crates = [
+            f"[{rng.choice(string.ascii_uppercase)}]" if level < height else "   "
+            for height in heights
+        ]
+        lines.append(" ".join(crates))
+    lines.append(" ".join(f" {stack} " for stack in range(1, NUM_STACKS + 1)))
+    lines.append("")
+
+    for _ in range(size):
+        from_stack = rng.choice(
+            [stack for stack in range(NUM_STACKS) if heights[stack] > 1]
+        )
+        to_stack = rng.choice(
+            [stack for stack in range(NUM_STACKS) if stack != from_stack]
+        )
+        num_crates = rng.randint(1, min(heights[from_stack] - 1, 10))
+
+        heights[from_stack] -= num_crates
+        heights[to_stack] += num_crates
+        lines.append(f"move {num_crates} from {from_stack + 1} to {to_stack + 1}")
+
+    return "".join(f"{line}\n" for line in lines)
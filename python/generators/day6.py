@@ -0,0 +1,22 @@
+"""
+Datastream buffers for day 6. `size` is the number of characters.
+
+The buffer is made of only three different characters up until the very end,
+where a start-of-message marker is placed, so the solvers have to go through
+all of it.
+"""
+
+import string
+from random import Random
+
+
+SIZES = [10_000, 100_000, 1_000_000]
+
+MARKER_LEN = 14
+
+
+def generate(size: int, rng: Random) -> str:
+    marker = rng.sample(string.ascii_lowercase, k=MARKER_LEN)
+    noise = rng.choices(marker[:3], k=max(0, size - MARKER_LEN))
+
+    return "".join(noise + marker) + "\n"
@@ -0,0 +1,58 @@
+"""
+Terminal output for day 7. `size` is the number of entries (files and
+directories) in the filesystem.
+
+The file sizes are chosen so that the filesystem always holds about 50000000
+in total, which leaves too little free space and gives part 2 something to
+delete regardless of the number of files.
+"""
+
+from random import Random
+
+
+SIZES = [1_000, 10_000, 100_000]
+
+TOTAL_USED_SPACE = 50_000_000
+MAX_DEPTH = 20
+
+
+def generate(size: int, rng: Random) -> str:
+    # Directory tree as a dict of dicts, files are stored as their size
+    root: dict = {}
+    directories = [(root, 0)]
+
+    num_files = 0
+    for entry in range(size):
+        directory, depth = rng.choice(directories)
+        name = f"e{entry}"
+
+        if depth < MAX_DEPTH and rng.random() < 0.2:
+            directory[name] = {}
+            directories.append((directory[name], depth + 1))
+        else:
+            directory[name] = None
+            num_files += 1
+
+    average_file_size = TOTAL_USED_SPACE // max(1, num_files)
+    lines = ["$ cd /"]
+    list_directory(root, lines, average_file_size, rng)
+
+    return "".join(f"{line}\n" for line in lines)
+
+
+def list_directory(
+    directory: dict, lines: list[str], average_file_size: int, rng: Random
+):
+    lines.append("$ ls")
+    for name, entry in directory.items():
+        if entry is None:
+            file_size = rng.randint(average_file_size // 2, average_file_size * 3 // 2)
+            lines.append(f"{file_size} {name}.txt")
+        else:
+            lines.append(f"dir {name}")
+
+    for name, entry in directory.items():
+        if entry is not None:
+            lines.append(f"$ cd {name}")
+            list_directory(entry, lines, average_file_size, rng)
+            lines.append("$ cd ..")
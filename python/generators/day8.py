@@ -0,0 +1,14 @@
+"""
+Tree height maps for day 8. `size` is the width and height of the forest.
+"""
+
+from random import Random
+
+
+SIZES = [50, 100, 200, 400]
+
+
+def generate(size: int, rng: Random) -> str:
+    return "".join(
+        "".join(rng.choices("0123456789", k=size)) + "\n" for _ in range(size)
+    )
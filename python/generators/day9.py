@@ -0,0 +1,12 @@
+"""
+Rope motions for day 9. `size` is the number of motions.
+"""
+
+from random import Random
+
+
+SIZES = [10_000, 100_000, 1_000_000]
+
+
+def generate(size: int, rng: Random) -> str:
+    return "".join(f"{rng.choice('UDLR')} {rng.randint(1, 20)}\n" for _ in range(size))
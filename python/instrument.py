@@ -0,0 +1,166 @@
+"""
+Lets solvers report what they spend their time on, and how much work their
+searches do, without having to run them through a profiler.
+
+Solvers mark the phases they go through, and count the events in their hot
+loops:
+
+    from instrument import count, maximum, phase
+
+    @phase("precompute")
+    def compress_graph(graph):
+        ...
+
+    with phase("search"):
+        while queue:
+            count("states expanded")
+            maximum("queue size", len(queue))
+            ...
+
+Nothing is collected unless a run is being recorded, in which case the time
+spent in every phase and the value of every counter end up in the recording:
+
+    with record() as recording:
+        solve(input_text)
+
+    print(json.dumps(recording.as_dict()))
+
+runner.py does this for every run when it's given `--instrument FILE`.
+
+Work that's done in another process, where this module's recording isn't
+available, can make a recording of its own and send it back, to be added to
+the one in progress with `merge(recording)`. `is_recording()` tells whether
+that's worth the trouble.
+
+Phases can be nested, in which case their names are joined with a slash, e.g.
+"search/expand". A decorated function therefore shows up under the phase it
+was called from. Recursive calls of a decorated function count as a single
+call, the outermost one.
+"""
+
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import wraps
+
+
+class Recording:
+    def __init__(self):
+        self.phases: dict[str, dict] = {}
+        self.counters: dict[str, int] = {}
+        self.maxima: dict[str, int] = {}
+        self.phase_stack: list[str] = []
+
+    def as_dict(self) -> dict:
+        return {
+            "phases": self.phases,
+            "counters": self.counters,
+            "maxima": self.maxima,
+        }
+
+
+# The recording in progress, if any
+current_recording: Recording | None = None
+
+
+@contextmanager
+def record() -> Iterator[Recording]:
+    global current_recording
+
+    previous_recording = current_recording
+    current_recording = Recording()
+    try:
+        yield current_recording
+    finally:
+        current_recording = previous_recording
+
+
+class phase:
+    """Measures the time spent in a block of code, or in a function when used
+    as a decorator. Entering the same phase more than once adds up the time.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.recording: Recording | None = None
+        self.start = 0.0
+
+    def __enter__(self) -> "phase":
+        recording = current_recording
+
+        # A recursive function enters its own phase again, while the outermost
+        # call is already timing it
+        if recording is None or recording.phase_stack[-1:] == [self.name]:
+            self.recording = None
+            return self
+
+        self.recording = recording
+        recording.phase_stack.append(self.name)
+        self.start = time.perf_counter()
+
+        return self
+
+    def __exit__(self, *exception_info):
+        if self.recording is None:
+            return
+
+        elapsed = time.perf_counter() - self.start
+        name = "/".join(self.recording.phase_stack)
+        self.recording.phase_stack.pop()
+
+        totals = self.recording.phases.setdefault(name, {"seconds": 0.0, "calls": 0})
+        totals["seconds"] += elapsed
+        totals["calls"] += 1
+
+    def __call__(self, function: Callable) -> Callable:
+        @wraps(function)
+        def function_in_phase(*args, **kwargs):
+            # Every call gets its own start time, in case it's a recursive one
+            with phase(self.name):
+                return function(*args, **kwargs)
+
+        return function_in_phase
+
+
+def count(name: str, amount: int = 1):
+    if current_recording is None:
+        return
+
+    counters = current_recording.counters
+    counters[name] = counters.get(name, 0) + amount
+
+
+def maximum(name: str, value: int):
+    """Keeps track of the highest value seen, e.g. the peak size of a queue."""
+    if current_recording is None:
+        return
+
+    maxima = current_recording.maxima
+    if value > maxima.get(name, value - 1):
+        maxima[name] = value
+
+
+def is_recording() -> bool:
+    return current_recording is not None
+
+
+def merge(recording: Recording):
+    """Adds up a recording that was made elsewhere, e.g. in a worker process,
+    and the one in progress. Its phases end up under the current phase.
+    """
+    if current_recording is None:
+        return
+
+    prefix = "".join(name + "/" for name in current_recording.phase_stack)
+    for name, phase_totals in recording.phases.items():
+        totals = current_recording.phases.setdefault(
+            prefix + name, {"seconds": 0.0, "calls": 0}
+        )
+        totals["seconds"] += phase_totals["seconds"]
+        totals["calls"] += phase_totals["calls"]
+
+    for name, amount in recording.counters.items():
+        count(name, amount)
+
+    for name, value in recording.maxima.items():
+        maximum(name, value)
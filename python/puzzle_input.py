@@ -0,0 +1,100 @@
+"""
+Loads puzzle input files without reading them into memory.
+
+The scripts read their input with `open(...).read()`, which keeps a copy of
+the whole file in memory, plus a separate string for every line once it's
+split up. That's fine for the real puzzle inputs, but not for the much larger
+synthetic ones (see generators/). `PuzzleInput` memory-maps the file instead,
+so the operating system pages it in as it's read, and only the block of
+lines that's being worked on is ever copied out of it:
+
+    with PuzzleInput("../puzzle-input/day1-input.txt") as puzzle_input:
+        for line in puzzle_input:
+            ...
+
+The days that only look at one line at a time (1, 2, 3, 4, 10 and 25) have a
+`solve_lines(lines)` function that takes the lines as bytes, which is what
+iterating over a `PuzzleInput` gives. `read_lines()` gives the same for
+streams that can't be mapped, like stdin (see stream.py).
+
+Those days are given a `PuzzleInput` whenever their input is a file that can
+be much larger than the puzzle input: by `aoc.py run --input FILE`,
+`stream.py --input FILE` and `benchmark.py`, which writes the inputs it
+generates to a file first. `runner.run_solver()` measures them that way too,
+when it's given the path of the input. The runner's usual runs over the real
+puzzle inputs (`run_serially()` and `run_in_parallel()`) don't: those inputs
+are small, and the worker processes already share them as text.
+
+This is less than a zero-copy loader. Every line is still copied out of the
+mapping as a new `bytes` object, because the solvers split, strip and decode
+their lines, which a memoryview can't do. There is no index of where the
+lines start either, as the solvers only ever go through them in order, and no
+cache of parsed inputs: answers are cached by result_cache.py instead, and
+measured runs should include the parsing.
+"""
+
+import mmap
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator
+
+
+PUZZLE_INPUT_DIR = Path(__file__).resolve().parent.parent / "puzzle-input"
+
+BLOCK_SIZE = 1024 * 1024
+
+
+class PuzzleInput:
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+
+        with open(self.path, "rb") as input_file:
+            # Empty files can't be mapped, and they have no lines to look at
+            # anyway
+            if self.path.stat().st_size == 0:
+                self.data = b""
+            else:
+                self.data = mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __enter__(self) -> "PuzzleInput":
+        return self
+
+    def __exit__(self, *exception_info):
+        self.close()
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Iterates over the lines in order, as copies without line endings.
+        The file is split into lines a block at a time, which is a lot faster
+        than looking for the end of every line separately.
+        """
+        blocks = (
+            self.data[block_start : block_start + BLOCK_SIZE]
+            for block_start in range(0, len(self.data), BLOCK_SIZE)
+        )
+
+        return split_into_lines(blocks)
+
+    def text(self) -> str:
+        return self.data[:].decode()
+
+
+def split_into_lines(blocks: Iterable[bytes]) -> Iterator[bytes]:
+    unfinished_line = b""
+
+    for block in blocks:
+        # The last line of a block usually continues in the next one
+        *lines, unfinished_line = (unfinished_line + block).split(b"\n")
+        yield from lines
+
+    if unfinished_line:
+        yield unfinished_line
+
+
+def read_lines(stream: BinaryIO) -> Iterator[bytes]:
+    """Yields the lines (without line endings) of a stream that can only be
+    read from front to back, such as stdin or a pipe, a block at a time.
+    """
+    return split_into_lines(iter(lambda: stream.read(BLOCK_SIZE), b""))
@@ -0,0 +1,91 @@
+"""
+Keeps the answers of earlier runs on disk, so that running a day again on the
+same input doesn't redo all of the work.
+
+Every answer is stored in its own file under ~/.cache/aoc2022/results/, named
+after a hash of the day, the part, the SHA-256 of the input and the version of
+the solver. The version is the SHA-256 of the solver's source code, so any
+change to a solver leaves its earlier answers behind instead of returning them.
+
+The cache is kept below a maximum size by removing the answers that were used
+least recently. Looking up an answer counts as using it.
+"""
+
+import hashlib
+import json
+import os
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any
+
+
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "aoc2022"
+RESULT_CACHE_DIR = CACHE_DIR / "results"
+
+DEFAULT_MAX_SIZE = 1024 * 1024
+
+
+def solver_version(module_name: str) -> str:
+    spec = find_spec(module_name)
+    if spec is None or spec.origin is None:
+        raise Exception("Can't find the source of solver %s" % module_name)
+
+    return hashlib.sha256(Path(spec.origin).read_bytes()).hexdigest()
+
+
+def cache_key(day: int, part: int, input_data: bytes, version: str) -> str:
+    input_hash = hashlib.sha256(input_data).hexdigest()
+
+    return hashlib.sha256(f"{day}:{part}:{input_hash}:{version}".encode()).hexdigest()
+
+
+class ResultCache:
+    def __init__(
+        self, directory: Path = RESULT_CACHE_DIR, max_size: int = DEFAULT_MAX_SIZE
+    ):
+        self.directory = directory
+        self.max_size = max_size
+
+    def path_for(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Any | None:
+        """Returns the cached answer, or None if there isn't one."""
+        path = self.path_for(key)
+
+        try:
+            answer = json.loads(path.read_text())["answer"]
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            return None
+
+        # The modification time tells which answers were used least recently
+        path.touch()
+
+        return answer
+
+    def put(self, key: str, answer: Any):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.path_for(key).write_text(json.dumps({"answer": answer}))
+
+        self.evict()
+
+    def evict(self):
+        """Removes the least recently used answers until the cache fits within
+        its maximum size again.
+        """
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+
+            path.unlink(missing_ok=True)
+            total_size -= size
@@ -0,0 +1,470 @@
+"""
+Runs the solvers of one or more days and reports how long they took and how
+much memory they needed.
+
+Every `dayN.py` (part 1) and `dayN-part2.py` (part 2) script exposes a
+`solve(input_text)` function. The runner imports those scripts as modules,
+reads the puzzle input once and then calls `solve()` as many times as
+requested. That way neither starting up the interpreter nor reading the input
+end up in the measurements.
+
+Run it from the python/ directory:
+
+    python runner.py                  # All days, both parts
+    python runner.py 16 17 19 24      # Only the slow days
+    python runner.py 16 --repeat 5    # Day 16, min/median of 5 runs
+    python runner.py --jobs 0         # All days, one worker per CPU core
+    python runner.py 16 --instrument day16.json  # Phases and counters per run
+
+With `--jobs` the solvers are spread over a pool of worker processes. Each
+input file is read once and put in shared memory for the workers to pick up.
+The solvers that took the longest during previous runs are started first
+(longest-processing-time-first scheduling), so the total wall time ends up
+close to that of the slowest solver instead of the sum of all of them.
+
+Answers are cached (see result_cache.py), so a day that was run before on the
+same input with the same version of its solver isn't run again, unless
+`--no-cache` is given. Runs that are meant to measure something, with
+`--repeat` or `--instrument`, never use the cache.
+"""
+
+import argparse
+import importlib
+import json
+import math
+import os
+import statistics
+import time
+import tracemalloc
+from collections import namedtuple
+from importlib.util import find_spec
+from pathlib import Path
+
+import instrument
+from aoc import DAYS, PARTS, module_name_for
+from puzzle_input import PUZZLE_INPUT_DIR, PuzzleInput
+from result_cache import CACHE_DIR, ResultCache, cache_key, solver_version
+
+
+TIMING_HISTORY_PATH = CACHE_DIR / "timings.json"
+
+Solver = namedtuple("Solver", ["day", "part", "module_name"])
+Result = namedtuple(
+    "Result",
+    ["solver", "answer", "timings", "peak_memory", "cached", "recordings"],
+    defaults=[False, None],
+)
+
+
+def find_solvers(days: list[int]) -> list[Solver]:
+    """Lists the solvers for the given days. Days without a solution for one
+    of the parts (day 22 part 2, and day 25 which only has one part) simply
+    have no solver for it.
+    """
+    solvers = []
+
+    for day in days:
+        for part in PARTS:
+            module_name = module_name_for(day, part)
+
+            if find_spec(module_name) is not None:
+                solvers.append(Solver(day, part, module_name))
+
+    return solvers
+
+
+def input_path(day: int) -> Path:
+    return PUZZLE_INPUT_DIR / f"day{day}-input.txt"
+
+
+def result_cache_key(solver: Solver) -> str:
+    return cache_key(
+        solver.day,
+        solver.part,
+        input_path(solver.day).read_bytes(),
+        solver_version(solver.module_name),
+    )
+
+
+def look_up_cached_results(
+    solvers: list[Solver], cache: ResultCache
+) -> tuple[list[Result], list[Solver]]:
+    """Splits the solvers into the ones of which the answer is cached, which
+    are returned as results, and the ones that still have to run.
+    """
+    cached_results = []
+    uncached_solvers = []
+
+    for solver in solvers:
+        answer = cache.get(result_cache_key(solver))
+
+        if answer is None:
+            uncached_solvers.append(solver)
+        else:
+            cached_results.append(Result(solver, answer, [], None, cached=True))
+
+    return cached_results, uncached_solvers
+
+
+def run_solver(
+    solver: Solver,
+    input_text: str | None,
+    repeat: int,
+    measure_memory: bool = True,
+    instrumented: bool = False,
+    solve_kwargs: dict | None = None,
+    input_path: str | Path | None = None,
+) -> Result:
+    """Runs a solver `repeat` times. When `instrumented`, the phases and
+    counters that the solver reports (see instrument.py) are recorded for
+    every run. `solve_kwargs` are passed on to the solver, e.g. to pick one of
+    its engines.
+
+    Given the `input_path` that `input_text` was read from, solvers that can
+    take their input line by line memory-map it instead (see puzzle_input.py),
+    so that large inputs are measured the way they're meant to be run. Their
+    `input_text` isn't used then, and can be None.
+    """
+    module = importlib.import_module(solver.module_name)
+    solve_kwargs = solve_kwargs or {}
+
+    if input_path is not None and hasattr(module, "solve_lines"):
+
+        def solve():
+            with PuzzleInput(input_path) as puzzle_input:
+                return module.solve_lines(puzzle_input, **solve_kwargs)
+
+    else:
+
+        def solve():
+            return module.solve(input_text, **solve_kwargs)
+
+    answer = None
+    timings = []
+    recordings = [] if instrumented else None
+    for run in range(repeat):
+        if instrumented:
+            with instrument.record() as recording:
+                start = time.perf_counter()
+                run_answer = solve()
+                timings.append(time.perf_counter() - start)
+
+            recordings.append(recording.as_dict())
+        else:
+            start = time.perf_counter()
+            run_answer = solve()
+            timings.append(time.perf_counter() - start)
+
+        if run > 0 and run_answer != answer:
+            raise Exception(
+                "Day %d part %d gave different answers between runs: %r and %r"
+                % (solver.day, solver.part, answer, run_answer)
+            )
+
+        answer = run_answer
+
+    peak_memory = None
+    if measure_memory:
+        # Tracing memory allocations slows the solver down considerably, so
+        # this is done in a separate run that doesn't count towards the timings
+        tracemalloc.start()
+        solve()
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return Result(solver, answer, timings, peak_memory, recordings=recordings)
+
+
+def run_solver_on_shared_input(
+    solver: Solver,
+    shared_memory_name: str,
+    input_size: int,
+    repeat: int,
+    measure_memory: bool,
+    instrumented: bool,
+) -> Result:
+    """Entry point of the worker processes: picks up the puzzle input that the
+    main process has put in shared memory and runs the solver on it.
+    """
+    from multiprocessing.shared_memory import SharedMemory
+
+    shared_memory = SharedMemory(name=shared_memory_name)
+    try:
+        input_text = bytes(shared_memory.buf[:input_size]).decode()
+    finally:
+        shared_memory.close()
+
+    return run_solver(solver, input_text, repeat, measure_memory, instrumented)
+
+
+def run_serially(
+    solvers: list[Solver], repeat: int, measure_memory: bool, instrumented: bool
+) -> list[Result]:
+    input_texts = {}
+    results = []
+
+    for solver in solvers:
+        if solver.day not in input_texts:
+            input_texts[solver.day] = input_path(solver.day).read_text()
+
+        results.append(
+            run_solver(
+                solver, input_texts[solver.day], repeat, measure_memory, instrumented
+            )
+        )
+
+    return results
+
+
+def run_in_parallel(
+    solvers: list[Solver],
+    repeat: int,
+    measure_memory: bool,
+    instrumented: bool,
+    num_workers: int,
+) -> list[Result]:
+    # Only imported when needed, as they take a while to import and most runs
+    # don't use them
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    from multiprocessing.shared_memory import SharedMemory
+
+    # Both parts of a day share the same block of memory
+    shared_inputs: dict[int, tuple[SharedMemory, int]] = {}
+
+    try:
+        for day in sorted(set([solver.day for solver in solvers])):
+            data = input_path(day).read_bytes()
+
+            # A block of shared memory can't be empty
+            shared_memory = SharedMemory(create=True, size=max(1, len(data)))
+            shared_memory.buf[: len(data)] = data
+            shared_inputs[day] = (shared_memory, len(data))
+
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            futures = []
+
+            for solver in schedule_longest_first(solvers):
+                shared_memory, input_size = shared_inputs[solver.day]
+                futures.append(
+                    executor.submit(
+                        run_solver_on_shared_input,
+                        solver,
+                        shared_memory.name,
+                        input_size,
+                        repeat,
+                        measure_memory,
+                        instrumented,
+                    )
+                )
+
+            results = [future.result() for future in as_completed(futures)]
+    finally:
+        for shared_memory, _ in shared_inputs.values():
+            shared_memory.close()
+            shared_memory.unlink()
+
+    # Report in the usual order, instead of the order in which they finished
+    return sorted(results, key=lambda result: (result.solver.day, result.solver.part))
+
+
+def schedule_longest_first(solvers: list[Solver]) -> list[Solver]:
+    """Orders the solvers by how long they took during previous runs, slowest
+    first. Solvers that haven't been timed before are assumed to be slow.
+    """
+    timing_history = load_timing_history()
+
+    return sorted(
+        solvers,
+        key=lambda solver: timing_history.get(solver.module_name, math.inf),
+        reverse=True,
+    )
+
+
+def load_timing_history() -> dict[str, float]:
+    try:
+        return json.loads(TIMING_HISTORY_PATH.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_timing_history(results: list[Result]):
+    timing_history = load_timing_history()
+
+    for result in results:
+        if not result.cached:
+            timing_history[result.solver.module_name] = statistics.median(
+                result.timings
+            )
+
+    TIMING_HISTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
+    TIMING_HISTORY_PATH.write_text(json.dumps(timing_history, indent=2, sort_keys=True))
+
+
+def save_recordings(results: list[Result], path: str):
+    runs = []
+    for result in results:
+        for run, (timing, recording) in enumerate(
+            zip(result.timings, result.recordings)
+        ):
+            runs.append(
+                {
+                    "day": result.solver.day,
+                    "part": result.solver.part,
+                    "run": run + 1,
+                    "seconds": timing,
+                    **recording,
+                }
+            )
+
+    with open(path, "w") as output_file:
+        json.dump(runs, output_file, indent=2)
+
+
+def print_report(results: list[Result], wall_time: float):
+    header = ("Day", "Part", "Answer", "Min (s)", "Median (s)", "Peak memory (KiB)")
+    rows = []
+    multiline_answers = []
+
+    for result in results:
+        answer = str(result.answer)
+        if "\n" in answer:
+            # Answers that are drawn on a screen (day 10 part 2) get printed
+            # below the table
+            multiline_answers.append((result.solver, answer))
+            answer = "(see below)"
+
+        peak_memory = "-"
+        if result.peak_memory is not None:
+            peak_memory = "%.1f" % (result.peak_memory / 1024)
+
+        if result.cached:
+            min_timing = median_timing = "cached"
+        else:
+            min_timing = "%.4f" % min(result.timings)
+            median_timing = "%.4f" % statistics.median(result.timings)
+
+        rows.append(
+            (
+                str(result.solver.day),
+                str(result.solver.part),
+                answer,
+                min_timing,
+                median_timing,
+                peak_memory,
+            )
+        )
+
+    column_widths = [
+        max(len(row[column]) for row in [header] + rows)
+        for column in range(len(header))
+    ]
+    for row in [header] + rows:
+        line = "  ".join(value.ljust(width) for value, width in zip(row, column_widths))
+        print(line.rstrip())
+
+    for solver, answer in multiline_answers:
+        print()
+        print(f"Day {solver.day} part {solver.part}:")
+        print(answer)
+
+    print()
+    print("Total wall time: %.2f s" % wall_time)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Runs the solvers of one or more days and measures them."
+    )
+    parser.add_argument(
+        "days",
+        metavar="DAY",
+        type=int,
+        nargs="*",
+        help="day(s) to run, defaults to all of them",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=1,
+        help="how many times to run each solver (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="skip the extra run that measures peak memory usage",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "number of worker processes to run the solvers in, 0 to use one per"
+            " CPU core (default: %(default)s, run everything in this process)"
+        ),
+    )
+    parser.add_argument(
+        "--instrument",
+        metavar="FILE",
+        help=(
+            "record the phases and counters of every run and write them to this"
+            " file, as JSON"
+        ),
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=(
+            "run every solver, instead of looking up answers that were found"
+            " before on the same input"
+        ),
+    )
+    args = parser.parse_args()
+
+    if args.repeat < 1:
+        parser.error("--repeat should be at least 1")
+
+    for day in args.days:
+        if day not in DAYS:
+            parser.error("there is no day %d" % day)
+
+    if args.jobs < 0:
+        parser.error("--jobs can't be negative")
+
+    solvers = find_solvers(args.days or DAYS)
+    measure_memory = not args.no_memory
+    instrumented = args.instrument is not None
+
+    start = time.perf_counter()
+    result_cache = ResultCache()
+    cached_results = []
+    # A cached answer comes without timings or a recording
+    measured = args.repeat > 1 or instrumented
+    if not args.no_cache and not measured:
+        cached_results, solvers = look_up_cached_results(solvers, result_cache)
+
+    if args.jobs == 1:
+        results = run_serially(solvers, args.repeat, measure_memory, instrumented)
+    else:
+        num_workers = args.jobs or os.cpu_count()
+        results = run_in_parallel(
+            solvers, args.repeat, measure_memory, instrumented, num_workers
+        )
+    wall_time = time.perf_counter() - start
+
+    for result in results:
+        result_cache.put(result_cache_key(result.solver), result.answer)
+    save_timing_history(results)
+    if instrumented:
+        save_recordings(results, args.instrument)
+
+    results = sorted(
+        cached_results + results,
+        key=lambda result: (result.solver.day, result.solver.part),
+    )
+    print_report(results, wall_time)
+
+
+if __name__ == "__main__":
+    main()
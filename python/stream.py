@@ -0,0 +1,55 @@
+"""
+Runs a solver on input that's streamed in, instead of being read into memory
+all at once. This way inputs of any size can be piped through the solvers of
+the days that only look at one line (or group of lines) at a time:
+
+    zcat huge-input.txt.gz | python stream.py 1 --part 2
+    python stream.py 25 --input ../puzzle-input/day25-input.txt
+    python -m generators 4 100000000 | python stream.py 4
+
+Files given with `--input` are memory-mapped (see puzzle_input.py). These
+solvers use the same amount of memory regardless of the size of the input,
+except for day 10 part 2 whose answer, the image on the CRT, grows along with
+it.
+"""
+
+import argparse
+import importlib
+import sys
+
+from aoc import module_name_for
+from puzzle_input import PuzzleInput, read_lines
+
+
+STREAMING_DAYS = (1, 2, 3, 4, 10, 25)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Runs a solver on input that's streamed in through stdin."
+    )
+    parser.add_argument("day", metavar="DAY", type=int, choices=STREAMING_DAYS)
+    parser.add_argument("-p", "--part", type=int, choices=(1, 2), default=1)
+    parser.add_argument(
+        "-i",
+        "--input",
+        metavar="FILE",
+        default="-",
+        help="file to read the input from, or - for stdin (default)",
+    )
+    args = parser.parse_args()
+
+    if args.day == 25 and args.part == 2:
+        parser.error("day 25 only has one part")
+
+    solver = importlib.import_module(module_name_for(args.day, args.part))
+
+    if args.input == "-":
+        print(solver.solve_lines(read_lines(sys.stdin.buffer)))
+    else:
+        with PuzzleInput(args.input) as puzzle_input:
+            print(solver.solve_lines(puzzle_input))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+
+# The solvers are scripts rather than a package, so the python/ directory has
+# to be on the path to import them
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--time-budget-factor",
+        type=float,
+        default=float(os.environ.get("AOC_TIME_BUDGET_FACTOR", 1)),
+        help=(
+            "multiply the time budget of every example by this factor, or 0 to"
+            " not check the time at all (default: $AOC_TIME_BUDGET_FACTOR or 1)"
+        ),
+    )
+
+
+@pytest.fixture
+def time_budget_factor(request) -> float:
+    return request.config.getoption("--time-budget-factor")
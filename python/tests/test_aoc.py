@@ -0,0 +1,96 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+
+AOC_PATH = Path(__file__).resolve().parent.parent / "aoc.py"
+
+
+def aoc(*arguments: str, input_text: str | None = None) -> str:
+    """Runs aoc.py from another directory, to make sure it doesn't depend on
+    being run from python/, and returns what it printed.
+    """
+    completed = subprocess.run(
+        [sys.executable, str(AOC_PATH), *arguments],
+        cwd=AOC_PATH.parent.parent,
+        input=input_text,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    return completed.stdout
+
+
+def test_run_both_parts():
+    assert aoc("run", "1", "--example") == "Day 1 part 1: 24000\nDay 1 part 2: 45000\n"
+
+
+def test_examples_with_their_own_input_and_options():
+    assert aoc("run", "15", "24", "--example") == (
+        "Day 15 part 1: 26\n"
+        "Day 15 part 2: 56000011\n"
+        "Day 24 part 1: 18\n"
+        "Day 24 part 2: 54\n"
+    )
+
+
+def test_run_on_stdin():
+    output = aoc("run", "1", "--part", "2", "--input", "-", input_text="1\n2\n\n3\n")
+
+    assert output == "6\n"
+
+
+def test_run_on_mapped_file(tmp_path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("1\n2\n\n3\n")
+
+    assert aoc("run", "1", "--part", "2", "--input", str(input_path)) == "6\n"
+
+    output = aoc("run", "1", "--part", "2", "--input", str(input_path), "--json")
+    assert json.loads(output)["answer"] == 6
+
+
+def test_json():
+    output = aoc("run", "6", "--example", "--repeat", "3", "--json")
+    measurements = [json.loads(line) for line in output.splitlines()]
+
+    assert [measurement["answer"] for measurement in measurements] == [7, 19]
+    for measurement in measurements:
+        assert len(measurement["timings"]) == 3
+        assert measurement["min"] == min(measurement["timings"])
+
+
+def test_options_are_read_as_literals():
+    output = aoc(
+        "run",
+        "15",
+        "--part",
+        "2",
+        "--example",
+        "--set",
+        "coverage_range_limit=20",
+        "--set",
+        "skip_rows=False",
+        "--set",
+        "engine=intervals",
+        "--json",
+    )
+
+    assert json.loads(output)["options"] == {
+        "coverage_range_limit": 20,
+        "skip_rows": False,
+        "engine": "intervals",
+    }
+
+
+def test_unknown_option():
+    completed = subprocess.run(
+        [sys.executable, str(AOC_PATH), "run", "6", "--example", "--set", "nope=1"],
+        capture_output=True,
+        text=True,
+    )
+
+    assert completed.returncode == 2
+    assert "day 6 part 1 has no option nope" in completed.stderr
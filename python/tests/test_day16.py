@@ -0,0 +1,36 @@
+import importlib
+from random import Random
+
+import pytest
+
+from generators import day16 as day16_generator
+
+
+day16_part2 = importlib.import_module("day16-part2")
+
+
+@pytest.mark.parametrize("seed", range(10))
+@pytest.mark.parametrize("num_agents", [1, 2, 3, 4])
+def test_engines_agree(seed: int, num_agents: int):
+    input_text = day16_generator.generate(20, Random(seed))
+
+    assert day16_part2.solve(
+        input_text, engine="search", num_agents=num_agents
+    ) == day16_part2.solve(input_text, engine="valve-sets", num_agents=num_agents)
+
+
+@pytest.mark.parametrize("engine", ["valve-sets", "search"])
+@pytest.mark.parametrize("num_agents", [0, -1])
+def test_needs_an_agent(engine: str, num_agents: int):
+    input_text = day16_generator.generate(20, Random(0))
+
+    with pytest.raises(ValueError):
+        day16_part2.solve(input_text, engine=engine, num_agents=num_agents)
+
+
+def test_valve_set_limit():
+    num_valves = day16_part2.MAX_VALVE_SET_VALVES + 1
+    input_text = day16_generator.generate(num_valves * 4, Random(0))
+
+    with pytest.raises(ValueError):
+        day16_part2.solve(input_text, engine="valve-sets")
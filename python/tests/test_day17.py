@@ -0,0 +1,52 @@
+import importlib
+
+import pytest
+
+import day17
+from puzzle_input import PUZZLE_INPUT_DIR
+
+
+EXAMPLE_INPUT = (PUZZLE_INPUT_DIR / "day17-example-input.txt").read_text()
+
+
+def test_chamber_stays_bounded():
+    num_pieces = 50_000
+    chamber = day17.build_tower(EXAMPLE_INPUT, num_pieces)
+
+    assert chamber.height_offset > 0
+    assert len(chamber.rows) <= day17.MAX_ROWS
+    # Part 2 finds the same height from the repeating part of the tower
+    part2 = importlib.import_module("day17-part2")
+    assert chamber.tower_height() == part2.solve(EXAMPLE_INPUT, num_pieces)
+
+
+@pytest.mark.parametrize("jet_pattern", ["<", ">"])
+def test_chamber_stays_bounded_without_sealed_rows(jet_pattern: str):
+    # Pieces pushed against one wall never close off the other side
+    chamber = day17.build_tower(jet_pattern, 20_000)
+
+    assert len(chamber.rows) <= day17.MAX_ROWS
+
+
+@pytest.mark.parametrize("jet_pattern", ["<", ">"])
+def test_finds_cycle_with_open_columns(jet_pattern: str):
+    part2 = importlib.import_module("day17-part2")
+
+    # With a single jet the tower repeats with the pieces, so the height after
+    # all pieces follows from how much it grows with every round of pieces
+    num_pieces_per_round = len(day17.PIECES)
+    start = 1000
+    heights = [
+        day17.build_tower(
+            jet_pattern, start + round * num_pieces_per_round
+        ).tower_height()
+        for round in range(3)
+    ]
+    growth = heights[1] - heights[0]
+    assert heights[2] - heights[1] == growth
+
+    num_rounds = (part2.NUM_PIECES - start) // num_pieces_per_round
+    assert part2.solve(jet_pattern) == heights[0] + num_rounds * growth
+    assert part2.solve(jet_pattern, start + 3) == (
+        day17.build_tower(jet_pattern, start + 3).tower_height()
+    )
@@ -0,0 +1,113 @@
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from puzzle_input import PUZZLE_INPUT_DIR
+
+
+COMPLEX_EXAMPLE_LINES = (
+    (PUZZLE_INPUT_DIR / "day24-complex-example-input.txt")
+    .read_text()
+    .splitlines(keepends=True)
+)
+
+day24 = importlib.import_module("day24")
+day24_part2 = importlib.import_module("day24-part2")
+
+
+def assert_valid_route(map, route: list, minutes: int, start_minute: int = 0):
+    """Checks that the route has a position for every minute, that every step
+    either waits or moves to a neighbouring position, and that none of them end
+    up in a wall or blizzard.
+    """
+    assert len(route) == minutes + 1
+
+    for minute, (position, next_position) in enumerate(
+        zip(route, route[1:]), start=start_minute + 1
+    ):
+        assert day24.manhattan_distance(position, next_position) <= 1
+        assert map.is_accessible(next_position, minute)
+
+
+def test_find_path():
+    map = day24.parse_map(COMPLEX_EXAMPLE_LINES)
+
+    route, minutes = day24.find_path(map)
+
+    assert minutes == 18
+    assert route[0] == map.entrance
+    assert route[-1] == map.exit
+    assert_valid_route(map, route, minutes)
+
+
+@pytest.mark.parametrize(
+    "to_exit, start_minute, expected_minutes", [(True, 0, 18), (False, 18, 23)]
+)
+def test_find_path_part2(to_exit: bool, start_minute: int, expected_minutes: int):
+    map = day24_part2.parse_map(COMPLEX_EXAMPLE_LINES)
+    from_, to = map.entrance, map.exit
+    if not to_exit:
+        from_, to = to, from_
+
+    route, minutes = day24_part2.find_path(map, from_, to, start_minute)
+
+    assert minutes == expected_minutes
+    assert route[0] == from_
+    assert route[-1] == to
+    assert_valid_route(map, route, minutes, start_minute)
+
+
+@pytest.mark.parametrize("engine", ["frontier", "a-star"])
+def test_plan_trip_via_waypoints_in_basin(engine: str):
+    map = day24_part2.parse_map(COMPLEX_EXAMPLE_LINES)
+    waypoint = day24_part2.Point(3, 2)
+
+    legs = day24_part2.plan_trip(map, [map.entrance, waypoint, map.exit], 0, engine)
+
+    assert [leg.minutes for leg in legs] == [7, 11]
+    assert [leg.start_minute for leg in legs] == [0, 7]
+    if engine == "a-star":
+        for leg in legs:
+            assert_valid_route(map, leg.route, leg.minutes, leg.start_minute)
+
+
+def test_plan_trip_from_later_minute():
+    map = day24_part2.parse_map(COMPLEX_EXAMPLE_LINES)
+
+    # The trip back for the snacks and to the exit again, after the first
+    # trip to the exit took 18 minutes
+    legs = day24_part2.plan_trip(map, [map.exit, map.entrance, map.exit], 18)
+
+    assert [leg.minutes for leg in legs] == [23, 13]
+    assert [leg.start_minute for leg in legs] == [18, 41]
+
+
+def test_plan_trip_leaves_map_unchanged():
+    map = day24_part2.parse_map(COMPLEX_EXAMPLE_LINES)
+    entrance, exit = map.entrance, map.exit
+
+    day24_part2.plan_trip(map, [exit, day24_part2.Point(4, 3), entrance, exit])
+
+    assert map.entrance == entrance
+    assert map.exit == exit
+
+
+def test_plan_trips_at_same_time():
+    Point = day24_part2.Point
+    map = day24_part2.parse_map(COMPLEX_EXAMPLE_LINES)
+    trips = [
+        ([map.entrance, map.exit, map.entrance, map.exit], 0),
+        ([map.entrance, Point(3, 2), map.exit], 5),
+        ([map.exit, Point(1, 1), Point(6, 4)], 0),
+        ([Point(4, 3), map.entrance], 7),
+    ]
+
+    with ThreadPoolExecutor(max_workers=len(trips)) as executor:
+        shared_map_legs = list(
+            executor.map(lambda trip: day24_part2.plan_trip(map, *trip), trips)
+        )
+
+    for trip, legs in zip(trips, shared_map_legs):
+        own_map = day24_part2.parse_map(COMPLEX_EXAMPLE_LINES)
+        assert legs == day24_part2.plan_trip(own_map, *trip)
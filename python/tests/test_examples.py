@@ -0,0 +1,63 @@
+"""
+Runs every solver on the example inputs from the puzzle descriptions, and
+checks that it finds the right answer within its time budget.
+
+The budgets leave plenty of room for slower machines. They can be scaled with
+`--time-budget-factor` (or the AOC_TIME_BUDGET_FACTOR environment variable),
+e.g. to tighten them while optimizing a day, and 0 turns them off.
+"""
+
+import importlib
+import time
+
+import pytest
+
+from examples import EXAMPLES, Example
+from puzzle_input import PUZZLE_INPUT_DIR
+
+
+# Known to fail, but kept to see whether that changes
+FAILING_EXAMPLES = [
+    pytest.param(
+        Example(
+            "day19-part2",
+            "day19-example-input.txt",
+            56 * 62,
+            time_budget=300,
+            solve_kwargs={"engine": "minute-by-minute"},
+        ),
+        marks=pytest.mark.xfail(
+            reason=(
+                "Pruning on the best geode count per minute cuts off the best"
+                " path when there are 32 minutes"
+            )
+        ),
+    ),
+]
+
+
+def example_id(example: Example) -> str:
+    options = "".join(
+        f":{name}={value}" for name, value in example.solve_kwargs.items()
+    )
+
+    return f"{example.module_name}:{example.input_file}{options}"
+
+
+@pytest.mark.parametrize("example", EXAMPLES + FAILING_EXAMPLES, ids=example_id)
+def test_example(example: Example, time_budget_factor: float):
+    solve = importlib.import_module(example.module_name).solve
+    input_text = (PUZZLE_INPUT_DIR / example.input_file).read_text()
+
+    start = time.perf_counter()
+    answer = solve(input_text, **example.solve_kwargs)
+    elapsed = time.perf_counter() - start
+
+    assert answer == example.answer
+
+    time_budget = example.time_budget * time_budget_factor
+    if time_budget > 0:
+        assert elapsed <= time_budget, "Took %.2f s, the budget is %.2f s" % (
+            elapsed,
+            time_budget,
+        )
@@ -0,0 +1,63 @@
+import importlib
+import io
+
+import pytest
+
+from puzzle_input import PUZZLE_INPUT_DIR, PuzzleInput, read_lines
+
+
+STREAMING_MODULES = [
+    "day1",
+    "day1-part2",
+    "day2",
+    "day2-part2",
+    "day3",
+    "day3-part2",
+    "day4",
+    "day4-part2",
+    "day10",
+    "day10-part2",
+    "day25",
+]
+
+
+@pytest.fixture
+def input_file(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"first\n\nthird\nlast")
+    return path
+
+
+@pytest.mark.parametrize("block_size", [3, 1024])
+def test_iterates_over_lines(monkeypatch, input_file, block_size):
+    monkeypatch.setattr("puzzle_input.BLOCK_SIZE", block_size)
+
+    with PuzzleInput(input_file) as puzzle_input:
+        assert list(puzzle_input) == [b"first", b"", b"third", b"last"]
+
+
+def test_empty_input(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+
+    with PuzzleInput(path) as puzzle_input:
+        assert list(puzzle_input) == []
+
+
+@pytest.mark.parametrize("block_size", [3, 1024])
+def test_reads_lines_from_stream(monkeypatch, block_size):
+    # With small blocks, most lines are spread over more than one block
+    monkeypatch.setattr("puzzle_input.BLOCK_SIZE", block_size)
+
+    stream = io.BytesIO(b"first\n\nthird\nlast\n")
+    assert list(read_lines(stream)) == [b"first", b"", b"third", b"last"]
+
+
+@pytest.mark.parametrize("module_name", STREAMING_MODULES)
+def test_solve_lines_gives_same_answer(module_name):
+    solver = importlib.import_module(module_name)
+    day = module_name.split("-")[0]
+    path = PUZZLE_INPUT_DIR / f"{day}-input.txt"
+
+    with PuzzleInput(path) as puzzle_input:
+        assert solver.solve_lines(puzzle_input) == solver.solve(path.read_text())
@@ -0,0 +1,81 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from result_cache import ResultCache
+
+
+RUNNER_PATH = Path(__file__).resolve().parent.parent / "runner.py"
+
+
+def set_last_used(cache: ResultCache, key: str, seconds: int):
+    os.utime(cache.path_for(key), ns=(seconds * 10**9, seconds * 10**9))
+
+
+def entry_size(cache: ResultCache, key: str) -> int:
+    return cache.path_for(key).stat().st_size
+
+
+def test_gets_what_was_put(tmp_path):
+    cache = ResultCache(tmp_path)
+    cache.put("a", 42)
+
+    assert cache.get("a") == 42
+    assert cache.get("b") is None
+
+
+def test_get_marks_the_answer_as_used(tmp_path):
+    cache = ResultCache(tmp_path)
+    cache.put("a", 1)
+    set_last_used(cache, "a", 1000)
+
+    cache.get("a")
+
+    assert cache.path_for("a").stat().st_mtime_ns > 1000 * 10**9
+
+
+def test_evicts_the_least_recently_used_answers(tmp_path):
+    cache = ResultCache(tmp_path)
+    for seconds, key in enumerate(["a", "b", "c"], start=1000):
+        cache.put(key, key)
+        set_last_used(cache, key, seconds)
+
+    # Looking up the oldest answer makes "b" the least recently used one
+    cache.get("a")
+    cache.max_size = entry_size(cache, "a") + entry_size(cache, "c")
+    cache.evict()
+
+    assert cache.get("a") == "a"
+    assert cache.get("b") is None
+    assert cache.get("c") == "c"
+
+
+def test_stays_within_its_maximum_size(tmp_path):
+    cache = ResultCache(tmp_path)
+    cache.put("a", 1)
+    cache.max_size = 3 * entry_size(cache, "a")
+
+    for number in range(10):
+        cache.put(str(number), number)
+
+    total_size = sum(path.stat().st_size for path in tmp_path.glob("*.json"))
+    assert total_size <= cache.max_size
+
+
+def test_measured_runs_skip_the_cache(tmp_path):
+    def run_instrumented() -> list:
+        recording_path = tmp_path / "recording.json"
+        subprocess.run(
+            [sys.executable, str(RUNNER_PATH), "6", "--instrument", recording_path],
+            cwd=RUNNER_PATH.parent,
+            env={**os.environ, "XDG_CACHE_HOME": str(tmp_path / "cache")},
+            capture_output=True,
+            check=True,
+        )
+        return json.loads(recording_path.read_text())
+
+    assert len(run_instrumented()) == 2
+    # The answers are cached by now, but they come without a recording
+    assert len(run_instrumented()) == 2
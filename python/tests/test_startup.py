@@ -0,0 +1,88 @@
+"""
+Keeps the start-up time of aoc.py in check, as measured by
+`python -X importtime`.
+
+Every solver should only import what it needs itself, and none of them need
+the modules in HEAVY_MODULES. Those are either slow to import, or only used by
+the other scripts (runner.py, the result cache, ...).
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from runner import DAYS, find_solvers
+
+
+PYTHON_DIR = Path(__file__).resolve().parent.parent
+
+# In milliseconds, for all imports of `python aoc.py run 6`, including the ones
+# that the interpreter does while starting up
+IMPORT_TIME_BUDGET = 100
+
+HEAVY_MODULES = {
+    "concurrent.futures",
+    "generators",
+    "hashlib",
+    "json",
+    "multiprocessing",
+    "pathlib",
+    "puzzle_input",
+    "result_cache",
+    "runner",
+    "statistics",
+    "tracemalloc",
+    "typing",
+}
+
+
+def import_times(*arguments: str) -> dict[str, int]:
+    """Runs Python with `-X importtime` and the given arguments, and returns
+    the time spent on importing each module itself, in microseconds.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", *arguments],
+        cwd=PYTHON_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        self_time, _, module_name = line.removeprefix("import time:").split("|")
+        # Skips the header
+        if self_time.strip().isdigit():
+            times[module_name.strip()] = int(self_time)
+
+    return times
+
+
+@pytest.mark.parametrize(
+    "module_name", [solver.module_name for solver in find_solvers(DAYS)]
+)
+def test_solver_imports(module_name: str):
+    imported_modules = import_times("-c", f"__import__({module_name!r})").keys()
+
+    assert module_name in imported_modules
+    assert HEAVY_MODULES.isdisjoint(imported_modules)
+
+
+def test_import_time(time_budget_factor: float):
+    times = import_times("aoc.py", "run", "6")
+
+    assert "day6" in times
+    assert HEAVY_MODULES.isdisjoint(times)
+
+    import_time = sum(times.values()) / 1000
+    time_budget = IMPORT_TIME_BUDGET * time_budget_factor
+    if time_budget > 0:
+        assert import_time <= time_budget, "Took %.1f ms, the budget is %.1f ms" % (
+            import_time,
+            time_budget,
+        )